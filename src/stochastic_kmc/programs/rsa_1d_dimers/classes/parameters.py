@@ -31,7 +31,14 @@ class Parameters:
 
         - self.output: A dictionary with the output parameters.
 
+        - self.shard: A dictionary with the shard parameters, i.e., the part of
+          the repetitions run by the simulation.
+
         - self.simulation: A dictionary with the simulation parameters.
+
+        - self.stream: A dictionary with the stream parameters, i.e., how the
+          statistics of every repetition are written, in chunks of rows, to
+          the working directory.
     """
     # /////////////////////////////////////////////////////////////////////////
     # Methods
@@ -46,9 +53,28 @@ class Parameters:
             "history": self.history,
             "history_lattice": self.history_lattice,
             "output": self.output,
+            "shard": self.shard,
             "simulation": self.simulation,
+            "stream": self.stream,
         }
 
+    def get_repetitions(self) -> range:
+        """
+            Gets the repetitions run by the shard of the simulation; the
+            repetitions are split in contiguous shards of similar sizes.
+
+            :return: The range with the indexes of the repetitions of the
+             shard.
+        """
+        # Auxiliary variables.
+        count: int = self.shard["count"]
+        index: int = self.shard["index"]
+        repetitions: int = self.simulation["repetitions"]
+
+        return range(
+            index * repetitions // count, (index + 1) * repetitions // count
+        )
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Dunder
     # /////////////////////////////////////////////////////////////////////////
@@ -83,8 +109,10 @@ class Parameters:
         self.history: dict = final["history"]
         self.history_lattice: dict = final["history_lattice"]
         self.output: dict = final["output"]
+        self.shard: dict = final["shard"]
         self.simulation: dict = final["simulation"]
+        self.stream: dict = final["stream"]
 
-        # Current iteration and repetition.
+        # Current iteration and repetition; the first one of the shard.
         self.current_attempts: int = 0
-        self.current_repetition: int = 0
+        self.current_repetition: int = self.get_repetitions().start
@@ -8,8 +8,16 @@
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+# Standard library.
+import bisect
+
+from array import array
+from typing import Sequence
+
 # User.
 from stochastic_kmc.programs.rsa_1d_dimers.classes.lattice import Lattice
+from stochastic_kmc.utilities.columns import TYPECODE
+from stochastic_kmc.utilities.schedule import get_points, get_schedule
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -87,53 +95,59 @@ def _get_coverage(lattice: list) -> int:
     return sum(1 for x in lattice if x != Lattice.EMPTY)
 
 
-def _get_string_table(table: list) -> str:
+def _get_string_table(header: tuple, columns: list) -> str:
     """
-        Gets the string for the given table.
+        Gets the string for the table with the given columns; every column is
+        shown as a line, that starts with its header.
+
+        :param header: The tuple with the header of every column.
 
-        :param array: The table for which the string must be obtained.
+        :param columns: The list with the sequences of the entries of every
+         column; all the columns must have the same length.
 
-        :return: A list of the widths of each table column entry.
+        :return: The string that represents the table.
     """
     # Auxiliary variables.
     string: str = ""
-    tostr: callable = "{:>{width}}".format
 
     # Set the string.
-    if len(table) <= 1:
+    if len(columns[0]) == 0:
         # No data to show.
         string += "No data to show."
 
     else:
-        # Table dimensions
-        table_length: int = len(table)
-        table_width: int = len(table[0])
+        # The entries of every line, starting with the header.
+        lines: list = [
+            [f"{x}", *(f"{y}" for y in column)]
+            for x, column in zip(header, columns)
+        ]
 
         # List of widths.
-        widths: list = _get_widths(table)
+        widths: tuple = _get_widths(lines)
 
-        for i in range(table_width):
+        for line in lines:
             string += " | ".join(
-                tostr(table[j][i], width=w)
-                for j, w in zip(range(table_length), widths)
+                x.rjust(w) for x, w in zip(line, widths)
             ) + "\n"
 
     return f"{string}\n"
 
 
-def _get_widths(table: list) -> tuple:
+def _get_widths(lines: list) -> tuple:
     """
-        Gets the maximum width for each column of the given table.
+        Gets the maximum width of the entries at each position of the lines of
+        a table.
 
-        :param array: The table for which the column widths must be obtained.
+        :param lines: The list with the strings of the entries of every line
+         of the table.
 
-        :return: A list of the widths of each table column entry.
+        :return: A tuple of the widths of the entries at each position.
     """
     # Auxiliary variables.
-    if len(table) == 0:
+    if len(lines) == 0:
         return tuple()
 
-    return tuple(max(len(f"{x}") for x in entry) for entry in table)
+    return tuple(max(len(x) for x in entry) for entry in zip(*lines))
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -148,30 +162,209 @@ class Statistics:
         PARAMETERS:
         ___________
 
-        - self.attempts: The array with the statistics of the number of
-          attempts and successful attempts.
+        - self.attempts: The array with the number of successful attempts, at
+          the numbers of attempts of the rows kept in memory.
+
+        - self.chunk: The number of rows, of each table, kept in memory before
+          they are handed to the sink; zero, if the rows are kept until the
+          end of the run.
+
+        - self.chunks: The number of chunks of rows handed to the sink so far.
+
+        - self.coverage: The array with the total number of particles, at the
+          numbers of attempts of the rows kept in memory.
+
+        - self.current: The number of attempts made so far.
+
+        - self.debug: A boolean flag indicating whether the running counters
+          of the lattice must be validated against a full scan of the lattice
+          after every attempt. True, if the counters must be validated; False,
+          otherwise.
+
+        - self.flushed: The number of rows, of each table, handed to the sink
+          so far.
 
-        - self.coverage: The array with the total number of particles and the
-          inverse elapsed time, i.e., the number of attempts.
+        - self.empty_double: The array with the number of sites that have an
+          empty neighbor to the left.
 
-        - self.empty_double: The number of sites that have an empty neighbor
-          to the left.
+        - self.empty_single: The array with the number of sites that are
+          empty.
 
-        - self.empty_single: The number of sites that are empty.
+        - self.empty_triple: The array with the number of sites that have two
+          empty neighbors to the left.
 
-        - self.empty_triple: The number of sites that have two empty neighbors
-          to the left.
+        - self.index: The index, in the schedule, of the next number of
+          attempts where the statistics are recorded.
 
         - self.length: The length of the 1D lattice, a number  greater than
           zero.
 
         - self.periodic: A boolean flag indicating whether the lattice is
           periodic. True, if the lattice is periodic; False, otherwise.
+
+        - self.points: The numbers of attempts of every row of the tables,
+          i.e., zero, before the first attempt, followed by the schedule; the
+          rows kept in memory start after those handed to the sink.
+
+        - self.schedule: The numbers of attempts after which the statistics
+          are recorded, in increasing order.
+
+        - self.sink: The function that takes the statistics, every time the
+          tables are full, and stores the rows kept in memory; None, if the
+          rows are kept until the end of the run.
+
+        - self.successful: The number of successful attempts made so far.
+
+        - self.upcoming: The next number of attempts where the statistics are
+          recorded; zero, if there are no more.
     """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _flush_full(self) -> None:
+        """
+            Hands the rows kept in memory to the sink, if the tables are full.
+        """
+        if 0 < self.chunk <= len(self.coverage):
+            self.flush()
+
+    def _set_upcoming(self) -> None:
+        """
+            Sets the next number of attempts where the statistics are recorded,
+            from the index of the schedule.
+        """
+        # Auxiliary variables.
+        index: int = self.index
+
+        self.upcoming = (
+            self.schedule[index] if index < len(self.schedule) else 0
+        )
+
+    def _validate_counters(self, lattice: Lattice) -> None:
+        """
+            Validates that the running counters of the lattice are the same as
+            the quantities obtained by scanning the whole lattice.
+
+            :param lattice: The lattice object with the particles and the
+             counters.
+
+            :raise ValueError: If any of the counters is different from the
+             quantity obtained by scanning the lattice.
+        """
+        # Auxiliary variables.
+        message: str = ""
+        emp: callable = lambda x: _get_continuous_empty(
+            lattice.lattice, x, self.periodic
+        )
+
+        # Quantities from scanning the gaps, or the lattice.
+        if lattice.lattice is None:
+            expected: dict = lattice.get_gap_counters()
+
+            if lattice.gaps.total != expected["empty_double"]:
+                message += (
+                    f"The weight of the gaps does not match the gaps; "
+                    f"weight: {lattice.gaps.total}, gaps: "
+                    f"{expected['empty_double']}. "
+                )
+
+        else:
+            expected: dict = {
+                "occupied": _get_coverage(lattice.lattice),
+                "empty_single": emp(1),
+                "empty_double": emp(2),
+                "empty_triple": emp(3),
+            }
+
+        for key, value in expected.items():
+            if lattice.counters[key] != value:
+                message += (
+                    f"The \"{key}\" counter does not match the lattice; "
+                    f"counter: {lattice.counters[key]}, lattice: {value}. "
+                )
+
+        if message != "":
+            raise ValueError(message.strip())
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods
     # /////////////////////////////////////////////////////////////////////////
 
+    def fill_statistics(self, lattice: Lattice, attempts: int) -> None:
+        """
+            From the counters of the given lattice, updates the statistics with
+            the given number of unsuccessful attempts, i.e., the lattice does
+            not change during these attempts.
+
+            :param lattice: The lattice object with the particles and the
+             counters.
+
+            :param attempts: The number of unsuccessful attempts.
+        """
+        # No attempts to add.
+        if attempts <= 0:
+            return
+
+        # Validate the counters against the full lattice, if requested.
+        if self.debug:
+            self._validate_counters(lattice)
+
+        # Auxiliary variables.
+        counters: dict = lattice.counters
+        self.current += attempts
+
+        # The number of rows of the schedule in the given attempts.
+        stop: int = bisect.bisect_right(
+            self.schedule, self.current, lo=self.index
+        )
+        rows: int = stop - self.index
+
+        self.index = stop
+        self._set_upcoming()
+
+        # Update the quantities, they do not change; the tables are handed to
+        # the sink every time they are full.
+        while rows > 0:
+            number: int = rows
+
+            if self.chunk > 0 and self.sink is not None:
+                number = min(number, self.chunk - len(self.coverage))
+
+            for key, stats in (
+                ("occupied", self.coverage),
+                ("empty_single", self.empty_single),
+                ("empty_double", self.empty_double),
+                ("empty_triple", self.empty_triple)
+            ):
+                stats.extend(array(TYPECODE, [counters[key]]) * number)
+
+            self.attempts.extend(array(TYPECODE, [self.successful]) * number)
+
+            rows -= number
+            self._flush_full()
+
+    def flush(self) -> None:
+        """
+            Hands the rows kept in memory to the sink, and empties the tables;
+            nothing is done if there is no sink, or no rows.
+        """
+        # Nothing to hand over.
+        if self.sink is None or len(self.coverage) == 0:
+            return
+
+        self.sink(self)
+
+        # The rows are no longer kept.
+        self.chunks += 1
+        self.flushed += len(self.coverage)
+
+        for table in (
+            self.attempts, self.coverage, self.empty_single,
+            self.empty_double, self.empty_triple
+        ):
+            del table[:]
+
     def get_dictionary(self) -> dict:
         """
             Returns a dictionary with the COMPLETE parameters of the
@@ -179,52 +372,96 @@ class Statistics:
         """
         return {
             "attempts": self.attempts,
+            "chunk": self.chunk,
+            "chunks": self.chunks,
             "coverage": self.coverage,
+            "current": self.current,
+            "debug": self.debug,
             "empty_single": self.empty_single,
             "empty_double": self.empty_double,
             "empty_triple": self.empty_triple,
+            "flushed": self.flushed,
             "length": self.length,
-            "periodic": self.periodic
+            "periodic": self.periodic,
+            "points": self.points,
+            "schedule": self.schedule,
+            "successful": self.successful
         }
 
+    def get_points(self) -> Sequence:
+        """
+            Gets the numbers of attempts of the rows kept in memory.
+
+            :return: The numbers of attempts of the rows kept in memory.
+        """
+        # Auxiliary variables.
+        start: int = self.flushed
+
+        return self.points[start:start + len(self.coverage)]
+
     def reset(self) -> None:
         """
             Resets ALL the statistics to their original value.
         """
         # Reset the parameters.
-        self.attempts = [HEADER_ATTEMPTS, (0, 0)]
-        self.coverage = [HEADER_COVERAGE, (0, 0)]
-
-        self.empty_single = [HEADER_EMPTYSTS, (0, 0)]
-        self.empty_double = [HEADER_EMPTYSTS, (0, 0)]
-        self.empty_triple = [HEADER_EMPTYSTS, (0, 0)]
-
-    def update_statistics(self, lattice: list, successful: bool) -> None:
+        self.attempts = array(TYPECODE, [0])
+        self.coverage = array(TYPECODE, [0])
+
+        self.empty_single = array(TYPECODE, [0])
+        self.empty_double = array(TYPECODE, [0])
+        self.empty_triple = array(TYPECODE, [0])
+
+        # Nothing has been attempted yet.
+        self.chunks = 0
+        self.current = 0
+        self.flushed = 0
+        self.index = 0
+        self.successful = 0
+        self._set_upcoming()
+
+    def update_statistics(self, lattice: Lattice, successful: bool) -> None:
         """
-            From the given lattice, updates the statistics, i.e., increases the
-            number of attempts by one and the corresponding quantities.
+            From the counters of the given lattice, updates the statistics,
+            i.e., increases the number of attempts by one and the corresponding
+            quantities.
 
-            :param lattice: The lattice with the particles.
+            :param lattice: The lattice object with the particles and the
+             counters.
 
             :param successful: A boolean flag indicating whether the adsorption
              attempt was successful. True, if the attempt was successful in
              adsorbing a particle; False, otherwise.
         """
-        # Update the coverage.
-        attempts: int = self.coverage[-1][0] + 1
-        self.coverage.append((attempts, _get_coverage(lattice)))
+        # Validate the counters against the full lattice, if requested.
+        if self.debug:
+            self._validate_counters(lattice)
 
-        # Update the number of successful attempts.
-        nsuccessful: int = self.attempts[-1][1] + (1 if successful else 0)
-        self.attempts.append((attempts, nsuccessful))
+        # Update the number of attempts, and of successful attempts.
+        self.current += 1
+        self.successful += 1 if successful else 0
 
-        # Alias for function.
-        emp: callable = lambda x, y: _get_continuous_empty(x, y, self.periodic)
+        # Only record the statistics at the numbers of attempts of the
+        # schedule.
+        if self.current != self.upcoming:
+            return
+
+        self.index += 1
+        self._set_upcoming()
+
+        # Auxiliary variables.
+        counters: dict = lattice.counters
+
+        # Update the coverage, and the number of successful attempts.
+        self.coverage.append(counters["occupied"])
+        self.attempts.append(self.successful)
 
         # Update the other quantities.
-        self.empty_single.append((attempts, emp(lattice, 1)))
-        self.empty_double.append((attempts, emp(lattice, 2)))
-        self.empty_triple.append((attempts, emp(lattice, 3)))
+        self.empty_single.append(counters["empty_single"])
+        self.empty_double.append(counters["empty_double"])
+        self.empty_triple.append(counters["empty_triple"])
+
+        # Hand the rows to the sink, if the tables are full.
+        self._flush_full()
 
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Dunder
@@ -243,21 +480,34 @@ class Statistics:
             f"periodic: {self.periodic}"
         ]) + "\n\n"
 
+        # The numbers of attempts of the rows kept in memory.
+        points: Sequence = self.get_points()
+
         # Append the strings.
         string += "Attempts:\n\n"
-        string += _get_string_table(self.attempts)
+        string += _get_string_table(
+            HEADER_ATTEMPTS, [points, self.attempts]
+        )
 
         string += "Coverage:\n\n"
-        string += _get_string_table(self.coverage)
+        string += _get_string_table(
+            HEADER_COVERAGE, [points, self.coverage]
+        )
 
         string += "Empties - Single:\n\n"
-        string += _get_string_table(self.empty_single)
+        string += _get_string_table(
+            HEADER_EMPTYSTS, [points, self.empty_single]
+        )
 
         string += "Empties - Double:\n\n"
-        string += _get_string_table(self.empty_double)
+        string += _get_string_table(
+            HEADER_EMPTYSTS, [points, self.empty_double]
+        )
 
         string += "Empties - Triple:\n\n"
-        string += _get_string_table(self.empty_triple)
+        string += _get_string_table(
+            HEADER_EMPTYSTS, [points, self.empty_triple]
+        )
 
         return string.strip()
 
@@ -273,13 +523,35 @@ class Statistics:
              information to record the statistics.
         """
         # Initialize the parameters.
-        self.attempts: list = [HEADER_ATTEMPTS, (0, 0)]
-        self.coverage: list = [HEADER_COVERAGE, (0, 0)]
+        self.attempts: array = array(TYPECODE, [0])
+        self.coverage: array = array(TYPECODE, [0])
 
-        self.empty_single: list = [HEADER_EMPTYSTS, (0, 0)]
-        self.empty_double: list = [HEADER_EMPTYSTS, (0, 0)]
-        self.empty_triple: list = [HEADER_EMPTYSTS, (0, 0)]
+        self.empty_single: array = array(TYPECODE, [0])
+        self.empty_double: array = array(TYPECODE, [0])
+        self.empty_triple: array = array(TYPECODE, [0])
 
         # Useful parameters.
+        self.debug: bool = parameters["debug"]
         self.length: int = parameters["length"]
         self.periodic: bool = parameters["periodic"]
+
+        # The statistics are only recorded at the numbers of attempts of the
+        # schedule.
+        self.schedule: Sequence = get_schedule(
+            parameters["attempts"], parameters["sampling"]
+        )
+        self.points: Sequence = get_points(
+            parameters["attempts"], parameters["sampling"]
+        )
+        self.current: int = 0
+        self.index: int = 0
+        self.successful: int = 0
+        self.upcoming: int = 0
+
+        self._set_upcoming()
+
+        # The rows are kept until the end of the run, unless a sink is set.
+        self.chunk: int = 0
+        self.chunks: int = 0
+        self.flushed: int = 0
+        self.sink: callable = None
@@ -9,17 +9,37 @@
 
 
 # Standard library.
+import copy
+import json
 import pickle
 import random
-
+import threading
+import time
+import warnings
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait
+)
 from datetime import datetime
 from pathlib import Path
 
 # User.
+from stochastic_kmc.programs.rsa_1d_dimers.classes.ensemble import Ensemble
 from stochastic_kmc.programs.rsa_1d_dimers.classes.lattice import Lattice
 from stochastic_kmc.programs.rsa_1d_dimers.classes.parameters import Parameters
 from stochastic_kmc.programs.rsa_1d_dimers.classes.results import Results
 from stochastic_kmc.programs.rsa_1d_dimers.classes.statistics import Statistics
+from stochastic_kmc.utilities.columns import write_columns
+from stochastic_kmc.utilities.general import is_gil_enabled
+from stochastic_kmc.utilities.sampling import (
+    get_geometric,
+    get_seed,
+    UniformSampler
+)
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -30,6 +50,10 @@ from stochastic_kmc.programs.rsa_1d_dimers.classes.statistics import Statistics
 # Name of the program.
 PROGRAM: str = "RSA 1D Dimers"
 
+# The simulation of a worker of the parallel runs; set once, when the worker
+# process, or thread, starts. Every worker thread keeps its own simulation.
+_WORKER: threading.local = threading.local()
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions - Auxiliary
@@ -50,6 +74,38 @@ def _get_banner(text: str) -> str:
     return f"{base}\n# {text}\n{base}\n"
 
 
+def _run_worker(repetitions: list) -> tuple:
+    """
+        Runs the given repetitions with the simulation of the worker.
+
+        :param repetitions: The list with the indexes of the repetitions.
+
+        :return: The tuple with the results of the repetitions, the number of
+         attempts skipped after the lattice jammed, and the time taken, in
+         seconds.
+    """
+    return _WORKER.simulation._run_repetitions(repetitions)
+
+
+def _set_worker(simulation: "Simulation", private: bool = False) -> None:
+    """
+        Sets the simulation of the worker.
+
+        :param simulation: The simulation that runs the repetitions handed to
+         the worker.
+
+        :param private: True, if the worker must keep its own copy of the
+         simulation, i.e., its own lattice, statistics and random number
+         generator, as the threads of a thread pool, that share the simulation
+         given to every worker; False, otherwise.
+    """
+    # The worker threads cannot share the lattice.
+    if private:
+        simulation = copy.deepcopy(simulation)
+
+    _WORKER.simulation = simulation
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Classes
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -63,19 +119,84 @@ class Simulation:
         PARAMETERS:
         ___________
 
+        - self.ensemble: The lattices of all the repetitions, that are run at
+          the same time by the ensemble engine; None, for the other engines.
+
+        - self.finished: The list of the repetitions, after the current
+          repetition, that were already finished by the worker processes of
+          the parallel runs.
+
         - self.lattice: The lattice specific to the simulation; contains all
           the methods to run the simulation.
 
         - self.results: The object where the results of the simulation will be
           stored.
 
+        - self.sampler: The sampler that hands out, in blocks, the random
+          numbers of the standard engine; drawn from the generator.
+
+        - self.skipped: The total number of attempts that were not simulated,
+          one by one, because the lattice was already jammed.
+
         - self.statistics: The object where the statistics of a single
           simulation will be stored.
+
+        - self.waiting: The number of attempts left until the next successful
+          attempt, in the rejection free and gaps engines; zero if it must be
+          drawn.
     """
+    # /////////////////////////////////////////////////////////////////////////
+    # Class Variables
+    # /////////////////////////////////////////////////////////////////////////
+
+    # Target time, in seconds, of a chunk of repetitions handed to a worker
+    # process of the parallel runs.
+    CHUNK_SECONDS: float = 2.0
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
+    def _fill_jammed(self, attempts: int) -> None:
+        """
+            Fills the statistics of the jammed lattice, that does not change
+            anymore, up to the next save point or the end of the simulation.
+
+            :param attempts: The current number of attempts.
+        """
+        # Auxiliary variables.
+        step: int = self._get_save_distance(attempts)
+
+        # Skip the attempts.
+        self.statistics.fill_statistics(self.lattice, step)
+        self.parameters.current_attempts += step
+        self.skipped += step
+
+    def _get_chunk_size(self, pending: int, workers: int, cost: float) -> int:
+        """
+            Gets the number of repetitions of the next chunk handed to a worker
+            process, such that the chunk takes about "CHUNK_SECONDS", without
+            leaving the other worker processes idle.
+
+            :param pending: The number of repetitions that were not handed to
+             the worker processes yet.
+
+            :param workers: The number of workers.
+
+            :param cost: The mean time, in seconds, taken by a repetition; zero
+             if it was not measured yet.
+
+            :return: The number of repetitions of the next chunk.
+        """
+        # Measure the cost with single repetitions first.
+        if cost <= 0.0:
+            return 1
+
+        # Auxiliary variables.
+        size: int = int(Simulation.CHUNK_SECONDS / cost)
+
+        return max(1, min(size, pending // workers))
+
     def _get_info_string(self) -> str:
         """
             Gets the simulation class specific parameters as a string.
@@ -88,29 +209,312 @@ class Simulation:
         string += f"current repetition: {self.parameters.current_repetition}\n"
         string += f"current attempts: {self.parameters.current_attempts}\n"
         string += f"loaded: {self.loaded}\n"
+        string += f"skipped attempts: {self.skipped}\n"
 
         return string
 
+    def _get_save_distance(self, attempts: int) -> int:
+        """
+            Gets the number of attempts until the next time the simulation, or
+            the lattice, might need to be saved.
+
+            :param attempts: The current number of attempts.
+
+            :return: The number of attempts until the next save point, or until
+             the end of the simulation if there are no more save points.
+        """
+        # Auxiliary variables.
+        distance: int = self.parameters.simulation["attempts"] - attempts
+        frequencies: tuple = (
+            self.parameters.history["frequency"],
+            self.parameters.history_lattice["frequency"],
+        )
+
+        # Find the closest save point.
+        for frequency in frequencies:
+            if frequency > 0:
+                distance = min(distance, frequency - attempts % frequency)
+
+        return distance
+
+    def _get_statistics(self) -> Statistics:
+        """
+            Gets the statistics of a single simulation; the rows are handed to
+            the results, and written to the working directory, in chunks, if
+            requested.
+
+            :return: The statistics object of the simulation.
+        """
+        # Auxiliary variables.
+        chunk: int = self.parameters.stream["chunk"]
+        statistics: Statistics = Statistics(self.parameters.simulation)
+
+        # Stream the rows in chunks.
+        if chunk > 0:
+            statistics.chunk = chunk
+            statistics.sink = self._stream_statistics
+
+        return statistics
+
+    def _run_repetitions(self, repetitions: list) -> tuple:
+        """
+            Runs the given repetitions, one after the other; meant for a worker
+            of the parallel runs.
+
+            :param repetitions: The list with the indexes of the repetitions.
+
+            :return: The tuple with the results of the repetitions, the number
+             of attempts skipped after the lattice jammed, and the time taken,
+             in seconds.
+        """
+        # Auxiliary variables.
+        seed: int = self.parameters.simulation["seed"]
+        skipped: int = self.skipped
+        start: float = time.perf_counter()
+
+        # The statistics of the worker feed its own results.
+        self.results = Results(self.parameters.simulation)
+
+        for repetition in repetitions:
+            # Every repetition draws from its own stream.
+            self.parameters.current_attempts = 0
+            self.parameters.current_repetition = repetition
+            self._set_simulation()
+
+            # Run the simulation.
+            self._run_simulation()
+
+            # Add the statistics, with the rows left in memory.
+            self.statistics.flush()
+            self.results.statistics_add(self.statistics)
+            self.results.seeds_add(repetition, get_seed(seed, repetition))
+
+        # The time taken by the repetitions.
+        seconds: float = time.perf_counter() - start
+
+        return self.results, self.skipped - skipped, seconds
+
     def _run_simulation(self) -> None:
         """
-            Runs the simulations.
+            Runs the simulations with the requested engine.
+        """
+        # Choose the engine.
+        if self.parameters.simulation["engine"] in ("gaps", "rejection_free"):
+            self._run_simulation_rejection_free()
+            return
+
+        self._run_simulation_standard()
+
+    def _run_simulation_ensemble(self) -> None:
+        """
+            Runs all the repetitions at the same time, attempt by attempt, and
+            adds the statistics, summed over all the repetitions, to the
+            results.
         """
         # Auxiliary variables.
         attempts: int = self.parameters.simulation["attempts"]
-        length: int = self.parameters.simulation["length"] - 1
+        repetitions: int = self.parameters.simulation["repetitions"]
 
         # Start the simulation.
-        for attempt in range(self.parameters.current_attempts, attempts):
+        while self.parameters.current_attempts < attempts:
             # Periodically save the simulation.
+            attempt: int = self.parameters.current_attempts
+
+            self._save_simulation(False, attempt)
+
+            # The jammed lattices do not change anymore.
+            if self.ensemble.is_jammed():
+                step: int = self._get_save_distance(attempt)
+
+                self.ensemble.fill_statistics(attempt, step)
+                self.parameters.current_attempts += step
+                self.skipped += step * repetitions
+                continue
+
+            # Make the moves, and take the statistics.
+            self.ensemble.run_attempt(attempt)
+            self.parameters.current_attempts += 1
+
+        # All the repetitions are done.
+        self.results.statistics_add_sums(
+            self.ensemble.sums, repetitions, self.ensemble.squares
+        )
+
+        self.parameters.current_attempts = 0
+        self.parameters.current_repetition = repetitions
+
+        self._save_simulation(True, attempts)
+
+    def _run_simulation_parallel(self) -> None:
+        """
+            Runs the repetitions that are not finished yet in a pool of worker
+            processes, or threads, in chunks of repetitions, and adds the
+            results of every chunk as soon as it is finished. The results do
+            not depend on the order in which the chunks finish, since every
+            repetition draws from its own stream, and the statistics are sums
+            of integers.
+        """
+        # Auxiliary variables.
+        attempts: int = self.parameters.simulation["attempts"]
+        pool: str = self.parameters.simulation["pool"]
+        stop: int = self.parameters.get_repetitions().stop
+        workers: int = self.parameters.simulation["workers"]
+
+        executors: dict = {
+            "process": ProcessPoolExecutor, "thread": ThreadPoolExecutor
+        }
+
+        elapsed: float = 0.0
+        measured: int = 0
+        pending: list = [
+            x for x in range(self.parameters.current_repetition, stop)
+            if x not in self.finished
+        ]
+        running: dict = {}
+
+        # The workers do not save the simulation.
+        template: Simulation = copy.copy(self)
+        template.finished = []
+        template.parameters = copy.deepcopy(self.parameters)
+        template.parameters.history["frequency"] = 0
+        template.results = None
+        template.statistics = template._get_statistics()
+
+        # The threads only run at the same time without the GIL.
+        if pool == "thread" and is_gil_enabled():
+            warnings.warn(
+                "The global interpreter lock (GIL) is enabled, so the worker "
+                "threads cannot run the repetitions at the same time; use a "
+                "free-threaded build of Python, or the \"process\" pool.",
+                RuntimeWarning
+            )
+
+        with executors[pool](
+            workers, initializer=_set_worker,
+            initargs=(template, pool == "thread")
+        ) as executor:
+            while len(pending) > 0 or len(running) > 0:
+                # Keep a chunk waiting for every worker.
+                while len(pending) > 0 and len(running) < 2 * workers:
+                    cost: float = elapsed / measured if measured > 0 else 0.0
+                    size: int = self._get_chunk_size(
+                        len(pending), workers, cost
+                    )
+
+                    chunk: list = pending[:size]
+                    pending = pending[size:]
+
+                    future: Future = executor.submit(_run_worker, chunk)
+                    running[future] = chunk
+
+                # Add the results of the finished chunks.
+                done: set = wait(running, return_when=FIRST_COMPLETED).done
+
+                for future in done:
+                    results, skipped, seconds = future.result()
+                    chunk = running.pop(future)
+
+                    self.results.results_add(results)
+                    self.finished.extend(chunk)
+                    self.skipped += skipped
+
+                    elapsed += seconds
+                    measured += len(chunk)
+
+                # Move past the finished repetitions.
+                if self.parameters.current_repetition in self.finished:
+                    while self.parameters.current_repetition in self.finished:
+                        self.finished.remove(
+                            self.parameters.current_repetition
+                        )
+                        self.parameters.current_repetition += 1
+
+                    self._set_simulation()
+
+                # Save as in between two repetitions of the serial runs.
+                self._save_simulation(True, attempts)
+                self._save_simulation(False, 0)
+
+    def _run_simulation_rejection_free(self) -> None:
+        """
+            Runs the simulations without rejected attempts, i.e., the dimers
+            are only adsorbed at the available sites, and the number of
+            attempts in between successful attempts is drawn from the geometric
+            distribution. The available sites are kept in a set by the
+            rejection free engine, and found from the gaps between dimers by
+            the gaps engine. The statistics are the same as those of the
+            standard engine.
+        """
+        # Auxiliary variables.
+        attempts: int = self.parameters.simulation["attempts"]
+        length: int = self.parameters.simulation["length"]
+
+        # Start the simulation.
+        while self.parameters.current_attempts < attempts:
+            # Periodically save the simulation.
+            attempt: int = self.parameters.current_attempts
+
             self._save_simulation(False, attempt)
             self._save_lattice(False, attempt)
 
+            # The jammed lattice does not change anymore.
+            if self.lattice.is_jammed():
+                self._fill_jammed(attempt)
+                continue
+
+            # Draw the attempts until the next successful attempt.
+            available: int = self.lattice.counters["empty_double"]
+
+            if self.waiting == 0:
+                probability: float = available / length
+                self.waiting = get_geometric(self.generator, probability)
+
+            # Stop at the next save point, or at the end of the simulation.
+            step: int = self._get_save_distance(attempt)
+            successful: bool = 0 < self.waiting <= step
+
+            if successful:
+                step = self.waiting
+
+            # Unsuccessful attempts do not change the lattice.
+            failed: int = step - (1 if successful else 0)
+            self.statistics.fill_statistics(self.lattice, failed)
+            self.waiting = max(self.waiting - step, 0)
+
+            # Make the successful move.
+            if successful:
+                self.lattice.particle_adsorb_random(self.generator)
+                self.statistics.update_statistics(self.lattice, True)
+
+            # Update the counter.
+            self.parameters.current_attempts += step
+
+    def _run_simulation_standard(self) -> None:
+        """
+            Runs the simulations attempt by attempt.
+        """
+        # Auxiliary variables.
+        attempts: int = self.parameters.simulation["attempts"]
+
+        # Start the simulation.
+        while self.parameters.current_attempts < attempts:
+            # Periodically save the simulation.
+            attempt: int = self.parameters.current_attempts
+
+            self._save_simulation(False, attempt)
+            self._save_lattice(False, attempt)
+
+            # The jammed lattice does not change anymore.
+            if self.lattice.is_jammed():
+                self._fill_jammed(attempt)
+                continue
+
             # Make the move.
-            site: int = self.generator.randint(0, length)
+            site: int = self.sampler.draw()
             successful: bool = self.lattice.particle_adsorb(site)
 
             # Take the statistics and update the counter.
-            self.statistics.update_statistics(self.lattice.lattice, successful)
+            self.statistics.update_statistics(self.lattice, successful)
             self.parameters.current_attempts += 1
 
     def _save_lattice(self, end: bool, attempts: int) -> None:
@@ -144,6 +548,45 @@ class Simulation:
                 stream.write(f"Current attempts: {attempts}\n")
                 stream.write(f"{self.lattice.get_lattice_string()}\n\n")
 
+    def _save_shard(self) -> None:
+        """
+            Saves the partial results of the shard, i.e., the raw sums before
+            they are processed, to a JSON file that can be merged with those of
+            the other shards.
+        """
+        # Get the working directory.
+        directory: Path = Path(self.parameters.output["working"])
+        file: str = self.parameters.shard["file"]
+        file_json: str = f"{directory / file}"
+
+        # Check the directory exists.
+        if not directory.is_dir():
+            raise ValueError(
+                f"Select a valid directory, current directory is not "
+                f"valid: {directory}"
+            )
+
+        # The repetitions of the shard.
+        repetitions: range = self.parameters.get_repetitions()
+
+        dictionary: dict = {
+            "_metadata": {
+                "name": PROGRAM,
+                "save_date": datetime.now().strftime("%Y%m%d%H%M%S")
+            },
+            "parameters": self.parameters.simulation,
+            "shard": {
+                **self.parameters.shard,
+                "start": repetitions.start,
+                "stop": repetitions.stop,
+            },
+            "results": self.results.get_partial(),
+        }
+
+        # Write the partial results.
+        with open(file_json, encoding="utf-8", mode="w") as stream:
+            json.dump(dictionary, stream)
+
     def _save_simulation(self, end: bool, attempts: int = 0) -> None:
         """
             Saves the simulation to a binary file.
@@ -186,9 +629,18 @@ class Simulation:
         """
             Sets a simulation before starting to run a single simulation.
         """
+        # Auxiliary variables.
+        seed: int = self.parameters.simulation["seed"]
+        repetition: int = self.parameters.current_repetition
+
         # Set the simulation.
         self.lattice.reset()
         self.statistics.reset()
+        self.waiting = 0
+
+        # Every repetition draws from its own stream.
+        self.generator.seed(get_seed(seed, repetition))
+        self.sampler.clear()
 
     def _set_working_directory(self) -> None:
         """
@@ -203,6 +655,33 @@ class Simulation:
         path.mkdir(exist_ok=True, parents=False)
         self.parameters.output["working"] = f"{path}"
 
+    def _stream_statistics(self, statistics: Statistics) -> None:
+        """
+            Adds the rows kept by the statistics of the current repetition to
+            the results, and writes them, as binary columns, to the file of the
+            repetition in the stream directory; the sink of the statistics,
+            called every time the tables are full.
+
+            :param statistics: The statistics of the current repetition.
+        """
+        # Auxiliary variables.
+        directory: Path = Path(self.parameters.output["working"])
+        directory /= self.parameters.stream["directory"]
+        repetition: int = self.parameters.current_repetition
+        file: Path = directory / f"repetition_{repetition}.bin"
+
+        # The time stamps, and the quantities of every table.
+        columns: list = [statistics.get_points()]
+        columns.extend(getattr(statistics, x) for x in Results.HEADERS)
+        position: int = statistics.chunks + statistics.flushed * len(columns)
+
+        # Write the chunk after those already written.
+        directory.mkdir(exist_ok=True)
+        write_columns(f"{file}", columns, position)
+
+        # Feed the sums of the results.
+        self.results.statistics_add_rows(statistics)
+
     def _validate_save_lattice(self, end: bool, attempts: int) -> bool:
         """
             Validates the lattice is to be saved.
@@ -289,12 +768,35 @@ class Simulation:
         """
         # Auxiliary variables.
         attempts: int = self.parameters.simulation["attempts"]
-        repetitions: int = self.parameters.simulation["repetitions"]
+        seed: int = self.parameters.simulation["seed"]
+        stop: int = self.parameters.get_repetitions().stop
+
+        # The ensemble engine runs all the repetitions at the same time.
+        if self.ensemble is not None:
+            if self.parameters.current_repetition < stop:
+                self._run_simulation_ensemble()
+
+        # The repetitions are run by a pool of workers.
+        if self.parameters.simulation["workers"] > 1:
+            if self.parameters.current_repetition < stop:
+                self._run_simulation_parallel()
+
+        for repetition in range(self.parameters.current_repetition, stop):
+            # Repetitions finished by the workers are not run again.
+            if repetition in self.finished:
+                self.finished.remove(repetition)
+                self.parameters.current_repetition += 1
+
+                self._set_simulation()
+                continue
 
-        for _ in range(self.parameters.current_repetition, repetitions):
             # Run the simulation.
             self._run_simulation()
+
+            # Add the statistics, with the rows left in memory.
+            self.statistics.flush()
             self.results.statistics_add(self.statistics)
+            self.results.seeds_add(repetition, get_seed(seed, repetition))
 
             # Save the lattice.
             self._save_lattice(True, attempts)
@@ -307,6 +809,10 @@ class Simulation:
             self._set_simulation()
             self._save_simulation(True, attempts)
 
+        # Save the raw sums of the shard, before they are processed.
+        if self.parameters.shard["count"] > 1:
+            self._save_shard()
+
         # Process the statistics.
         self.results.statistics_process()
 
@@ -320,6 +826,9 @@ class Simulation:
             f"Simulation results have been saved in the directory: "
             f"{directory}"
         )
+        print(
+            f"Attempts skipped after the lattice jammed: {self.skipped}"
+        )
 
     def save_results(self) -> None:
         """
@@ -328,6 +837,8 @@ class Simulation:
         # Auxiliary variables.
         path: Path = Path(self.parameters.output["working"])
         file: Path = path / self.parameters.output["file"]
+        binary: Path = path / self.parameters.output["binary"]
+        form: str = self.parameters.output["format"]
 
         # Check the directory exists.
         if not path.is_dir():
@@ -337,9 +848,14 @@ class Simulation:
             )
 
         # Name of the file.
-        with open(f"{file}", encoding="utf-8", mode="w") as stream:
-            stream.write(f"{PROGRAM}\n\n")
-            stream.write(f"{self.results}")
+        if form in ("both", "text"):
+            with open(f"{file}", encoding="utf-8", mode="w") as stream:
+                stream.write(f"{PROGRAM}\n\n")
+                self.results.write(stream)
+
+        # The binary container.
+        if form in ("both", "binary"):
+            self.results.write_binary(f"{binary}", PROGRAM)
 
     # /////////////////////////////////////////////////////////////////////////
     # Constructor
@@ -359,15 +875,30 @@ class Simulation:
         # Extract the parameters.
         self.loaded: bool = False
         self.parameters: Parameters = Parameters(parameters)
+        repetition: int = self.parameters.current_repetition
         seed: int = self.parameters.simulation["seed"]
 
-        # Parameters.
-        self.generator: random.Random = random.Random(seed)
+        # Parameters; every repetition draws from its own stream.
+        self.generator: random.Random = random.Random(
+            get_seed(seed, repetition)
+        )
+        self.finished: list = []
+        self.skipped: int = 0
+        self.waiting: int = 0
+
+        # The sites of the standard engine are drawn in blocks.
+        self.sampler: UniformSampler = UniformSampler(
+            self.generator, self.parameters.simulation["length"]
+        )
 
         # Other parameters.
+        self.ensemble: Ensemble = None
         self.lattice: Lattice = Lattice(self.parameters.simulation)
         self.results: Results = Results(self.parameters.simulation)
-        self.statistics: Statistics = Statistics(self.parameters.simulation)
+        self.statistics: Statistics = self._get_statistics()
+
+        if self.parameters.simulation["engine"] == "ensemble":
+            self.ensemble = Ensemble(self.parameters.simulation)
 
         # Finish setting other quantities.
         self._set_working_directory()
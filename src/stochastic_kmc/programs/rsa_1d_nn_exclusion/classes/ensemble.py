@@ -0,0 +1,477 @@
+"""
+    File that contains the class where to store the lattices of all the
+    repetitions, that are run at the same time.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Future.
+from __future__ import annotations
+
+# Standard library.
+import bisect
+import operator
+
+from typing import Sequence
+
+# Third party; optional, only needed by the ensemble engine.
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+# User.
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.classes.lattice import Lattice
+from stochastic_kmc.utilities.schedule import get_schedule
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class Ensemble:
+    """
+        Contains the variables to store the lattices of all the repetitions,
+        that are advanced in lock-step, i.e., every attempt is made on all the
+        lattices at the same time; only meant for the ensemble engine. The
+        lattices are the rows of a NumPy array, and the statistics are summed
+        over the lattices after every attempt.
+
+        PARAMETERS:
+        ___________
+
+        - self.counters: A dictionary with the array of the running counters
+          of each lattice; updated locally every time a particle is adsorbed.
+
+        - self.debug: A boolean flag indicating whether the running counters
+          must be validated against a full scan of the lattices after every
+          attempt. True, if the counters must be validated; False, otherwise.
+
+        - self.generator: The NumPy random number generator.
+
+        - self.lattices: The array of bytes with one lattice per row, i.e.,
+          "repetitions" rows of "length" sites.
+
+        - self.length: The length of the 1D lattice, a number  greater than
+          zero.
+
+        - self.periodic: A boolean flag indicating whether the lattice is
+          periodic. True, if the lattice is periodic; False, otherwise.
+
+        - self.rows: The array with the index of every lattice.
+
+        - self.schedule: The numbers of attempts after which the sums are
+          recorded, in increasing order.
+
+        - self.squares: A dictionary with the arrays of the squares of the
+          quantities of every lattice, summed over all the lattices, at the
+          same numbers of attempts as the sums, as Python integers that never
+          overflow; the names are those of the statistics tables.
+
+        - self.successes: The array with the number of successful attempts of
+          each lattice.
+
+        - self.successful: The total number of successful attempts over all
+          the lattices.
+
+        - self.sums: A dictionary with the arrays of the quantities, summed
+          over all the lattices, before the first attempt, and after each
+          number of attempts of the schedule; the names are those of the
+          statistics tables.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Class Variables
+    # /////////////////////////////////////////////////////////////////////////
+
+    # Names of the statistics tables, and of the counter summed in each.
+    TABLES: dict = {
+        "attempts": None,
+        "coverage": "occupied",
+        "empty_single": "empty_single",
+        "empty_double": "empty_double",
+        "empty_triple": "empty_triple",
+    }
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_empty(
+        self, rows: np.ndarray, sites: np.ndarray, offset: int, inside: bool
+    ) -> np.ndarray:
+        """
+            Determines if the sites, shifted by the given offset, are empty in
+            the given lattices.
+
+            :param rows: The array with the lattices of each site.
+
+            :param sites: The array with the sites.
+
+            :param offset: The number of sites to shift the sites by.
+
+            :param inside: The value for the shifted sites outside of the
+             lattice; only used in open lattices.
+
+            :return: The array of boolean flags, True, where the shifted site
+             is empty; False, otherwise.
+        """
+        # Auxiliary variables.
+        shifted: np.ndarray = sites + offset
+
+        if self.periodic:
+            return self.lattices[rows, shifted % self.length] == Lattice.EMPTY
+
+        # Sites outside of the lattice take the given value.
+        valid: np.ndarray = (0 <= shifted) & (shifted < self.length)
+        empty: np.ndarray = self.lattices[
+            rows, np.clip(shifted, 0, self.length - 1)
+        ] == Lattice.EMPTY
+
+        return np.where(valid, empty, inside)
+
+    def _get_empty_windows(
+        self, rows: np.ndarray, sites: np.ndarray, number: int
+    ) -> np.ndarray:
+        """
+            Gets the number of groups of N (represented by the "number"
+            variable) consecutive empty sites that contain the given site, in
+            each of the given lattices.
+
+            :param rows: The array with the lattices of each site.
+
+            :param sites: The array with the sites.
+
+            :param number: The number of consecutive empty sites to check.
+
+            :return: The array with the number of groups of consecutive empty
+             sites that contain the site.
+        """
+        # Auxiliary variables.
+        count: np.ndarray = np.zeros(len(sites), dtype=np.int64)
+
+        # Scan the groups that contain the site.
+        for start in range(1 - number, 1):
+            window: np.ndarray = np.ones(len(sites), dtype=bool)
+
+            for i in range(start, start + number):
+                window &= self._get_empty(rows, sites, i, False)
+
+            count += window
+
+        return count
+
+    def _get_scan_counters(self) -> dict:
+        """
+            Gets the counters of every lattice from a full scan of the
+            lattices.
+
+            :return: The dictionary with the array of the counters of each
+             lattice.
+        """
+        # Auxiliary variables.
+        empty: np.ndarray = self.lattices == Lattice.EMPTY
+        counters: dict = {"occupied": (~empty).sum(axis=1)}
+
+        # Groups of consecutive empty sites.
+        for number, key in enumerate(Lattice.COUNTERS[1:4], start=1):
+            window: np.ndarray = empty.copy()
+
+            for i in range(1, number):
+                window &= np.roll(empty, -i, axis=1)
+
+            if not self.periodic:
+                window = window[:, :self.length - number + 1]
+
+            counters[key] = window.sum(axis=1)
+
+        # The neighbors outside of open lattices are empty.
+        left: np.ndarray = np.roll(empty, 1, axis=1)
+        right: np.ndarray = np.roll(empty, -1, axis=1)
+
+        if not self.periodic:
+            left[:, 0] = True
+            right[:, -1] = True
+
+        counters["available"] = (empty & left & right).sum(axis=1)
+
+        return counters
+
+    def _is_available(
+        self, rows: np.ndarray, sites: np.ndarray, offset: int
+    ) -> np.ndarray:
+        """
+            Determines if a particle can be adsorbed at the sites, shifted by
+            the given offset, i.e., the shifted site and its neighbors inside
+            the lattice are empty.
+
+            :param rows: The array with the lattices of each site.
+
+            :param sites: The array with the sites.
+
+            :param offset: The number of sites to shift the sites by.
+
+            :return: The array of boolean flags, True, where a particle can be
+             adsorbed at the shifted site; False, otherwise.
+        """
+        return (
+            self._get_empty(rows, sites, offset - 1, True)
+            & self._get_empty(rows, sites, offset, False)
+            & self._get_empty(rows, sites, offset + 1, True)
+        )
+
+    def _set_sums(self, start: int, stop: int) -> None:
+        """
+            Sets the sums of the quantities, and of their squares, over all the
+            lattices, from the current counters, in the given entries.
+
+            :param start: The first entry of the sums to set.
+
+            :param stop: The entry after the last entry of the sums to set.
+        """
+        for table, key in Ensemble.TABLES.items():
+            # Auxiliary variables.
+            values: np.ndarray = (
+                self.successes if key is None else self.counters[key]
+            )
+            largest: int = int(values.max(initial=0))
+
+            self.sums[table][start:stop] = values.sum()
+
+            # The int64 dot product is exact while the sum of the squares
+            # stays below 2 ** 63; beyond that, the squares are summed as
+            # Python integers, that never overflow.
+            if largest * largest * len(values) < 2 ** 63:
+                self.squares[table][start:stop] = int(values @ values)
+                continue
+
+            entries: list = values.tolist()
+            self.squares[table][start:stop] = sum(
+                map(operator.mul, entries, entries)
+            )
+
+    def _validate_counters(self) -> None:
+        """
+            Validates that the running counters of all the lattices are the
+            same as the quantities obtained by scanning the lattices.
+
+            :raise ValueError: If any of the counters is different from the
+             quantity obtained by scanning the lattices.
+        """
+        # Auxiliary variables.
+        message: str = ""
+
+        for key, value in self._get_scan_counters().items():
+            wrong: np.ndarray = np.flatnonzero(self.counters[key] != value)
+
+            if len(wrong) > 0:
+                message += (
+                    f"The \"{key}\" counter does not match the lattice "
+                    f"{wrong[0]}; counter: {self.counters[key][wrong[0]]}, "
+                    f"lattice: {value[wrong[0]]}. "
+                )
+
+        if message != "":
+            raise ValueError(message.strip())
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def fill_statistics(self, attempts: int, number: int) -> None:
+        """
+            Updates the sums with the given number of attempts, after the given
+            number of attempts, where none of the lattices change, i.e., all
+            the lattices are jammed.
+
+            :param attempts: The current number of attempts.
+
+            :param number: The number of attempts where nothing changes.
+        """
+        # Auxiliary variables.
+        start: int = bisect.bisect_right(self.schedule, attempts) + 1
+        stop: int = bisect.bisect_right(self.schedule, attempts + number) + 1
+
+        # The quantities do not change.
+        self._set_sums(start, stop)
+
+    def get_dictionary(self) -> dict:
+        """
+            Returns a dictionary with the COMPLETE parameters of the
+            simulation.
+        """
+        return {
+            "counters": self.counters,
+            "debug": self.debug,
+            "lattices": self.lattices,
+            "length": self.length,
+            "periodic": self.periodic,
+            "schedule": self.schedule,
+            "squares": self.squares,
+            "successes": self.successes,
+            "successful": self.successful,
+            "sums": self.sums,
+        }
+
+    def is_jammed(self) -> bool:
+        """
+            Determines if all the lattices are jammed, i.e., no more particles
+            can be adsorbed, from the running counters.
+
+            :return: True, if no more particles can be adsorbed in any of the
+             lattices; False, otherwise.
+        """
+        return not self.counters["available"].any()
+
+    def particle_adsorb(self, sites: np.ndarray) -> np.ndarray:
+        """
+            Attempts to adsorb a particle at the given site of each lattice.
+
+            :param sites: The array with the site where the adsorption is
+             inteded to take place, in each lattice.
+
+            :return: The array of boolean flags that indicate whether the
+             particle was adsorbed in each lattice, i.e., the site and its
+             nearest neighbors inside the lattice are empty.
+        """
+        # Only the lattices where the particle can be adsorbed change.
+        flags: np.ndarray = self._is_available(self.rows, sites, 0)
+
+        rows: np.ndarray = self.rows[flags]
+        sites = sites[flags]
+
+        # Update the counters BEFORE the particles are adsorbed.
+        for number, key in enumerate(Lattice.COUNTERS[1:4], start=1):
+            self.counters[key][rows] -= self._get_empty_windows(
+                rows, sites, number
+            )
+
+        for offset in (-1, 0, 1):
+            self.counters["available"][rows] -= self._is_available(
+                rows, sites, offset
+            )
+
+        self.counters["occupied"][rows] += 1
+
+        # Adsorb the particles.
+        self.lattices[rows, sites] = Lattice.OCCUPIED
+
+        return flags
+
+    def reset(self) -> None:
+        """
+            Resets all the lattices to empty lattices, and the sums.
+        """
+        # Auxiliary variables.
+        repetitions: int = len(self.rows)
+        shift: int = 0 if self.periodic else 1
+
+        # Reset to empty lattices.
+        self.lattices.fill(Lattice.EMPTY)
+
+        values: dict = {
+            "occupied": 0,
+            "empty_single": self.length,
+            "empty_double": self.length - shift,
+            "empty_triple": self.length - 2 * shift,
+            "available": self.length,
+        }
+        self.counters = {
+            x: np.full(repetitions, y, dtype=np.int64)
+            for x, y in values.items()
+        }
+
+        # Nothing has been adsorbed yet.
+        self.successes = np.zeros(len(self.rows), dtype=np.int64)
+        self.successful = 0
+
+        self.squares = {
+            x: np.zeros(len(self.schedule) + 1, dtype=object)
+            for x in Ensemble.TABLES
+        }
+        self.sums = {
+            x: np.zeros(len(self.schedule) + 1, dtype=np.int64)
+            for x in Ensemble.TABLES
+        }
+
+    def run_attempt(self, attempts: int) -> None:
+        """
+            Makes one adsorption attempt, at a site chosen uniformly at random,
+            in every lattice, and updates the sums.
+
+            :param attempts: The current number of attempts.
+        """
+        # Make the moves.
+        sites: np.ndarray = self.generator.integers(
+            0, self.length, size=len(self.rows)
+        )
+        flags: np.ndarray = self.particle_adsorb(sites)
+
+        self.successes += flags
+        self.successful += int(flags.sum())
+
+        # Validate the counters against the full lattices, if requested.
+        if self.debug:
+            self._validate_counters()
+
+        # Only sum the quantities at the numbers of attempts of the schedule.
+        index: int = bisect.bisect_left(self.schedule, attempts + 1)
+
+        if index == len(self.schedule) or self.schedule[index] != attempts + 1:
+            return
+
+        # Sum the quantities, and their squares, over the lattices.
+        self._set_sums(index + 1, index + 2)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, parameters: dict) -> None:
+        """
+            Constructor for the object.
+
+            :param parameters: The simulation parameters that contains all the
+             information to create the lattices, and perform the lattice
+             operations.
+
+            :raise ValueError: If NumPy is not installed.
+        """
+        # NumPy is required.
+        if np is None:
+            raise ValueError(
+                "The ensemble engine requires NumPy; install NumPy, or choose "
+                "another engine."
+            )
+
+        # Initialize the parameters.
+        self.debug: bool = parameters["debug"]
+        self.length: int = parameters["length"]
+        self.periodic: bool = parameters["periodic"]
+
+        # The generator, and the lattices of all the repetitions.
+        self.generator: np.random.Generator = np.random.default_rng(
+            parameters["seed"]
+        )
+        self.lattices: np.ndarray = np.zeros(
+            (parameters["repetitions"], self.length), dtype=np.uint8
+        )
+        self.rows: np.ndarray = np.arange(parameters["repetitions"])
+
+        # Set the counters and the sums; the sums are only recorded at the
+        # numbers of attempts of the schedule.
+        self.counters: dict = {}
+        self.schedule: Sequence = get_schedule(
+            parameters["attempts"], parameters["sampling"]
+        )
+        self.squares: dict = {}
+        self.successes: np.ndarray = None
+        self.successful: int = 0
+        self.sums: dict = {}
+
+        self.reset()
@@ -3,6 +3,18 @@
 """
 
 
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import random
+
+# User.
+from stochastic_kmc.utilities.sampling import IndexedSet, WeightedMultiset
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Classes
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -15,7 +27,27 @@ class Lattice:
         PARAMETERS:
         ___________
 
-        - self.lattice: The array that contains the particles.
+        - self.available: The set of sites where a particle can still be
+          adsorbed, i.e., the site and its nearest neighbors are empty; only
+          kept for the rejection free engine, None otherwise.
+
+        - self.counters: A dictionary with the running number of occupied
+          sites, of the single, double and triple consecutive empty sites, and
+          of the sites where a particle can still be adsorbed; updated locally
+          every time a particle is adsorbed.
+
+        - self.gaps: The multiset with the gaps, i.e., the runs of consecutive
+          empty sites, where a particle can still be adsorbed, as (kind,
+          length) tuples, weighted by the number of sites where a particle can
+          be adsorbed; only kept for the gaps engine, None otherwise.
+
+        - self.histogram: The dictionary with the number of gaps of each
+          (kind, length); only kept for the gaps engine, empty otherwise.
+
+        - self.lattice: The array of bytes that contains the particles, one
+          byte per site; it supports the buffer protocol, i.e., it can be
+          viewed without copying, e.g., with "numpy.frombuffer". None for the
+          gaps engine, that only keeps the gaps.
 
         - self.length: The length of the lattice.
 
@@ -30,6 +62,274 @@ class Lattice:
     EMPTY: int = 0
     OCCUPIED: int = 1
 
+    # Kinds of gaps, by what is found at their ends: occupied sites at both
+    # ends, a wall at one end, walls at both ends, or the empty periodic
+    # lattice.
+    GAPS: tuple = "interior", "edge", "open", "ring"
+
+    # Names of the counters.
+    COUNTERS: tuple = (
+        "occupied", "empty_single", "empty_double", "empty_triple", "available"
+    )
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _add_gap(self, kind: int, length: int) -> None:
+        """
+            Adds a gap to the lattice, and its contribution to the counters.
+
+            :param kind: The kind of gap, i.e., the index of the kind in the
+             "GAPS" tuple.
+
+            :param length: The number of empty sites in the gap.
+        """
+        # Empty gaps do not exist.
+        if length == 0:
+            return
+
+        # Auxiliary variables.
+        available: int = self._get_gap_available(kind, length)
+        key: tuple = (kind, length)
+
+        # Update the histogram and the counters.
+        self.histogram[key] = self.histogram.get(key, 0) + 1
+
+        for name, value in self._get_gap_counters(kind, length).items():
+            self.counters[name] += value
+
+        # Only keep the gaps where a particle can be adsorbed.
+        if available > 0:
+            self.gaps.add(key, available)
+
+    def _get_empty_windows(self, first: int, last: int, number: int) -> int:
+        """
+            Gets the number of groups of N (represented by the "number"
+            variable) consecutive empty sites that contain at least one of the
+            sites between the "first" and "last" sites, both included. It will
+            consider if the lattice is periodic.
+
+            :param first: The first site of the region, it can be outside of
+             the lattice if the lattice is periodic.
+
+            :param last: The last site of the region, it can be outside of the
+             lattice if the lattice is periodic.
+
+            :param number: The number of consecutive empty sites to check.
+
+            :return: The number of groups of consecutive empty sites that
+             overlap with the region.
+        """
+        # Auxiliary variables.
+        count: int = 0
+        empty: int = Lattice.EMPTY
+
+        # Scan the groups that overlap the region.
+        for start in range(first - number + 1, last + 1):
+            # Sites to be examined.
+            sites: list = [start + i for i in range(number)]
+
+            if self.periodic:
+                sites = [x % self.length for x in sites]
+
+            elif sites[0] < 0 or sites[-1] >= self.length:
+                continue
+
+            # Check ALL consecutive sites are empty.
+            if all(self.lattice[x] == empty for x in sites):
+                count += 1
+
+        return count
+
+    def _get_gap_available(self, kind: int, length: int) -> int:
+        """
+            Gets the number of sites of the gap where a particle can be
+            adsorbed, i.e., the sites whose nearest neighbors are also empty.
+
+            :param kind: The kind of gap, i.e., the index of the kind in the
+             "GAPS" tuple.
+
+            :param length: The number of empty sites in the gap.
+
+            :return: The number of sites where a particle can be adsorbed.
+        """
+        # The sites next to an occupied site are not available.
+        if Lattice.GAPS[kind] == "interior":
+            return max(length - 2, 0)
+
+        if Lattice.GAPS[kind] == "edge":
+            return max(length - 1, 0)
+
+        return length
+
+    def _get_gap_counters(self, kind: int, length: int) -> dict:
+        """
+            Gets the contribution of the gap to the counters of the empty
+            sites.
+
+            :param kind: The kind of gap, i.e., the index of the kind in the
+             "GAPS" tuple.
+
+            :param length: The number of empty sites in the gap.
+
+            :return: The dictionary with the contribution of the gap to each
+             counter, except the occupied sites.
+        """
+        # Auxiliary variables.
+        ring: bool = Lattice.GAPS[kind] == "ring"
+
+        return {
+            "empty_single": length,
+            "empty_double": length if ring else max(length - 1, 0),
+            "empty_triple": length if ring else max(length - 2, 0),
+            "available": self._get_gap_available(kind, length),
+        }
+
+    def _get_gaps_string(self) -> str:
+        """
+            The string representation of the gaps of the lattice, i.e., the
+            number of gaps of each kind and length.
+
+            :return: The string representation of the gaps.
+        """
+        # Auxiliary variables.
+        string: str = "Gaps (kind, length: number):\n"
+
+        for (kind, length), number in sorted(self.histogram.items()):
+            string += f"{Lattice.GAPS[kind]}, {length}: {number}\n"
+
+        return string + "\n"
+
+    def _is_available(self, site: int) -> bool:
+        """
+            Determines if a particle can be adsorbed at the given site, i.e.,
+            the site and its neighbors inside the lattice are empty.
+
+            :param site: The site to be checked, it can be outside of the
+             lattice if the lattice is periodic.
+
+            :return: A boolean flag indicating whether a particle can be
+             adsorbed at the given site. True, if the particle can be adsorbed;
+             False, otherwise.
+        """
+        # Auxiliary variables.
+        sites: list = [site - 1, site, site + 1]
+
+        if self.periodic:
+            sites = [x % self.length for x in sites]
+
+        elif not 0 <= site < self.length:
+            return False
+
+        return all(
+            self.lattice[x] == Lattice.EMPTY
+            for x in sites if 0 <= x < self.length
+        )
+
+    def _reset_available(self) -> None:
+        """
+            Resets the set of available sites to that of an empty lattice.
+        """
+        # Only kept for the rejection free engine.
+        if self.available is None:
+            return
+
+        # All the sites are available.
+        self.available.clear()
+
+        for site in range(self.length):
+            self.available.add(site)
+
+    def _remove_gap(self, kind: int, length: int) -> None:
+        """
+            Removes a gap from the histogram, and its contribution to the
+            counters; the gap must have been already drawn from the multiset.
+
+            :param kind: The kind of gap, i.e., the index of the kind in the
+             "GAPS" tuple.
+
+            :param length: The number of empty sites in the gap.
+        """
+        # Update the histogram and the counters.
+        key: tuple = (kind, length)
+        self.histogram[key] -= 1
+
+        if self.histogram[key] == 0:
+            del self.histogram[key]
+
+        for name, value in self._get_gap_counters(kind, length).items():
+            self.counters[name] -= value
+
+    def _reset_counters(self) -> None:
+        """
+            Resets the counters to those of an empty lattice.
+        """
+        # Open lattices have fewer groups of consecutive empty sites.
+        shift: int = 0 if self.periodic else 1
+
+        self.counters = {
+            "occupied": 0,
+            "empty_single": self.length,
+            "empty_double": self.length - shift,
+            "empty_triple": self.length - 2 * shift,
+            "available": self.length,
+        }
+
+    def _reset_gaps(self) -> None:
+        """
+            Resets the gaps to those of an empty lattice, i.e., a single gap
+            with all the sites.
+        """
+        # Only kept for the gaps engine.
+        if self.gaps is None:
+            return
+
+        # Auxiliary variables.
+        kind: int = Lattice.GAPS.index("ring" if self.periodic else "open")
+
+        # The counters are already those of the empty lattice.
+        self.gaps.clear()
+        self.gaps.add((kind, self.length), self.length)
+        self.histogram = {(kind, self.length): 1}
+
+    def _update_available(self, site: int) -> None:
+        """
+            Removes the site, where the particle is to be adsorbed, and its
+            nearest neighbors from the set of available sites.
+
+            :param site: The site where the particle is going to be adsorbed.
+        """
+        # Only kept for the rejection free engine.
+        if self.available is None:
+            return
+
+        # The particle excludes its nearest neighbors.
+        for sitef in (site - 1, site, site + 1):
+            if self.periodic:
+                sitef %= self.length
+
+            if 0 <= sitef < self.length:
+                self.available.discard(sitef)
+
+    def _update_counters(self, site: int) -> None:
+        """
+            Updates the counters BEFORE the particle is adsorbed at the given
+            site, i.e., all the groups of consecutive empty sites that contain
+            the site will no longer be empty, and a particle can no longer be
+            adsorbed at the site or at its nearest neighbors.
+
+            :param site: The site where the particle is going to be adsorbed.
+        """
+        # Only the neighborhood of the particle changes.
+        for number, key in enumerate(Lattice.COUNTERS[1:4], start=1):
+            self.counters[key] -= self._get_empty_windows(site, site, number)
+
+        self.counters["available"] -= sum(
+            1 for x in (site - 1, site, site + 1) if self._is_available(x)
+        )
+        self.counters["occupied"] += 1
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods
     # /////////////////////////////////////////////////////////////////////////
@@ -40,6 +340,10 @@ class Lattice:
             simulation.
         """
         return {
+            "available": self.available,
+            "counters": self.counters,
+            "gaps": self.gaps,
+            "histogram": self.histogram,
             "lattice": self.lattice,
             "length": self.length,
             "periodic": self.periodic,
@@ -59,26 +363,53 @@ class Lattice:
 
             :return: The string representation of the lattice.
         """
+        # Only the gaps are kept by the gaps engine.
+        if self.lattice is None:
+            return self._get_gaps_string()
+
         # Auxiliary variables.
-        string: str = ""
         ents: tuple = tuple(f"{part}" for part in self.lattice)
         sites: tuple = tuple(f"{site}" for site in range(self.length))
         widths: tuple = tuple(max(len(x), len(y)) for x, y in zip(ents, sites))
 
         # Determine if partial full lattice needs to be returned.
-        if not partial:
-            for i, (site, length) in enumerate(zip(sites, widths)):
-                char: str = " | " if i > 0 else ""
-                string += f"{char}{site:>{length}}"
+        rows: list = [ents] if partial else [sites, ents]
 
-            string += "\n"
+        return "\n".join(
+            " | ".join(f"{x:>{y}}" for x, y in zip(row, widths))
+            for row in rows
+        ) + "\n"
 
-        # Get the particles in the site.
-        for i, (ent, length) in enumerate(zip(ents, widths)):
-            char: str = " | " if i > 0 else ""
-            string += f"{char}{ent:>{length}}"
+    def get_gap_counters(self) -> dict:
+        """
+            Gets the counters from scanning all the gaps of the lattice; only
+            meant for the gaps engine.
 
-        return string + "\n"
+            :return: The dictionary with the counters obtained from the gaps.
+        """
+        # Auxiliary variables.
+        counters: dict = {x: 0 for x in Lattice.COUNTERS}
+
+        # The occupied sites are the sites that are not in a gap.
+        counters["occupied"] = self.length
+
+        for (kind, length), number in self.histogram.items():
+            counters["occupied"] -= number * length
+
+            for name, value in self._get_gap_counters(kind, length).items():
+                counters[name] += number * value
+
+        return counters
+
+    def is_jammed(self) -> bool:
+        """
+            Determines if the lattice is jammed, i.e., no more particles can be
+            adsorbed, from the running counters.
+
+            :return: True, if no more particles can be adsorbed; False,
+             otherwise.
+        """
+        return self.counters["available"] == 0
 
     def particle_adsorb(self, site: int) -> bool:
         """
@@ -91,6 +422,13 @@ class Lattice:
              were adsorbed, i.e., the requested sites are within the lattice
              and empty.
         """
+        # The gaps engine does not keep the sites.
+        if self.lattice is None:
+            raise ValueError(
+                "The gaps engine does not keep the sites of the lattice, "
+                "particles can only be adsorbed at random available sites."
+            )
+
         # All sites must be valid.
         if not 0 <= site < self.length:
             raise ValueError(
@@ -116,21 +454,63 @@ class Lattice:
             for x in sites if 0 <= x < self.length
         )
 
-        # Update the particles in the sites.
+        # Update the counters and the particles in the sites.
         if flag:
+            self._update_available(site)
+            self._update_counters(site)
             self.lattice[site] = occupied
 
         return flag
 
+    def particle_adsorb_random(self, generator: random.Random) -> None:
+        """
+            Adsorbs a particle at a site chosen uniformly at random among the
+            sites where a particle can still be adsorbed; only meant for the
+            rejection free and the gaps engines.
+
+            :param generator: The random number generator.
+
+            :raise ValueError: If there are no sites where a particle can be
+             adsorbed.
+        """
+        # Choose the site directly.
+        if self.gaps is None:
+            self.particle_adsorb(self.available.choice(generator))
+            return
+
+        # Choose the gap, and the site inside the gap.
+        kind, length = self.gaps.pop(generator)
+        site: int = generator.randrange(self._get_gap_available(kind, length))
+
+        self._remove_gap(kind, length)
+        self.counters["occupied"] += 1
+
+        # The ring becomes a single interior gap.
+        if Lattice.GAPS[kind] == "ring":
+            self._add_gap(Lattice.GAPS.index("interior"), length - 1)
+            return
+
+        # Split the gap, that has its wall (if any) at the left end.
+        if Lattice.GAPS[kind] == "interior":
+            site += 1
+
+        left: str = "interior" if Lattice.GAPS[kind] == "interior" else "edge"
+        right: str = "edge" if Lattice.GAPS[kind] == "open" else "interior"
+
+        self._add_gap(Lattice.GAPS.index(left), site)
+        self._add_gap(Lattice.GAPS.index(right), length - site - 1)
+
     def reset(self) -> None:
         """
             Resets the lattice to an empty lattice.
         """
         # Reset to an empty lattice.
-        length: int = len(self.lattice)
+        if self.lattice is not None:
+            self.lattice[:] = bytes((Lattice.EMPTY,)) * self.length
 
-        for i in range(length):
-            self.lattice[i] = Lattice.EMPTY
+        self._reset_available()
+        self._reset_counters()
+        self._reset_gaps()
 
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Dunder
@@ -168,5 +548,24 @@ class Lattice:
         self.length: int = parameters["length"]
         self.periodic: bool = parameters["periodic"]
 
-        # Update the lattice.
-        self.lattice: list = [Lattice.EMPTY for _ in range(self.length)]
+        # Update the lattice, the gaps engine only keeps the gaps.
+        self.lattice: bytearray = None
+
+        if parameters["engine"] != "gaps":
+            self.lattice = bytearray((Lattice.EMPTY,)) * self.length
+
+        # Set the counters, the available sites and the gaps.
+        self.available: IndexedSet = None
+        self.counters: dict = {}
+        self.gaps: WeightedMultiset = None
+        self.histogram: dict = {}
+
+        if parameters["engine"] == "rejection_free":
+            self.available = IndexedSet(self.length)
+
+        if parameters["engine"] == "gaps":
+            self.gaps = WeightedMultiset()
+
+        self._reset_available()
+        self._reset_counters()
+        self._reset_gaps()
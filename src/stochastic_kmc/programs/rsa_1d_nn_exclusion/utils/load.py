@@ -12,10 +12,14 @@
 import pickle
 
 # User.
-from stochastic_kmc.programs.rsa_1d_nn_exclusion.simulation import Simulation
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.classes.results import Results
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.simulation import (
+    PROGRAM, Simulation
+)
 from stochastic_kmc.programs.rsa_1d_nn_exclusion.validation.load import (
     validate_parameters
 )
+from stochastic_kmc.utilities.container import read_container
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -47,6 +51,42 @@ def _load_simulation(file: str) -> dict:
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def load_results(file: str) -> dict:
+    """
+        Loads the results saved in the given binary container; the entries of
+        the columns are memory mapped, so they are only read from the disk
+        when they are used.
+
+        :param file: The path to the file where the binary results are saved.
+
+        :return: The dictionary with the parameters, the headers, the number
+         of simulations, the seeds, and the views of the time stamps, and the
+         means and the standard errors of every quantity.
+
+        :raise ValueError: If the results are not from this program.
+    """
+    # Auxiliary variables.
+    metadata, columns = read_container(file)
+
+    # The results must be from the same program.
+    if metadata["name"] != PROGRAM:
+        raise ValueError(
+            f"The results file is not from the \"{PROGRAM}\" program; file: "
+            f"{file}, program: \"{metadata['name']}\"."
+        )
+
+    return {
+        "date": metadata["date"],
+        "parameters": metadata["parameters"],
+        "simulations": metadata["simulations"],
+        "headers": metadata["headers"],
+        "seeds": [*zip(columns["repetitions"], columns["seeds"])],
+        "points": columns["points"],
+        "errors": {x: columns[f"{x}_error"] for x in Results.HEADERS},
+        **{x: columns[x] for x in Results.HEADERS},
+    }
+
+
 def load_simulation(file_pickle: str) -> Simulation:
     """
         Loads a simulation from the given file.
@@ -76,3 +116,4 @@ def load_simulation(file_pickle: str) -> Simulation:
     )
 
     return simulation
+
@@ -0,0 +1,332 @@
+"""
+    File that contains the class where to store the lattice as bit masks.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# User.
+from stochastic_kmc.programs.rsa_2d_dimers.classes.lattice import Lattice
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class BitLattice(Lattice):
+    """
+        Contains the variables to store the lattice of the simulation, where
+        each row is stored as the bits of an integer, i.e., one bit per site;
+        only meant for the standard engine.
+
+        PARAMETERS:
+        ___________
+
+        - self.available: Always None, the available bonds are not kept.
+
+        - self.counters: A dictionary with the running number of occupied
+          sites, and of the bonds where a dimer can still be adsorbed; updated
+          locally every time a particle is adsorbed.
+
+        - self.dimensions: A dictionary with the "length" and the "width" of
+          the 2D lattice.
+
+        - self.full: The mask with the bits of all the sites of a row set.
+
+        - self.neighbors: Always None, the neighbors are computed from the
+          row and the column of every site; the parent methods that use the
+          tables, e.g., "_get_bonds", must not be called.
+
+        - self.periodic: A dictionary with the periodicity of the "length" and
+          the "width" of the 2D lattice.
+
+        - self.rows: The list with the mask of the occupied sites of each row;
+          the bit "j" of the mask is set if the site at column "j" is
+          occupied.
+
+        - self.sites: Always None, the sites are stored in the masks of the
+          rows.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Properties
+    # /////////////////////////////////////////////////////////////////////////
+
+    @property
+    def lattice(self) -> list:
+        """
+            The 2D copy of the lattice, i.e., a list with "length" rows of
+            "width" entries, unpacked from the bits of the rows.
+
+            :return: The list with the rows of the lattice.
+        """
+        # Auxiliary variables.
+        width: int = self.dimensions["width"]
+
+        return [[(row >> j) & 1 for j in range(width)] for row in self.rows]
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_horizontal_mask(self, row: int) -> int:
+        """
+            Gets the mask of the sites of the given row that are the start of
+            a horizontal bond where a dimer can still be adsorbed.
+
+            :param row: The index of the row.
+
+            :return: The mask with the bits of the sites that start an
+             available horizontal bond set.
+        """
+        # Auxiliary variables.
+        width: int = self.dimensions["width"]
+        empty: int = self.full ^ self.rows[row]
+
+        # The last site only starts a bond in periodic lattices.
+        if self.periodic["width"]:
+            return empty & ((empty >> 1) | ((empty & 1) << (width - 1)))
+
+        return empty & (empty >> 1)
+
+    def _get_row_bonds(self, site: list) -> list:
+        """
+            Gets the bonds that contain the given site.
+
+            :param site: The [row, column] of the site whose bonds are
+             requested.
+
+            :return: A list with the bonds that contain the site, as
+             (row, column, direction) tuples of the site where the bond
+             starts; only the bonds inside the lattice are included.
+        """
+        # Auxiliary variables.
+        bonds: list = []
+
+        # Bonds that start at the site, or at its neighbors.
+        for start, end in (("right", "left"), ("up", "down")):
+            # Bond that starts at the site.
+            if self._get_site(site, start) is not None:
+                bonds.append((*site, start))
+
+            # Bond that ends at the site.
+            neighbor: list = self._get_site(site, end)
+
+            if neighbor is not None:
+                bonds.append((*neighbor, start))
+
+        return bonds
+
+    def _get_site(self, site: list, direction: str) -> list:
+        """
+            Gets the neighbor of the given site in the given direction.
+
+            :param site: The [row, column] of the site.
+
+            :param direction: The direction of the neighbor.
+
+            :return: The [row, column] of the neighbor; None, if the neighbor
+             is outside of the lattice.
+        """
+        # Auxiliary variables.
+        length: int = self.dimensions["length"]
+        width: int = self.dimensions["width"]
+        offset: tuple = Lattice.OFFSETS[direction]
+
+        row: int = site[0] + offset[0]
+        column: int = site[1] + offset[1]
+
+        if self.periodic["length"]:
+            row %= length
+
+        if self.periodic["width"]:
+            column %= width
+
+        if 0 <= row < length and 0 <= column < width:
+            return [row, column]
+
+        return None
+
+    def _is_empty(self, site: list) -> bool:
+        """
+            Determines if the given site is empty.
+
+            :param site: The [row, column] of the site.
+
+            :return: True, if the site is empty; False, otherwise.
+        """
+        return (self.rows[site[0]] >> site[1]) & 1 == Lattice.EMPTY
+
+    def _set_sites(self) -> None:
+        """
+            Sets the masks of the rows of an empty lattice; replaces the flat
+            array of the sites, and the tables of the nearest neighbors, of
+            the parent class, that take one byte, and several integers, per
+            site.
+        """
+        self.full = (1 << self.dimensions["width"]) - 1
+        self.rows = [0 for _ in range(self.dimensions["length"])]
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def get_dictionary(self) -> dict:
+        """
+            Returns a dictionary with the COMPLETE parameters of the
+            simulation.
+        """
+        return {
+            "available": self.available,
+            "counters": self.counters,
+            "dimensions": self.dimensions,
+            "periodic": self.periodic,
+            "rows": self.rows,
+        }
+
+    def get_mask_counters(self) -> dict:
+        """
+            Gets the counters from the masks of all the rows, i.e., the number
+            of set bits of the occupied masks, and of the masks of the
+            horizontal and vertical bonds with both sites empty.
+
+            :return: The dictionary with the counters obtained from the masks.
+        """
+        # Auxiliary variables.
+        length: int = self.dimensions["length"]
+        counters: dict = {
+            "available": 0,
+            "occupied": sum(row.bit_count() for row in self.rows),
+        }
+
+        for i in range(length):
+            # Horizontal bonds.
+            counters["available"] += self._get_horizontal_mask(i).bit_count()
+
+            # Vertical bonds; the last row only in periodic lattices.
+            if i == length - 1 and not self.periodic["length"]:
+                continue
+
+            occupied: int = self.rows[i] | self.rows[(i + 1) % length]
+            counters["available"] += (self.full ^ occupied).bit_count()
+
+        return counters
+
+    def particle_adsorb(
+        self,
+        site_length: list,
+        site_width: list,
+        direction: str
+    ) -> bool:
+        """
+            Attempts to adsorb the particles at the given sites.
+
+            :param site_length: The site along the length of the lattice where
+             the adsorption is inteded to take place.
+
+            :param site_width: The site along the width of the lattice where
+             the adsorption is inteded to take place.
+
+            :param direction: A string with the direction in wich the
+             adsorption will take place. Must be "up", "down", "left", or
+             "right".
+
+            :return: A boolean flag that indicates whether ALL the particles
+             were adsorbed, i.e., the requested sites are within the lattice
+             and empty.
+
+            :raise ValueError: If the site is not inside the lattice, or the
+             direction is not valid.
+        """
+        # Auxiliary variables.
+        length: int = self.dimensions["length"]
+        width: int = self.dimensions["width"]
+
+        # All sites must be valid.
+        if not 0 <= site_length < length:
+            raise ValueError(
+                f"The row adsorption site for a particle to adsorb is not in "
+                f"the proper range; the site must be inside the lattice "
+                f"(0 <= site_length < {length}); site_length = {site_length}."
+            )
+
+        if not 0 <= site_width < width:
+            raise ValueError(
+                f"The row adsorption site for a particle to adsorb is not in "
+                f"the proper range; the site must be inside the lattice "
+                f"(0 <= site_width < {width}); site_width = {site_width}."
+            )
+
+        # Check the direction is valid.
+        if direction not in Lattice.DIRECTIONS:
+            raise ValueError(
+                f"The direction value must take only one of these values: "
+                f"{Lattice.DIRECTIONS}; current value: \"{direction}\"."
+            )
+
+        # Neighboring sites.
+        site: list = [site_length, site_width]
+        sites: list = [site, self._get_site(site, direction)]
+
+        # Check all the sites.
+        flag: bool = sites[1] is not None and all(map(self._is_empty, sites))
+
+        if flag:
+            # The bonds that contain the sites are no longer available.
+            bonds: list = self._get_row_bonds(sites[0])
+            bonds += [
+                x for x in self._get_row_bonds(sites[1]) if x not in bonds
+            ]
+
+            for row, column, start in bonds:
+                bond: list = [row, column]
+
+                if self._is_empty(bond) and self._is_empty(
+                    self._get_site(bond, start)
+                ):
+                    self.counters["available"] -= 1
+
+            # Set the sites to occupied.
+            for row, column in sites:
+                self.rows[row] |= 1 << column
+
+            self.counters["occupied"] += 2
+
+        return flag
+
+    def reset(self) -> None:
+        """
+            Resets the lattice to an empty lattice.
+        """
+        # Reset to an empty lattice.
+        self.rows = [0 for _ in range(self.dimensions["length"])]
+
+        self._reset_counters()
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, parameters: dict) -> None:
+        """
+            Constructor for the object.
+
+            :param parameters: The simulation parameters that contains all the
+             information to create the lattice, and perform the lattice
+             operations.
+        """
+        # The bit masks do not keep the set of the available bonds.
+        if parameters["engine"] != "standard":
+            raise ValueError(
+                f"The bit lattice can only be used with the \"standard\" "
+                f"engine; requested engine: \"{parameters['engine']}\"."
+            )
+
+        # The masks of the rows.
+        self.full: int = 0
+        self.rows: list = []
+
+        super().__init__(parameters)
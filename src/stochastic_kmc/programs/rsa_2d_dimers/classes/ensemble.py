@@ -0,0 +1,458 @@
+"""
+    File that contains the class where to store the lattices of all the
+    repetitions, that are run at the same time.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Future.
+from __future__ import annotations
+
+# Standard library.
+import bisect
+import operator
+
+from typing import Sequence
+
+# Third party; optional, only needed by the ensemble engine.
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+# User.
+from stochastic_kmc.programs.rsa_2d_dimers.classes.lattice import Lattice
+from stochastic_kmc.utilities.schedule import get_schedule
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class Ensemble:
+    """
+        Contains the variables to store the lattices of all the repetitions,
+        that are advanced in lock-step, i.e., every attempt is made on all the
+        lattices at the same time; only meant for the ensemble engine. The
+        lattices are stacked in a 3D NumPy array, and the statistics are summed
+        over the lattices after every attempt.
+
+        PARAMETERS:
+        ___________
+
+        - self.counters: A dictionary with the array of the running counters
+          of each lattice; updated locally every time a particle is adsorbed.
+
+        - self.debug: A boolean flag indicating whether the running counters
+          must be validated against a full scan of the lattices after every
+          attempt. True, if the counters must be validated; False, otherwise.
+
+        - self.dimensions: A dictionary with the "length" and the "width" of
+          the 2D lattice.
+
+        - self.generator: The NumPy random number generator.
+
+        - self.lattices: The array of bytes with the lattices, i.e.,
+          "repetitions" lattices of "length" rows of "width" sites.
+
+        - self.neighbors: The array with the tables of the nearest neighbors
+          of every site, one row for each of the "Lattice.DIRECTIONS"; the
+          entry is "Lattice.OFF" if the neighbor is outside of the lattice.
+
+        - self.periodic: A dictionary with the periodicity of the "length" and
+          the "width" of the 2D lattice.
+
+        - self.rows: The array with the index of every lattice.
+
+        - self.schedule: The numbers of attempts after which the sums are
+          recorded, in increasing order.
+
+        - self.squares: A dictionary with the arrays of the squares of the
+          quantities of every lattice, summed over all the lattices, at the
+          same numbers of attempts as the sums, as Python integers that never
+          overflow; the names are those of the statistics tables.
+
+        - self.successes: The array with the number of successful attempts of
+          each lattice.
+
+        - self.successful: The total number of successful attempts over all
+          the lattices.
+
+        - self.sums: A dictionary with the arrays of the quantities, summed
+          over all the lattices, before the first attempt, and after each
+          number of attempts of the schedule; the names are those of the
+          statistics tables.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Class Variables
+    # /////////////////////////////////////////////////////////////////////////
+
+    # Names of the statistics tables, and of the counter summed in each.
+    TABLES: dict = {"attempts": None, "coverage": "occupied"}
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_available_bonds(
+        self, rows: np.ndarray, sites: np.ndarray
+    ) -> np.ndarray:
+        """
+            Gets the number of bonds that contain the given empty sites, where
+            a dimer can still be adsorbed, i.e., the number of empty nearest
+            neighbors of each site inside the lattice.
+
+            :param rows: The array with the lattices of each site.
+
+            :param sites: The array with the numbers of the empty sites.
+
+            :return: The array with the number of available bonds of each
+             site.
+        """
+        # Auxiliary variables.
+        bonds: np.ndarray = np.zeros(len(sites), dtype=np.int64)
+
+        for i in range(len(Lattice.DIRECTIONS)):
+            bonds += self._get_empty(rows, self.neighbors[i, sites], False)
+
+        return bonds
+
+    def _get_empty(
+        self, rows: np.ndarray, sites: np.ndarray, inside: bool
+    ) -> np.ndarray:
+        """
+            Determines if the sites are empty in the given lattices.
+
+            :param rows: The array with the lattices of each site.
+
+            :param sites: The array with the numbers of the sites, where
+             "Lattice.OFF" is a site outside of the lattice.
+
+            :param inside: The value for the sites outside of the lattice.
+
+            :return: The array of boolean flags, True, where the site is
+             empty; False, otherwise.
+        """
+        # Auxiliary variables.
+        valid: np.ndarray = sites != Lattice.OFF
+        flat: np.ndarray = self.lattices.reshape(len(self.rows), -1)
+
+        # Sites outside of the lattice take the given value.
+        empty: np.ndarray = flat[
+            rows, np.where(valid, sites, 0)
+        ] == Lattice.EMPTY
+
+        return np.where(valid, empty, inside)
+
+    def _get_scan_counters(self) -> dict:
+        """
+            Gets the counters of every lattice from a full scan of the
+            lattices.
+
+            :return: The dictionary with the array of the counters of each
+             lattice.
+        """
+        # Auxiliary variables.
+        empty: np.ndarray = self.lattices == Lattice.EMPTY
+        available: np.ndarray = np.zeros(len(self.rows), dtype=np.int64)
+
+        # Bonds that start at each site; those of the last row, or column,
+        # are only inside periodic lattices.
+        for axis, key in ((1, "length"), (2, "width")):
+            bonds: np.ndarray = empty & np.roll(empty, -1, axis=axis)
+
+            if not self.periodic[key]:
+                bonds = bonds[:, :-1, :] if axis == 1 else bonds[:, :, :-1]
+
+            available += bonds.sum(axis=(1, 2))
+
+        return {
+            "occupied": (~empty).sum(axis=(1, 2)),
+            "available": available,
+        }
+
+    def _set_sums(self, start: int, stop: int) -> None:
+        """
+            Sets the sums of the quantities, and of their squares, over all the
+            lattices, from the current counters, in the given entries.
+
+            :param start: The first entry of the sums to set.
+
+            :param stop: The entry after the last entry of the sums to set.
+        """
+        for table, key in Ensemble.TABLES.items():
+            # Auxiliary variables.
+            values: np.ndarray = (
+                self.successes if key is None else self.counters[key]
+            )
+            largest: int = int(values.max(initial=0))
+
+            self.sums[table][start:stop] = values.sum()
+
+            # The int64 dot product is exact while the sum of the squares
+            # stays below 2 ** 63; beyond that, the squares are summed as
+            # Python integers, that never overflow.
+            if largest * largest * len(values) < 2 ** 63:
+                self.squares[table][start:stop] = int(values @ values)
+                continue
+
+            entries: list = values.tolist()
+            self.squares[table][start:stop] = sum(
+                map(operator.mul, entries, entries)
+            )
+
+    def _validate_counters(self) -> None:
+        """
+            Validates that the running counters of all the lattices are the
+            same as the quantities obtained by scanning the lattices.
+
+            :raise ValueError: If any of the counters is different from the
+             quantity obtained by scanning the lattices.
+        """
+        # Auxiliary variables.
+        message: str = ""
+
+        for key, value in self._get_scan_counters().items():
+            wrong: np.ndarray = np.flatnonzero(self.counters[key] != value)
+
+            if len(wrong) > 0:
+                message += (
+                    f"The \"{key}\" counter does not match the lattice "
+                    f"{wrong[0]}; counter: {self.counters[key][wrong[0]]}, "
+                    f"lattice: {value[wrong[0]]}. "
+                )
+
+        if message != "":
+            raise ValueError(message.strip())
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def fill_statistics(self, attempts: int, number: int) -> None:
+        """
+            Updates the sums with the given number of attempts, after the given
+            number of attempts, where none of the lattices change, i.e., all
+            the lattices are jammed.
+
+            :param attempts: The current number of attempts.
+
+            :param number: The number of attempts where nothing changes.
+        """
+        # Auxiliary variables.
+        start: int = bisect.bisect_right(self.schedule, attempts) + 1
+        stop: int = bisect.bisect_right(self.schedule, attempts + number) + 1
+
+        # The quantities do not change.
+        self._set_sums(start, stop)
+
+    def get_dictionary(self) -> dict:
+        """
+            Returns a dictionary with the COMPLETE parameters of the
+            simulation.
+        """
+        return {
+            "counters": self.counters,
+            "debug": self.debug,
+            "dimensions": self.dimensions,
+            "lattices": self.lattices,
+            "neighbors": self.neighbors,
+            "periodic": self.periodic,
+            "schedule": self.schedule,
+            "squares": self.squares,
+            "successes": self.successes,
+            "successful": self.successful,
+            "sums": self.sums,
+        }
+
+    def is_jammed(self) -> bool:
+        """
+            Determines if all the lattices are jammed, i.e., no more dimers can
+            be adsorbed, from the running counters.
+
+            :return: True, if no more dimers can be adsorbed in any of the
+             lattices; False, otherwise.
+        """
+        return not self.counters["available"].any()
+
+    def particle_adsorb(
+        self, sites: np.ndarray, directions: np.ndarray
+    ) -> np.ndarray:
+        """
+            Attempts to adsorb a dimer at the given site, and its neighbor in
+            the given direction, of each lattice.
+
+            :param sites: The array with the number of the site where the
+             adsorption is inteded to take place, in each lattice.
+
+            :param directions: The array with the index, in
+             "Lattice.DIRECTIONS", of the direction in which the adsorption
+             will take place, in each lattice.
+
+            :return: The array of boolean flags that indicate whether the
+             dimer was adsorbed in each lattice, i.e., both sites are within
+             the lattice and empty.
+        """
+        # Auxiliary variables.
+        neighbors: np.ndarray = self.neighbors[directions, sites]
+
+        # Only the lattices where the dimer can be adsorbed change.
+        flags: np.ndarray = self._get_empty(self.rows, sites, False)
+        flags &= self._get_empty(self.rows, neighbors, False)
+
+        rows: np.ndarray = self.rows[flags]
+        sites = sites[flags]
+        neighbors = neighbors[flags]
+
+        # The bonds that contain the sites are no longer available; the bond
+        # between both sites is counted twice.
+        self.counters["available"][rows] -= (
+            self._get_available_bonds(rows, sites)
+            + self._get_available_bonds(rows, neighbors) - 1
+        )
+        self.counters["occupied"][rows] += 2
+
+        # Adsorb the dimers.
+        flat: np.ndarray = self.lattices.reshape(len(self.rows), -1)
+
+        flat[rows, sites] = Lattice.OCCUPIED
+        flat[rows, neighbors] = Lattice.OCCUPIED
+
+        return flags
+
+    def reset(self) -> None:
+        """
+            Resets all the lattices to empty lattices, and the sums.
+        """
+        # Auxiliary variables.
+        repetitions: int = len(self.rows)
+        bonds: int = 0
+
+        # The bonds that start at each site, inside the lattice.
+        for direction in Lattice.BONDS:
+            table: np.ndarray = self.neighbors[
+                Lattice.DIRECTIONS.index(direction)
+            ]
+            bonds += int((table != Lattice.OFF).sum())
+
+        # Reset to empty lattices.
+        self.lattices.fill(Lattice.EMPTY)
+
+        self.counters = {
+            "occupied": np.zeros(repetitions, dtype=np.int64),
+            "available": np.full(repetitions, bonds, dtype=np.int64),
+        }
+
+        # Nothing has been adsorbed yet.
+        self.successes = np.zeros(len(self.rows), dtype=np.int64)
+        self.successful = 0
+
+        self.squares = {
+            x: np.zeros(len(self.schedule) + 1, dtype=object)
+            for x in Ensemble.TABLES
+        }
+        self.sums = {
+            x: np.zeros(len(self.schedule) + 1, dtype=np.int64)
+            for x in Ensemble.TABLES
+        }
+
+    def run_attempt(self, attempts: int) -> None:
+        """
+            Makes one adsorption attempt, at a site and in a direction chosen
+            uniformly at random, in every lattice, and updates the sums.
+
+            :param attempts: The current number of attempts.
+        """
+        # Auxiliary variables.
+        sites: int = self.dimensions["length"] * self.dimensions["width"]
+
+        # Make the moves.
+        chosen: np.ndarray = self.generator.integers(
+            0, sites, size=len(self.rows)
+        )
+        directions: np.ndarray = self.generator.integers(
+            0, len(Lattice.DIRECTIONS), size=len(self.rows)
+        )
+        flags: np.ndarray = self.particle_adsorb(chosen, directions)
+
+        self.successes += flags
+        self.successful += int(flags.sum())
+
+        # Validate the counters against the full lattices, if requested.
+        if self.debug:
+            self._validate_counters()
+
+        # Only sum the quantities at the numbers of attempts of the schedule.
+        index: int = bisect.bisect_left(self.schedule, attempts + 1)
+
+        if index == len(self.schedule) or self.schedule[index] != attempts + 1:
+            return
+
+        # Sum the quantities, and their squares, over the lattices.
+        self._set_sums(index + 1, index + 2)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, parameters: dict) -> None:
+        """
+            Constructor for the object.
+
+            :param parameters: The simulation parameters that contains all the
+             information to create the lattices, and perform the lattice
+             operations.
+
+            :raise ValueError: If NumPy is not installed.
+        """
+        # NumPy is required.
+        if np is None:
+            raise ValueError(
+                "The ensemble engine requires NumPy; install NumPy, or choose "
+                "another engine."
+            )
+
+        # Initialize the parameters.
+        self.debug: bool = parameters["debug"]
+        self.dimensions: dict = parameters["dimensions"]
+        self.periodic: dict = parameters["periodic"]
+
+        # The generator, and the lattices of all the repetitions.
+        self.generator: np.random.Generator = np.random.default_rng(
+            parameters["seed"]
+        )
+        self.lattices: np.ndarray = np.zeros(
+            (
+                parameters["repetitions"],
+                self.dimensions["length"],
+                self.dimensions["width"]
+            ),
+            dtype=np.uint8
+        )
+        self.rows: np.ndarray = np.arange(parameters["repetitions"])
+
+        # The nearest neighbors are those of a single lattice.
+        tables: dict = Lattice(parameters).neighbors
+
+        self.neighbors: np.ndarray = np.array(
+            [tables[x] for x in Lattice.DIRECTIONS], dtype=np.int64
+        )
+
+        # Set the counters and the sums; the sums are only recorded at the
+        # numbers of attempts of the schedule.
+        self.counters: dict = {}
+        self.schedule: Sequence = get_schedule(
+            parameters["attempts"], parameters["sampling"]
+        )
+        self.squares: dict = {}
+        self.successes: np.ndarray = None
+        self.successful: int = 0
+        self.sums: dict = {}
+
+        self.reset()
@@ -3,6 +3,18 @@
 """
 
 
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+from array import array
+
+# User.
+from stochastic_kmc.utilities.sampling import IndexedSet
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Classes
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -15,14 +27,29 @@ class Lattice:
         PARAMETERS:
         ___________
 
-        - self.lattice: The 2D array that contains the particles with "length"
-          rows of "width" number of entries.
+        - self.available: The set of bonds, i.e., pairs of neighboring sites,
+          where a dimer can still be adsorbed; only kept for the rejection
+          free engine, None otherwise. The bond "2 * site + i" joins the site,
+          numbered "row * width + column", with its neighbor in the direction
+          "BONDS[i]".
+
+        - self.counters: A dictionary with the running number of occupied
+          sites, and of the bonds where a dimer can still be adsorbed; updated
+          locally every time a particle is adsorbed.
 
         - self.dimensions: A dictionary with the "length" and the "width" of
           the 2D lattice.
 
+        - self.neighbors: A dictionary with the table of the nearest neighbors
+          of every site in each of the "DIRECTIONS"; the entry is "OFF" if the
+          neighbor is outside of the lattice.
+
         - self.periodic: A dictionary with the periodicity of the "length" and
           the "width" of the 2D lattice.
+
+        - self.sites: The flat array of bytes that contains the particles, one
+          byte per site, where the site at a given row and column is numbered
+          "row * width + column".
     """
     # /////////////////////////////////////////////////////////////////////////
     # Class Variables
@@ -35,49 +62,161 @@ class Lattice:
     # Adsorption directions.
     DIRECTIONS: tuple = "up", "down", "left", "right"
 
+    # Directions of the bonds that start at each site.
+    BONDS: tuple = "right", "up"
+
+    # Neighbor of a site that is outside of the lattice.
+    OFF: int = -1
+
+    # (row, column) offsets of the neighbor in each direction.
+    OFFSETS: dict = {
+        "up": (1, 0), "down": (-1, 0), "left": (0, -1), "right": (0, 1)
+    }
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Properties
+    # /////////////////////////////////////////////////////////////////////////
+
+    @property
+    def lattice(self) -> list:
+        """
+            The 2D view of the lattice, i.e., a list with "length" rows of
+            "width" entries, that share the memory with the flat array of
+            sites.
+
+            :return: The list with the rows of the lattice.
+        """
+        # Auxiliary variables.
+        view: memoryview = memoryview(self.sites)
+        width: int = self.dimensions["width"]
+
+        return [
+            view[i:i + width] for i in range(0, len(self.sites), width)
+        ]
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _get_site(self, site: list, direction: str) -> list:
+    def _get_bonds(self, site: int) -> list:
+        """
+            Gets the bonds that contain the given site.
+
+            :param site: The number of the site whose bonds are requested.
+
+            :return: A list with the numbers of the bonds that contain the
+             site, i.e., the bonds that start at the site and those that end
+             at the site; only the bonds inside the lattice are included.
         """
-            Gets the site where the particle will be attempted to be adsorbed.
+        # Auxiliary variables.
+        bonds: list = []
+
+        # Bonds that start at the site, or at its neighbors.
+        for i, (start, end) in enumerate((("right", "left"), ("up", "down"))):
+            # Bond that starts at the site.
+            if self.neighbors[start][site] != Lattice.OFF:
+                bonds.append(2 * site + i)
 
-            :param site: The current adsorption site.
+            # Bond that ends at the site.
+            neighbor: int = self.neighbors[end][site]
 
-            :param direction: The direction where the particles are meant to be
-             adsorbed.
+            if neighbor != Lattice.OFF:
+                bonds.append(2 * neighbor + i)
 
-            :return: A list with the place where a particle is meant to be
-             adsorbed.
+        return bonds
+
+    def _get_bond_sites(self, bond: int) -> list:
         """
-        # Check the direction is valid.
-        if direction not in Lattice.DIRECTIONS:
-            raise ValueError(
-                f"The direction value must take only one of these values: "
-                f"{Lattice.DIRECTIONS}; current value: \"{direction}\"."
-            )
+            Gets the sites joined by the given bond.
+
+            :param bond: The number of the bond.
+
+            :return: A list with the numbers of the two sites joined by the
+             bond.
+        """
+        # Auxiliary variables.
+        site: int = bond // 2
 
+        return [site, self.neighbors[Lattice.BONDS[bond % 2]][site]]
+
+    def _get_neighbor_table(self, offset: tuple) -> array:
+        """
+            Gets the table with the neighbor of every site at the given offset,
+            considering the periodicity of the lattice.
+
+            :param offset: The (row, column) offset of the neighbor.
+
+            :return: The array with the number of the neighbor of every site;
+             "OFF" if the neighbor is outside of the lattice.
+        """
         # Auxiliary variables.
         length: int = self.dimensions["length"]
         width: int = self.dimensions["width"]
+        table: array = array("q", [Lattice.OFF]) * (length * width)
 
-        # Determine the direction.
-        if direction in Lattice.DIRECTIONS[:2]:
-            # Flip the site up or down.
-            site[0] += 1 if direction == "up" else -1
+        # Find the neighbor of every site.
+        for i in range(length):
+            for j in range(width):
+                row: int = i + offset[0]
+                column: int = j + offset[1]
 
-            if self.periodic["length"]:
-                site[0] = length - 1 if site[0] < 0 else site[0] % length
+                if self.periodic["length"]:
+                    row %= length
 
-        else:
-            # Flip the left or right.
-            site[1] += 1 if direction == "right" else -1
+                if self.periodic["width"]:
+                    column %= width
+
+                if 0 <= row < length and 0 <= column < width:
+                    table[i * width + j] = row * width + column
+
+        return table
+
+    def _reset_available(self) -> None:
+        """
+            Resets the set of available bonds to that of an empty lattice.
+        """
+        # Only kept for the rejection free engine.
+        if self.available is None:
+            return
+
+        # All the bonds inside the lattice are available.
+        self.available.clear()
+
+        for site in range(len(self.sites)):
+            for bond in self._get_bonds(site):
+                self.available.add(bond)
+
+    def _reset_counters(self) -> None:
+        """
+            Resets the counters to those of an empty lattice.
+        """
+        # Auxiliary variables.
+        length: int = self.dimensions["length"]
+        width: int = self.dimensions["width"]
 
-            if self.periodic["width"]:
-                site[1] = width - 1 if site[1] < 0 else site[1] % width
+        # Open lattices have fewer bonds along that dimension.
+        length -= 0 if self.periodic["length"] else 1
+        width -= 0 if self.periodic["width"] else 1
 
-        return site
+        self.counters = {
+            "available": length * self.dimensions["width"]
+            + self.dimensions["length"] * width,
+            "occupied": 0,
+        }
+
+    def _set_sites(self) -> None:
+        """
+            Sets the flat array of the sites of an empty lattice, and the
+            tables of the nearest neighbors of every site.
+        """
+        self.sites = bytearray((Lattice.EMPTY,)) * (
+            self.dimensions["length"] * self.dimensions["width"]
+        )
+
+        # The nearest neighbors are only computed once.
+        self.neighbors = {
+            x: self._get_neighbor_table(y) for x, y in Lattice.OFFSETS.items()
+        }
 
     # /////////////////////////////////////////////////////////////////////////
     # Methods
@@ -89,9 +228,12 @@ class Lattice:
             simulation.
         """
         return {
+            "available": self.available,
+            "counters": self.counters,
             "dimensions": self.dimensions,
-            "lattice": self.lattice,
+            "neighbors": self.neighbors,
             "periodic": self.periodic,
+            "sites": self.sites,
         }
 
     def get_lattice_string(self, partial: bool = False) -> str:
@@ -148,6 +290,16 @@ class Lattice:
 
         return string + "\n\n"
 
+    def is_jammed(self) -> bool:
+        """
+            Determines if the lattice is jammed, i.e., no more particles can be
+            adsorbed, from the running counters.
+
+            :return: True, if no more particles can be adsorbed; False,
+             otherwise.
+        """
+        return self.counters["available"] == 0
+
     def particle_adsorb(
         self,
         site_length: list,
@@ -170,6 +322,9 @@ class Lattice:
             :return: A boolean flag that indicates whether ALL the particles
              were adsorbed, i.e., the requested sites are within the lattice
              and empty.
+
+            :raise ValueError: If the site is not inside the lattice, or the
+             direction is not valid.
         """
         # Auxiliary variables.
         flag: bool = True
@@ -191,24 +346,45 @@ class Lattice:
                 f"(0 <= site_width < {width}); site_width = {site_width}."
             )
 
+        # Check the direction is valid.
+        if direction not in Lattice.DIRECTIONS:
+            raise ValueError(
+                f"The direction value must take only one of these values: "
+                f"{Lattice.DIRECTIONS}; current value: \"{direction}\"."
+            )
+
         # Neighboring sites.
-        sites: list = [
-            [site_length, site_width],
-            self._get_site([site_length, site_width], direction)
-        ]
+        site: int = site_length * width + site_width
+        sites: list = [site, self.neighbors[direction][site]]
 
         # Check all the sites.
         for site in sites:
-            flag = flag and (0 <= site[0] < length and 0 <= site[1] < width)
-            flag = flag and self.lattice[site[0]][site[1]] == Lattice.EMPTY
+            flag = flag and site != Lattice.OFF
+            flag = flag and self.sites[site] == Lattice.EMPTY
 
             if not flag:
                 break
 
         else:
+            # The bonds that contain the sites are no longer available.
+            bonds: list = self._get_bonds(sites[0])
+            bonds += [x for x in self._get_bonds(sites[1]) if x not in bonds]
+
+            for bond in bonds:
+                if all(
+                    self.sites[x] == Lattice.EMPTY
+                    for x in self._get_bond_sites(bond)
+                ):
+                    self.counters["available"] -= 1
+
+                if self.available is not None:
+                    self.available.discard(bond)
+
             # Set the sites to occupied.
             for site in sites:
-                self.lattice[site[0]][site[1]] = Lattice.OCCUPIED
+                self.sites[site] = Lattice.OCCUPIED
+
+            self.counters["occupied"] += 2
 
         return flag
 
@@ -217,9 +393,10 @@ class Lattice:
             Resets the lattice to an empty lattice.
         """
         # Reset to an empty lattice.
-        for i in range(self.dimensions["length"]):
-            for j in range(self.dimensions["width"]):
-                self.lattice[i][j] = Lattice.EMPTY
+        self.sites[:] = bytes((Lattice.EMPTY,)) * len(self.sites)
+
+        self._reset_available()
+        self._reset_counters()
 
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Dunder
@@ -262,7 +439,20 @@ class Lattice:
         self.periodic: bool = parameters["periodic"]
 
         # Update the lattice.
-        self.lattice: list = [
-            [Lattice.EMPTY for _ in range(self.dimensions["width"])]
-            for _ in range(self.dimensions["length"])
-        ]
+        self.neighbors: dict = None
+        self.sites: bytearray = None
+
+        self._set_sites()
+
+        # Set the counters and the available bonds.
+        self.available: IndexedSet = None
+        self.counters: dict = {}
+
+        if parameters["engine"] == "rejection_free":
+            total_sites: int = self.dimensions["length"]
+            total_sites *= self.dimensions["width"]
+
+            self.available = IndexedSet(2 * total_sites)
+
+        self._reset_available()
+        self._reset_counters()
@@ -8,8 +8,16 @@
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+# Standard library.
+import bisect
+
+from array import array
+from typing import Sequence
+
 # User.
 from stochastic_kmc.programs.rsa_2d_dimers.classes.lattice import Lattice
+from stochastic_kmc.utilities.columns import TYPECODE
+from stochastic_kmc.utilities.schedule import get_points, get_schedule
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -28,6 +36,43 @@ HEADER_EMPTYSTS: tuple = ("Attempts", "Free")
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def _get_available(lattice: list, periodic: dict) -> int:
+    """
+        Gets the number of bonds where a dimer can still be adsorbed, i.e.,
+        the pairs of nearest neighbor sites that are both empty. The lattice
+        must only be made of zeros and ones, where zero (0) is empty and one
+        (1) is occupied.
+
+        :param lattice: The lattice with the particles.
+
+        :param periodic: A dictionary with the periodicity of the "length" and
+         the "width" of the 2D lattice.
+
+        :return: The number of bonds where a dimer can be adsorbed.
+    """
+    # Auxiliary variables.
+    count: int = 0
+    empty: int = Lattice.EMPTY
+    length: int = len(lattice)
+    width: int = len(lattice[0])
+
+    # Scan the lattice.
+    for i in range(length):
+        for j in range(width):
+            if lattice[i][j] != empty:
+                continue
+
+            # Bonds to the right and up of the site.
+            for x, y in ((i, j + 1), (i + 1, j)):
+                x = x % length if periodic["length"] else x
+                y = y % width if periodic["width"] else y
+
+                if x < length and y < width and lattice[x][y] == empty:
+                    count += 1
+
+    return count
+
+
 def _get_coverage(lattice: list) -> int:
     """
         Gets the number of sites that are not empty. The lattice must only
@@ -47,53 +92,59 @@ def _get_coverage(lattice: list) -> int:
     return coverage
 
 
-def _get_string_table(table: list) -> str:
+def _get_string_table(header: tuple, columns: list) -> str:
     """
-        Gets the string for the given table.
+        Gets the string for the table with the given columns; every column is
+        shown as a line, that starts with its header.
 
-        :param array: The table for which the string must be obtained.
+        :param header: The tuple with the header of every column.
 
-        :return: A list of the widths of each table column entry.
+        :param columns: The list with the sequences of the entries of every
+         column; all the columns must have the same length.
+
+        :return: The string that represents the table.
     """
     # Auxiliary variables.
     string: str = ""
-    tostr: callable = "{:>{width}}".format
 
     # Set the string.
-    if len(table) <= 1:
+    if len(columns[0]) == 0:
         # No data to show.
         string += "No data to show."
 
     else:
-        # Table dimensions
-        table_length: int = len(table)
-        table_width: int = len(table[0])
+        # The entries of every line, starting with the header.
+        lines: list = [
+            [f"{x}", *(f"{y}" for y in column)]
+            for x, column in zip(header, columns)
+        ]
 
         # List of widths.
-        widths: list = _get_widths(table)
+        widths: tuple = _get_widths(lines)
 
-        for i in range(table_width):
+        for line in lines:
             string += " | ".join(
-                tostr(table[j][i], width=w)
-                for j, w in zip(range(table_length), widths)
+                x.rjust(w) for x, w in zip(line, widths)
             ) + "\n"
 
     return f"{string}\n"
 
 
-def _get_widths(table: list) -> tuple:
+def _get_widths(lines: list) -> tuple:
     """
-        Gets the maximum width for each column of the given table.
+        Gets the maximum width of the entries at each position of the lines of
+        a table.
 
-        :param array: The table for which the column widths must be obtained.
+        :param lines: The list with the strings of the entries of every line
+         of the table.
 
-        :return: A list of the widths of each table column entry.
+        :return: A tuple of the widths of the entries at each position.
     """
     # Auxiliary variables.
-    if len(table) == 0:
+    if len(lines) == 0:
         return tuple()
 
-    return tuple(max(len(f"{x}") for x in entry) for entry in table)
+    return tuple(max(len(x) for x in entry) for entry in zip(*lines))
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -108,22 +159,185 @@ class Statistics:
         PARAMETERS:
         ___________
 
-        - self.attempts: The array with the statistics of the number of
-          attempts and successful attempts.
+        - self.attempts: The array with the number of successful attempts, at
+          the numbers of attempts of the rows kept in memory.
+
+        - self.backend: The backend that stores the lattice.
+
+        - self.chunk: The number of rows, of each table, kept in memory before
+          they are handed to the sink; zero, if the rows are kept until the
+          end of the run.
+
+        - self.chunks: The number of chunks of rows handed to the sink so far.
+
+        - self.coverage: The array with the total number of particles, at the
+          numbers of attempts of the rows kept in memory.
 
-        - self.coverage: The array with the total number of particles and the
-          inverse elapsed time, i.e., the number of attempts.
+        - self.current: The number of attempts made so far.
+
+        - self.debug: A boolean flag indicating whether the running counters
+          of the lattice must be validated against a full scan of the lattice
+          after every attempt. True, if the counters must be validated; False,
+          otherwise.
+
+        - self.flushed: The number of rows, of each table, handed to the sink
+          so far.
+
+        - self.index: The index, in the schedule, of the next number of
+          attempts where the statistics are recorded.
 
         - self.length: The length of the 1D lattice, a number  greater than
           zero.
 
         - self.periodic: A boolean flag indicating whether the lattice is
           periodic. True, if the lattice is periodic; False, otherwise.
+
+        - self.points: The numbers of attempts of every row of the tables,
+          i.e., zero, before the first attempt, followed by the schedule; the
+          rows kept in memory start after those handed to the sink.
+
+        - self.schedule: The numbers of attempts after which the statistics
+          are recorded, in increasing order.
+
+        - self.sink: The function that takes the statistics, every time the
+          tables are full, and stores the rows kept in memory; None, if the
+          rows are kept until the end of the run.
+
+        - self.successful: The number of successful attempts made so far.
+
+        - self.upcoming: The next number of attempts where the statistics are
+          recorded; zero, if there are no more.
     """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _flush_full(self) -> None:
+        """
+            Hands the rows kept in memory to the sink, if the tables are full.
+        """
+        if 0 < self.chunk <= len(self.coverage):
+            self.flush()
+
+    def _set_upcoming(self) -> None:
+        """
+            Sets the next number of attempts where the statistics are recorded,
+            from the index of the schedule.
+        """
+        # Auxiliary variables.
+        index: int = self.index
+
+        self.upcoming = (
+            self.schedule[index] if index < len(self.schedule) else 0
+        )
+
+    def _validate_counters(self, lattice: Lattice) -> None:
+        """
+            Validates that the running counters of the lattice are the same as
+            the quantities obtained by scanning the whole lattice.
+
+            :param lattice: The lattice object with the particles and the
+             counters.
+
+            :raise ValueError: If any of the counters is different from the
+             quantity obtained by scanning the lattice.
+        """
+        # Auxiliary variables.
+        message: str = ""
+
+        # Quantities from scanning the lattice.
+        expected: dict = {
+            "occupied": _get_coverage(lattice.lattice),
+            "available": _get_available(lattice.lattice, self.periodic),
+        }
+
+        # The masks of the rows must agree with the scan too.
+        if self.backend == "bits":
+            for key, value in lattice.get_mask_counters().items():
+                if expected[key] != value:
+                    message += (
+                        f"The \"{key}\" mask count does not match the "
+                        f"lattice; masks: {value}, lattice: {expected[key]}. "
+                    )
+
+        for key, value in expected.items():
+            if lattice.counters[key] != value:
+                message += (
+                    f"The \"{key}\" counter does not match the lattice; "
+                    f"counter: {lattice.counters[key]}, lattice: {value}. "
+                )
+
+        if message != "":
+            raise ValueError(message.strip())
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods
     # /////////////////////////////////////////////////////////////////////////
 
+    def fill_statistics(self, lattice: Lattice, attempts: int) -> None:
+        """
+            From the counters of the given lattice, updates the statistics with
+            the given number of unsuccessful attempts, i.e., the lattice does
+            not change during these attempts.
+
+            :param lattice: The lattice object with the particles and the
+             counters.
+
+            :param attempts: The number of unsuccessful attempts.
+        """
+        # No attempts to add.
+        if attempts <= 0:
+            return
+
+        # Validate the counters against the full lattice, if requested.
+        if self.debug:
+            self._validate_counters(lattice)
+
+        # Auxiliary variables.
+        occupied: int = lattice.counters["occupied"]
+        self.current += attempts
+
+        # The number of rows of the schedule in the given attempts.
+        stop: int = bisect.bisect_right(
+            self.schedule, self.current, lo=self.index
+        )
+        rows: int = stop - self.index
+
+        self.index = stop
+        self._set_upcoming()
+
+        # Update the quantities, they do not change; the tables are handed to
+        # the sink every time they are full.
+        while rows > 0:
+            number: int = rows
+
+            if self.chunk > 0 and self.sink is not None:
+                number = min(number, self.chunk - len(self.coverage))
+
+            self.coverage.extend(array(TYPECODE, [occupied]) * number)
+            self.attempts.extend(array(TYPECODE, [self.successful]) * number)
+
+            rows -= number
+            self._flush_full()
+
+    def flush(self) -> None:
+        """
+            Hands the rows kept in memory to the sink, and empties the tables;
+            nothing is done if there is no sink, or no rows.
+        """
+        # Nothing to hand over.
+        if self.sink is None or len(self.coverage) == 0:
+            return
+
+        self.sink(self)
+
+        # The rows are no longer kept.
+        self.chunks += 1
+        self.flushed += len(self.coverage)
+
+        for table in (self.attempts, self.coverage):
+            del table[:]
+
     def get_dictionary(self) -> dict:
         """
             Returns a dictionary with the COMPLETE parameters of the
@@ -131,37 +345,81 @@ class Statistics:
         """
         return {
             "attempts": self.attempts,
+            "chunk": self.chunk,
+            "chunks": self.chunks,
             "coverage": self.coverage,
+            "current": self.current,
+            "debug": self.debug,
             "dimensions": self.dimensions,
-            "periodic": self.periodic
+            "flushed": self.flushed,
+            "periodic": self.periodic,
+            "points": self.points,
+            "schedule": self.schedule,
+            "successful": self.successful
         }
 
+    def get_points(self) -> Sequence:
+        """
+            Gets the numbers of attempts of the rows kept in memory.
+
+            :return: The numbers of attempts of the rows kept in memory.
+        """
+        # Auxiliary variables.
+        start: int = self.flushed
+
+        return self.points[start:start + len(self.coverage)]
+
     def reset(self) -> None:
         """
             Resets ALL the statistics to their original value.
         """
         # Reset the parameters.
-        self.attempts = [HEADER_ATTEMPTS, (0, 0)]
-        self.coverage = [HEADER_COVERAGE, (0, 0)]
-
-    def update_statistics(self, lattice: list, successful: bool) -> None:
+        self.attempts = array(TYPECODE, [0])
+        self.coverage = array(TYPECODE, [0])
+
+        # Nothing has been attempted yet.
+        self.chunks = 0
+        self.current = 0
+        self.flushed = 0
+        self.index = 0
+        self.successful = 0
+        self._set_upcoming()
+
+    def update_statistics(self, lattice: Lattice, successful: bool) -> None:
         """
-            From the given lattice, updates the statistics, i.e., increases the
-            number of attempts by one and the corresponding quantities.
+            From the counters of the given lattice, updates the statistics,
+            i.e., increases the number of attempts by one and the corresponding
+            quantities.
 
-            :param lattice: The lattice with the particles.
+            :param lattice: The lattice object with the particles and the
+             counters.
 
             :param successful: A boolean flag indicating whether the adsorption
              attempt was successful. True, if the attempt was successful in
              adsorbing a particle; False, otherwise.
         """
-        # Update the coverage.
-        attempts: int = self.coverage[-1][0] + 1
-        self.coverage.append((attempts, _get_coverage(lattice)))
+        # Validate the counters against the full lattice, if requested.
+        if self.debug:
+            self._validate_counters(lattice)
+
+        # Update the number of attempts, and of successful attempts.
+        self.current += 1
+        self.successful += 1 if successful else 0
+
+        # Only record the statistics at the numbers of attempts of the
+        # schedule.
+        if self.current != self.upcoming:
+            return
 
-        # Update the number of successful attempts.
-        nsuccessful: int = self.attempts[-1][1] + (1 if successful else 0)
-        self.attempts.append((attempts, nsuccessful))
+        self.index += 1
+        self._set_upcoming()
+
+        # Update the coverage, and the number of successful attempts.
+        self.coverage.append(lattice.counters["occupied"])
+        self.attempts.append(self.successful)
+
+        # Hand the rows to the sink, if the tables are full.
+        self._flush_full()
 
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Dunder
@@ -184,12 +442,19 @@ class Statistics:
             f"     width: {self.periodic['width']}",
         ]) + "\n\n"
 
+        # The numbers of attempts of the rows kept in memory.
+        points: Sequence = self.get_points()
+
         # Append the strings.
         string += "Attempts:\n\n"
-        string += _get_string_table(self.attempts)
+        string += _get_string_table(
+            HEADER_ATTEMPTS, [points, self.attempts]
+        )
 
         string += "Coverage:\n\n"
-        string += _get_string_table(self.coverage)
+        string += _get_string_table(
+            HEADER_COVERAGE, [points, self.coverage]
+        )
 
         return string.strip()
 
@@ -205,9 +470,32 @@ class Statistics:
              information to record the statistics.
         """
         # Initialize the parameters.
-        self.attempts: list = [HEADER_ATTEMPTS, (0, 0)]
-        self.coverage: list = [HEADER_COVERAGE, (0, 0)]
+        self.attempts: array = array(TYPECODE, [0])
+        self.coverage: array = array(TYPECODE, [0])
 
         # Useful parameters.
+        self.backend: str = parameters["backend"]
+        self.debug: bool = parameters["debug"]
         self.dimensions: int = parameters["dimensions"]
         self.periodic: bool = parameters["periodic"]
+
+        # The statistics are only recorded at the numbers of attempts of the
+        # schedule.
+        self.schedule: Sequence = get_schedule(
+            parameters["attempts"], parameters["sampling"]
+        )
+        self.points: Sequence = get_points(
+            parameters["attempts"], parameters["sampling"]
+        )
+        self.current: int = 0
+        self.index: int = 0
+        self.successful: int = 0
+        self.upcoming: int = 0
+
+        self._set_upcoming()
+
+        # The rows are kept until the end of the run, unless a sink is set.
+        self.chunk: int = 0
+        self.chunks: int = 0
+        self.flushed: int = 0
+        self.sink: callable = None
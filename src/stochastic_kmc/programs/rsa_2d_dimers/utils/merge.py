@@ -0,0 +1,155 @@
+"""
+    Contains the functions and routines to merge the partial results of the
+    shards of a simulation.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import json
+
+from collections import Counter
+
+# User.
+from stochastic_kmc.programs.rsa_2d_dimers.classes.results import Results
+from stochastic_kmc.programs.rsa_2d_dimers.simulation import PROGRAM
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Simulation parameters that do not change the results, and can be different
+# in each shard.
+IGNORED: tuple = ("debug", "pool", "workers")
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _get_parameters(shard: dict) -> dict:
+    """
+        Gets the simulation parameters of the shard that must be the same in
+        all the shards.
+
+        :param shard: The dictionary loaded from the shard file.
+
+        :return: The dictionary with the simulation parameters that must match.
+    """
+    return {
+        x: y for x, y in shard["parameters"].items() if x not in IGNORED
+    }
+
+
+def _load_shard(file: str) -> dict:
+    """
+        Gets the dictionary loaded from the given JSON formatted shard file.
+
+        :param file: The path to the JSON file where the partial results of
+         the shard are saved.
+
+        :return: A dictionary with the loaded partial results.
+    """
+    # Load the file as is.
+    with open(file, encoding="utf-8", mode="r") as stream:
+        return json.load(stream)
+
+
+def _validate_shards(shards: list, files: list) -> None:
+    """
+        Validates that the shards are from the same simulation, and that,
+        together, they contain every repetition exactly once.
+
+        :param shards: The list of the dictionaries loaded from the shard
+         files.
+
+        :param files: The list of the paths to the shard files, in the same
+         order as the shards.
+
+        :raise ValueError: If there are no shards. If a shard is from another
+         program. If the simulation parameters of a shard do not match those
+         of the first shard. If a shard did not finish all its repetitions. If
+         a repetition is in more than one shard, or in none of them.
+    """
+    # There must be something to merge.
+    if len(shards) == 0:
+        raise ValueError("There must be at least one shard file to merge.")
+
+    # Auxiliary variables.
+    expected: dict = _get_parameters(shards[0])
+    repetitions: list = []
+
+    for shard, file in zip(shards, files):
+        # The shards must be of the same simulation.
+        if shard["_metadata"]["name"] != PROGRAM:
+            raise ValueError(
+                f"The shard file is not from the \"{PROGRAM}\" program; file: "
+                f"{file}, program: \"{shard['_metadata']['name']}\"."
+            )
+
+        if _get_parameters(shard) != expected:
+            raise ValueError(
+                f"The simulation parameters of the shard do not match those "
+                f"of the shard in {files[0]}; file: {file}, parameters: "
+                f"{_get_parameters(shard)}, expected parameters: {expected}."
+            )
+
+        # The shard must have finished all its repetitions.
+        current: range = range(shard["shard"]["start"], shard["shard"]["stop"])
+
+        if shard["results"]["simulations"] != len(current):
+            raise ValueError(
+                f"The shard did not finish all its repetitions; file: {file}, "
+                f"finished repetitions: {shard['results']['simulations']}, "
+                f"repetitions of the shard: {len(current)}."
+            )
+
+        repetitions.extend(current)
+
+    # Every repetition must be in a single shard.
+    total: int = expected["repetitions"]
+
+    if sorted(repetitions) != list(range(total)):
+        repeated: list = [x for x, y in Counter(repetitions).items() if y > 1]
+        missing: set = set(range(total)) - set(repetitions)
+
+        raise ValueError(
+            f"The shards must contain every repetition exactly once; "
+            f"repeated repetitions: {sorted(repeated)}, missing repetitions: "
+            f"{sorted(missing)}."
+        )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Main
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def merge_shards(files: list) -> Results:
+    """
+        Merges the partial results of the shards of a simulation.
+
+        :param files: The list of the paths to the shard files.
+
+        :return: The results of the whole simulation, before they are
+         processed.
+    """
+    # Load and validate the shards.
+    shards: list = [_load_shard(x) for x in files]
+
+    _validate_shards(shards, files)
+
+    # Add the partial results of every shard.
+    results: Results = Results(shards[0]["parameters"])
+
+    for shard in shards:
+        results.partial_add(shard["results"])
+
+    return results
@@ -13,12 +13,17 @@ import json
 
 from argparse import ArgumentParser, Namespace
 from importlib.resources import files as ifiles
+from pathlib import Path
 
 # User.
 from stochastic_kmc.programs.rsa_2d_nn_exclusion import configs
+from stochastic_kmc.programs.rsa_2d_nn_exclusion.classes.results import Results
 from stochastic_kmc.programs.rsa_2d_nn_exclusion.simulation import (
     PROGRAM, Simulation
 )
+from stochastic_kmc.programs.rsa_2d_nn_exclusion.utils.merge import (
+    merge_shards
+)
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -48,6 +53,29 @@ def _get_arguments() -> dict:
     )
 
     # Arguments: Optional.
+    parser.add_argument(
+        "-m",
+        "--merge",
+        default=None,
+        metavar="SHARD",
+        nargs="+",
+        help=(
+            "The names of the shard files, with the partial results, that "
+            "must be merged into the final results."
+        )
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="output.txt",
+        help=(
+            "The name of the file where the merged results are stored; only "
+            "used when merging shard files. If the file has a \".bin\" "
+            "extension, the results are saved as a binary container."
+        )
+    )
+
     parser.add_argument(
         "-p",
         "--print",
@@ -60,13 +88,20 @@ def _get_arguments() -> dict:
 
     # Get the arguments and validate them.
     arguments: Namespace = parser.parse_args()
+    used: tuple = (
+        arguments.file.strip() != "",
+        arguments.merge is not None,
+        arguments.print,
+    )
 
-    if arguments.file.strip() != "" and arguments.print:
+    if sum(used) > 1:
         raise ValueError(
             "Two arguments are being simultaneosly used, use one at a time."
         )
 
     return {
+        "merge": arguments.merge,
+        "output": arguments.output,
         "path": arguments.file,
         "print": arguments.print
     }
@@ -87,12 +122,38 @@ def _get_parameters(name: str) -> dict:
 
     # Read the parameters, if required.
     if name.strip() != "":
-        with open(name, encoding="uft-8", mode="r") as stream:
+        with open(name, encoding="utf-8", mode="r") as stream:
             parameters = json.load(stream)
 
     return parameters
 
 
+def _merge(files: list, output: str) -> None:
+    """
+        Merges the partial results of the shards of a simulation, and saves
+        the final results.
+
+        :param files: The list of the paths to the shard files.
+
+        :param output: The path to the file where the final results are
+         stored.
+    """
+    # Merge and process the statistics.
+    results: Results = merge_shards(files)
+    results.statistics_process()
+
+    # Save the results.
+    if Path(output).suffix == ".bin":
+        results.write_binary(output, PROGRAM)
+
+    else:
+        with open(output, encoding="utf-8", mode="w") as stream:
+            stream.write(f"{PROGRAM}\n\n")
+            results.write(stream)
+
+    print(f"Merged results have been saved in the file: {output}")
+
+
 def _print_parameters() -> None:
     """
         Prints the default parameters for the simulation.
@@ -139,6 +200,10 @@ def main() -> None:
         # Print the default parameters.
         _print_parameters()
 
+    elif arguments["merge"] is not None:
+        # Merge the shards of a simulation.
+        _merge(arguments["merge"], arguments["output"])
+
     else:
         # Create and run the simulation.
         _run(arguments["path"])
@@ -0,0 +1,290 @@
+"""
+    File that contains the class where to store the lattice as bit masks.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# User.
+from stochastic_kmc.programs.rsa_2d_nn_exclusion.classes.lattice import Lattice
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class BitLattice(Lattice):
+    """
+        Contains the variables to store the lattice of the simulation, where
+        each row is stored as the bits of an integer, i.e., one bit per site;
+        only meant for the standard engine.
+
+        PARAMETERS:
+        ___________
+
+        - self.available: Always None, the available sites are not kept.
+
+        - self.counters: A dictionary with the running number of occupied
+          sites, and of the sites where a particle can still be adsorbed;
+          updated locally every time a particle is adsorbed.
+
+        - self.dimensions: A dictionary with the "length" and the "width" of
+          the 2D lattice.
+
+        - self.full: The mask with the bits of all the sites of a row set.
+
+        - self.neighbors: Always None, the neighbors are computed from the
+          row and the column of every site; the parent methods that use the
+          tables, e.g., "_get_neighborhood", must not be called.
+
+        - self.periodic: A dictionary with the periodicity of the "length" and
+          the "width" of the 2D lattice.
+
+        - self.rows: The list with the mask of the occupied sites of each row;
+          the bit "j" of the mask is set if the site at column "j" is
+          occupied.
+
+        - self.sites: Always None, the sites are stored in the masks of the
+          rows.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Properties
+    # /////////////////////////////////////////////////////////////////////////
+
+    @property
+    def lattice(self) -> list:
+        """
+            The 2D copy of the lattice, i.e., a list with "length" rows of
+            "width" entries, unpacked from the bits of the rows.
+
+            :return: The list with the rows of the lattice.
+        """
+        # Auxiliary variables.
+        width: int = self.dimensions["width"]
+
+        return [[(row >> j) & 1 for j in range(width)] for row in self.rows]
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_available_mask(self, row: int) -> int:
+        """
+            Gets the mask of the sites of the given row where a particle can
+            still be adsorbed, from the shifted masks of the row and its
+            neighboring rows.
+
+            :param row: The index of the row.
+
+            :return: The mask with the bits of the available sites set.
+        """
+        # Auxiliary variables.
+        length: int = self.dimensions["length"]
+        width: int = self.dimensions["width"]
+        full: int = self.full
+
+        empty: int = full ^ self.rows[row]
+        mask: int = empty
+
+        # Neighbors along the row; those outside of the lattice do not block.
+        if self.periodic["width"]:
+            mask &= (empty << 1) | (empty >> (width - 1))
+            mask &= (empty >> 1) | ((empty & 1) << (width - 1))
+
+        else:
+            mask &= (empty << 1) | 1
+            mask &= (empty >> 1) | (1 << (width - 1))
+
+        # Neighbors in the previous and next rows.
+        for neighbor in (row - 1, row + 1):
+            if self.periodic["length"]:
+                neighbor %= length
+
+            if 0 <= neighbor < length:
+                mask &= full ^ self.rows[neighbor]
+
+        return mask & full
+
+    def _get_row_neighborhood(
+        self, site_length: int, site_width: int
+    ) -> list:
+        """
+            Gets the given site and its nearest neighbors that are inside the
+            lattice.
+
+            :param site_length: The row of the site.
+
+            :param site_width: The column of the site.
+
+            :return: The list with the [row, column] of the site and its
+             nearest neighbors inside the lattice; the given site is the first
+             entry.
+        """
+        # Auxiliary variables.
+        length: int = self.dimensions["length"]
+        width: int = self.dimensions["width"]
+        sites: list = [[site_length, site_width]]
+
+        for offset in Lattice.OFFSETS:
+            row: int = site_length + offset[0]
+            column: int = site_width + offset[1]
+
+            if self.periodic["length"]:
+                row %= length
+
+            if self.periodic["width"]:
+                column %= width
+
+            if 0 <= row < length and 0 <= column < width:
+                sites.append([row, column])
+
+        return sites
+
+    def _is_row_available(self, site_length: int, site_width: int) -> bool:
+        """
+            Determines if a particle can be adsorbed at the given site, i.e.,
+            the site and its nearest neighbors inside the lattice are empty.
+
+            :param site_length: The row of the site.
+
+            :param site_width: The column of the site.
+
+            :return: True, if a particle can be adsorbed at the site; False,
+             otherwise.
+        """
+        return all(
+            (self.rows[x] >> y) & 1 == Lattice.EMPTY
+            for x, y in self._get_row_neighborhood(site_length, site_width)
+        )
+
+    def _set_sites(self) -> None:
+        """
+            Sets the masks of the rows of an empty lattice; replaces the flat
+            array of the sites, and the tables of the nearest neighbors, of
+            the parent class, that take one byte, and several integers, per
+            site.
+        """
+        self.full = (1 << self.dimensions["width"]) - 1
+        self.rows = [0 for _ in range(self.dimensions["length"])]
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def get_dictionary(self) -> dict:
+        """
+            Returns a dictionary with the COMPLETE parameters of the
+            simulation.
+        """
+        return {
+            "available": self.available,
+            "counters": self.counters,
+            "dimensions": self.dimensions,
+            "periodic": self.periodic,
+            "rows": self.rows,
+        }
+
+    def get_mask_counters(self) -> dict:
+        """
+            Gets the counters from the masks of all the rows, i.e., the number
+            of set bits of the occupied and the available masks of each row.
+
+            :return: The dictionary with the counters obtained from the masks.
+        """
+        return {
+            "available": sum(
+                self._get_available_mask(i).bit_count()
+                for i in range(len(self.rows))
+            ),
+            "occupied": sum(row.bit_count() for row in self.rows),
+        }
+
+    def particle_adsorb(self, site_length: list, site_width: list) -> bool:
+        """
+            Attempts to adsorb the particles at the given sites.
+
+            :param site_length: The site along the length of the lattice where
+             the adsorption is inteded to take place.
+
+            :param site_width: The site along the width of the lattice where
+             the adsorption is inteded to take place.
+
+            :return: A boolean flag that indicates whether ALL the particles
+             were adsorbed, i.e., the requested sites are within the lattice
+             and empty.
+        """
+        # Auxiliary variables.
+        length: int = self.dimensions["length"]
+        width: int = self.dimensions["width"]
+
+        # All sites must be valid.
+        if not 0 <= site_length < length:
+            raise ValueError(
+                f"The row adsorption site for a particle to adsorb is not in "
+                f"the proper range; the site must be inside the lattice "
+                f"(0 <= site_length < {length}); site_length = {site_length}."
+            )
+
+        if not 0 <= site_width < width:
+            raise ValueError(
+                f"The column adsorption site for a particle to adsorb is not "
+                f"in the proper range; the site must be inside the lattice "
+                f"(0 <= site_width < {width}); site_width = {site_width}."
+            )
+
+        # Check all the sites.
+        sites: list = self._get_row_neighborhood(site_length, site_width)
+
+        flag: bool = all(
+            (self.rows[x] >> y) & 1 == Lattice.EMPTY for x, y in sites
+        )
+
+        # Set the site to occupied if it can adsorb.
+        if flag:
+            # The site and its neighbors are no longer available.
+            for site in sites:
+                if self._is_row_available(*site):
+                    self.counters["available"] -= 1
+
+            self.rows[site_length] |= 1 << site_width
+            self.counters["occupied"] += 1
+
+        return flag
+
+    def reset(self) -> None:
+        """
+            Resets the lattice to an empty lattice.
+        """
+        # Reset to an empty lattice.
+        self.rows = [0 for _ in range(self.dimensions["length"])]
+
+        self._reset_counters()
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, parameters: dict) -> None:
+        """
+            Constructor for the object.
+
+            :param parameters: The simulation parameters that contains all the
+             information to create the lattice, and perform the lattice
+             operations.
+        """
+        # The bit masks do not keep the set of the available sites.
+        if parameters["engine"] != "standard":
+            raise ValueError(
+                f"The bit lattice can only be used with the \"standard\" "
+                f"engine; requested engine: \"{parameters['engine']}\"."
+            )
+
+        # The masks of the rows.
+        self.full: int = 0
+        self.rows: list = []
+
+        super().__init__(parameters)
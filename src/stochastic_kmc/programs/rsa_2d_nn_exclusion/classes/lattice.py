@@ -3,6 +3,18 @@
 """
 
 
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+from array import array
+
+# User.
+from stochastic_kmc.utilities.sampling import IndexedSet
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Classes
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -15,14 +27,27 @@ class Lattice:
         PARAMETERS:
         ___________
 
-        - self.lattice: The 2D array that contains the particles with "length"
-          rows of "width" number of entries.
+        - self.available: The set of sites, numbered "row * width + column",
+          where a particle can still be adsorbed; only kept for the rejection
+          free engine, None otherwise.
+
+        - self.counters: A dictionary with the running number of occupied
+          sites, and of the sites where a particle can still be adsorbed;
+          updated locally every time a particle is adsorbed.
 
         - self.dimensions: A dictionary with the "length" and the "width" of
           the 2D lattice.
 
+        - self.neighbors: The tuple with the tables of the nearest neighbors
+          of every site, one table for each entry of "OFFSETS"; the entry is
+          "OFF" if the neighbor is outside of the lattice.
+
         - self.periodic: A dictionary with the periodicity of the "length" and
           the "width" of the 2D lattice.
+
+        - self.sites: The flat array of bytes that contains the particles, one
+          byte per site, where the site at a given row and column is numbered
+          "row * width + column".
     """
     # /////////////////////////////////////////////////////////////////////////
     # Class Variables
@@ -32,6 +57,144 @@ class Lattice:
     EMPTY: int = 0
     OCCUPIED: int = 1
 
+    # Neighbor of a site that is outside of the lattice.
+    OFF: int = -1
+
+    # (row, column) offsets of the nearest neighbors of a site.
+    OFFSETS: tuple = (-1, 0), (1, 0), (0, -1), (0, 1)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Properties
+    # /////////////////////////////////////////////////////////////////////////
+
+    @property
+    def lattice(self) -> list:
+        """
+            The 2D view of the lattice, i.e., a list with "length" rows of
+            "width" entries, that share the memory with the flat array of
+            sites.
+
+            :return: The list with the rows of the lattice.
+        """
+        # Auxiliary variables.
+        view: memoryview = memoryview(self.sites)
+        width: int = self.dimensions["width"]
+
+        return [
+            view[i:i + width] for i in range(0, len(self.sites), width)
+        ]
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_neighbor_table(self, offset: tuple) -> array:
+        """
+            Gets the table with the neighbor of every site at the given offset,
+            considering the periodicity of the lattice.
+
+            :param offset: The (row, column) offset of the neighbor.
+
+            :return: The array with the number of the neighbor of every site;
+             "OFF" if the neighbor is outside of the lattice.
+        """
+        # Auxiliary variables.
+        length: int = self.dimensions["length"]
+        width: int = self.dimensions["width"]
+        table: array = array("q", [Lattice.OFF]) * (length * width)
+
+        # Find the neighbor of every site.
+        for i in range(length):
+            for j in range(width):
+                row: int = i + offset[0]
+                column: int = j + offset[1]
+
+                if self.periodic["length"]:
+                    row %= length
+
+                if self.periodic["width"]:
+                    column %= width
+
+                if 0 <= row < length and 0 <= column < width:
+                    table[i * width + j] = row * width + column
+
+        return table
+
+    def _get_neighborhood(self, site: int) -> list:
+        """
+            Gets the given site and its nearest neighbors that are inside the
+            lattice.
+
+            :param site: The number of the site.
+
+            :return: The list with the numbers of the site and its nearest
+             neighbors inside the lattice; the given site is the first entry.
+        """
+        # Auxiliary variables.
+        sites: list = [site]
+
+        for table in self.neighbors:
+            if table[site] != Lattice.OFF:
+                sites.append(table[site])
+
+        return sites
+
+    def _is_available(self, site: int) -> bool:
+        """
+            Determines if a particle can be adsorbed at the given site, i.e.,
+            the site and its nearest neighbors inside the lattice are empty.
+
+            :param site: The number of the site.
+
+            :return: True, if a particle can be adsorbed at the site; False,
+             otherwise.
+        """
+        return all(
+            self.sites[x] == Lattice.EMPTY
+            for x in self._get_neighborhood(site)
+        )
+
+    def _reset_available(self) -> None:
+        """
+            Resets the set of available sites to that of an empty lattice.
+        """
+        # Only kept for the rejection free engine.
+        if self.available is None:
+            return
+
+        # Auxiliary variables.
+        total_sites: int = self.dimensions["length"] * self.dimensions["width"]
+
+        # All the sites are available.
+        self.available.clear()
+
+        for site in range(total_sites):
+            self.available.add(site)
+
+    def _reset_counters(self) -> None:
+        """
+            Resets the counters to those of an empty lattice.
+        """
+        # All the sites are available.
+        self.counters = {
+            "available": self.dimensions["length"] * self.dimensions["width"],
+            "occupied": 0,
+        }
+
+    def _set_sites(self) -> None:
+        """
+            Sets the flat array of the sites of an empty lattice, and the
+            tables of the nearest neighbors of every site.
+        """
+        self.sites = bytearray((Lattice.EMPTY,)) * (
+            self.dimensions["length"] * self.dimensions["width"]
+        )
+
+        # The nearest neighbors are only computed once.
+        self.neighbors = tuple(
+            self._get_neighbor_table(offset) for offset in Lattice.OFFSETS
+        )
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods
     # /////////////////////////////////////////////////////////////////////////
@@ -42,9 +205,12 @@ class Lattice:
             simulation.
         """
         return {
+            "available": self.available,
+            "counters": self.counters,
             "dimensions": self.dimensions,
-            "lattice": self.lattice,
+            "neighbors": self.neighbors,
             "periodic": self.periodic,
+            "sites": self.sites,
         }
 
     def get_lattice_string(self, partial: bool = False) -> str:
@@ -101,6 +267,16 @@ class Lattice:
 
         return string + "\n\n"
 
+    def is_jammed(self) -> bool:
+        """
+            Determines if the lattice is jammed, i.e., no more particles can be
+            adsorbed, from the running counters.
+
+            :return: True, if no more particles can be adsorbed; False,
+             otherwise.
+        """
+        return self.counters["available"] == 0
+
     def particle_adsorb(self, site_length: list, site_width: list) -> bool:
         """
             Attempts to adsorb the particles at the given sites.
@@ -135,34 +311,24 @@ class Lattice:
                 f"(0 <= site_width < {width}); site_width = {site_width}."
             )
 
-        # Neighboring sites.
-        sites: list = [
-            [site_length, site_width],
-            [site_length - 1, site_width],
-            [site_length + 1, site_width],
-            [site_length, site_width - 1],
-            [site_length, site_width + 1]
-        ]
-
-        # Fix the sites.
-        if self.periodic["length"]:
-            sites[1][0] = length - 1 if sites[1][0] < 0 else sites[1][0]
-            sites[2][0] = sites[2][0] % length
-
-        if self.periodic["width"]:
-            sites[3][1] = width - 1 if sites[3][1] < 0 else sites[3][1]
-            sites[4][1] = sites[4][1] % width
-
         # Check all the sites.
-        for site in sites:
-            if site[0] not in range(length) or site[1] not in range(width):
-                continue
+        sites: list = self._get_neighborhood(site_length * width + site_width)
 
-            flag = flag and self.lattice[site[0]][site[1]] == Lattice.EMPTY
+        for site in sites:
+            flag = flag and self.sites[site] == Lattice.EMPTY
 
         # Set the site to occupied if it can adsorb.
         if flag:
-            self.lattice[site_length][site_width] = Lattice.OCCUPIED
+            # The site and its neighbors are no longer available.
+            for site in sites:
+                if self._is_available(site):
+                    self.counters["available"] -= 1
+
+                if self.available is not None:
+                    self.available.discard(site)
+
+            self.sites[sites[0]] = Lattice.OCCUPIED
+            self.counters["occupied"] += 1
 
         return flag
 
@@ -171,9 +337,10 @@ class Lattice:
             Resets the lattice to an empty lattice.
         """
         # Reset to an empty lattice.
-        for i in range(self.dimensions["length"]):
-            for j in range(self.dimensions["width"]):
-                self.lattice[i][j] = Lattice.EMPTY
+        self.sites[:] = bytes((Lattice.EMPTY,)) * len(self.sites)
+
+        self._reset_available()
+        self._reset_counters()
 
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Dunder
@@ -216,7 +383,19 @@ class Lattice:
         self.periodic: bool = parameters["periodic"]
 
         # Update the lattice.
-        self.lattice: list = [
-            [Lattice.EMPTY for _ in range(self.dimensions["width"])]
-            for _ in range(self.dimensions["length"])
-        ]
+        self.neighbors: tuple = None
+        self.sites: bytearray = None
+
+        self._set_sites()
+
+        # Set the counters and the available sites.
+        self.available: IndexedSet = None
+        self.counters: dict = {}
+
+        if parameters["engine"] == "rejection_free":
+            self.available = IndexedSet(
+                self.dimensions["length"] * self.dimensions["width"]
+            )
+
+        self._reset_available()
+        self._reset_counters()
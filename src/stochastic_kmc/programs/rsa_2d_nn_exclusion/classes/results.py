@@ -9,12 +9,28 @@
 
 
 # Standard library.
+import bisect
+import contextlib
+import io
+import math
+import operator
+import shutil
+import tempfile
+
+from array import array
 from datetime import datetime
+from itertools import repeat
+from typing import Iterable, Sequence, TextIO
 
 # User.
 from stochastic_kmc.programs.rsa_2d_nn_exclusion.classes.statistics import (
+    HEADER_ATTEMPTS,
+    HEADER_COVERAGE,
     Statistics
 )
+from stochastic_kmc.utilities.columns import TYPECODE
+from stochastic_kmc.utilities.container import write_container
+from stochastic_kmc.utilities.schedule import get_points
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -22,15 +38,68 @@ from stochastic_kmc.programs.rsa_2d_nn_exclusion.classes.statistics import (
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+# Number of entries of a line formatted, and written, at once.
+BLOCK: int = 65536
+
+# Number of characters of a line kept in memory before it is spooled to disk.
+SPOOL: int = 2 ** 24
+
 # Date format
 DFORMAT: str = "%Y-%m-%d %H:%M:%S"
 
+# Headers of the standard error, and of the number of samples, of the
+# processed statistics tables.
+HEADER_ERROR: str = "Standard Error"
+HEADER_SAMPLES: str = "Samples"
+
+# Header of the seeds table.
+HEADER_SEEDS: tuple = ("Repetition", "Seed")
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions - Auxiliary
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def _add_columns(
+    target: Sequence, current: Sequence, offset: int = 0
+) -> None:
+    """
+        Adds the entries of the current column to those of the target column,
+        in place, starting at the given entry of the target.
+
+        :param target: The target column to update; either an array, or a list
+         of integers, e.g., the unbounded sums of the squares.
+
+        :param current: The column with which to update the target.
+
+        :param offset: The number of entries of the target before the first
+         entry of the current column.
+
+        :raise ValueError: If the current column goes past the end of the
+         target column.
+    """
+    # Auxiliary variables.
+    stop: int = offset + len(current)
+
+    # Validate the current column fits in the target column.
+    if stop > len(target):
+        raise ValueError(
+            f"The current column has more time stamps than the target column; "
+            f"target column length: {len(target)}, current column length: "
+            f"{stop}."
+        )
+
+    # Update the entries for each time stamp.
+    entries: map = map(operator.add, target[offset:stop], current)
+
+    if isinstance(target, array):
+        target[offset:stop] = array(target.typecode, entries)
+        return
+
+    target[offset:stop] = list(entries)
+
+
 def _get_header(text: str) -> str:
     """
         Gets the header for the given section.
@@ -62,102 +131,142 @@ def _get_string_dictionary(parameters: dict) -> str:
     string += "\n".join((
         f"Date (YYYY-MM-DD hh:mm:ss): {date}",
         f"Attempts: {parameters['attempts']}",
+        f"Backend: {parameters['backend']}",
         "Dimensions:",
         f"    Length: {parameters['dimensions']['length']}",
         f"    Width: {parameters['dimensions']['width']}",
+        f"Engine: {parameters['engine']}",
         "Periodic:",
         f"    Length: {parameters['periodic']['length']}",
         f"    Width: {parameters['periodic']['width']}",
+        f"Pool: {parameters['pool']}",
         f"Repetitions: {parameters['repetitions']}",
+        "Sampling:",
+        f"    Number: {parameters['sampling']['number']}",
+        f"    Points: {parameters['sampling']['points']}",
+        f"    Scale: {parameters['sampling']['scale']}",
+        f"    Step: {parameters['sampling']['step']}",
         f"Seed: {parameters['seed']}",
+        f"Workers: {parameters['workers']}",
     ))
 
     return f"{string}\n\n"
 
 
-def _get_string_table(table: list) -> str:
+def _get_squares(column: Sequence) -> list:
     """
-        Gets the string for the given table.
+        Gets the squares of the entries of the given column, as Python
+        integers, so the sums of the squares never overflow.
 
-        :param array: The table for which the string must be obtained.
+        :param column: The column with the entries to square.
 
-        :return: A list of the widths of each table column entry.
+        :return: The list with the square of every entry of the column.
     """
-    # Auxiliary variables.
-    string: str = ""
-    tostr: callable = "{:>{width}}".format
-
-    # Set the string.
-    if len(table) <= 1:
-        # No data to show.
-        string += "No data to show.\n"
+    return list(map(operator.mul, column, column))
 
-    else:
-        # Table dimensions
-        table_length: int = len(table)
-        table_width: int = len(table[0])
 
-        # List of widths.
-        widths: list = _get_widths(table)
+def _get_standard_errors(
+    totals: Sequence, squares: Sequence, samples: int
+) -> Iterable:
+    """
+        Gets the standard errors of the means of a quantity, at every time
+        stamp, from the exact sums of the quantity, and of its squares, over
+        the samples; the variances are taken from integers, so no precision is
+        lost when a variance is small compared to the square of the mean.
 
-        for i in range(table_width):
-            string += " | ".join(
-                tostr(table[j][i], width=w)
-                for j, w in zip(range(table_length), widths)
-            ) + "\n"
+        :param totals: The sums of the quantity over the samples.
 
-    return f"{string}\n"
+        :param squares: The sums of the squares of the quantity over the
+         samples. None, if the sums of the squares are not known.
 
+        :param samples: The number of samples.
 
-def _get_widths(table: list) -> tuple:
+        :return: The standard error of the mean at every time stamp; not a
+         number (NaN), if there are less than two samples, or the sums of the
+         squares are not known.
     """
-        Gets the maximum width for each column of the given table.
+    # The variance is not defined.
+    if samples < 2 or squares is None:
+        return repeat(math.nan, len(totals))
+
+    # Unbiased variances of the samples, over the number of samples.
+    differences: map = map(
+        operator.sub,
+        map(operator.mul, squares, repeat(samples)),
+        map(operator.mul, totals, totals)
+    )
+
+    return map(math.sqrt, map(
+        operator.truediv, differences,
+        repeat(samples * samples * (samples - 1))
+    ))
 
-        :param array: The table for which the column widths must be obtained.
 
-        :return: A list of the widths of each table column entry.
+def _get_widths(entries: list) -> list:
     """
-    # Auxiliary variables.
-    if len(table) == 0:
-        return tuple()
+        Gets the maximum width of the entries of the given columns at each
+        time stamp.
 
-    return tuple(max(len(f"{x}") for x in entry) for entry in table)
+        :param entries: The list with the strings of the entries of every
+         column; all the columns must have the same length.
+
+        :return: The list with the width of the widest entry at every time
+         stamp.
+    """
+    return list(map(max, repeat(0), *(map(len, x) for x in entries)))
 
 
-def _update_results(target: list, current: list) -> None:
+def _write_table(stream: TextIO, header: tuple, columns: list) -> None:
     """
-        Updates the target with the current list.
+        Writes the table with the given columns to the stream; every column is
+        written as a line, that starts with its header. The entries are
+        formatted once, in blocks of time stamps; the first line is written
+        straight to the stream, and the others are spooled, and copied after
+        it, so the lines are never kept whole in memory.
 
-        :param target: The target list to update with the current list.
+        :param stream: The text stream where the table is written.
 
-        :param current: The list with which to update the current list.
+        :param header: The tuple with the header of every column.
 
-        :raise ValueError: If the time stamps in the current list are different
-         from those in the target list.
+        :param columns: The list with the sequences of the entries of every
+         column; all the columns must have the same length.
     """
-    # Validate the lists have similar number of time stamps.
-    if len(target) != len(current):
-        raise ValueError(
-            f"The target list length is different from the current list "
-            f"length; target list length: {len(target)}, current list length: "
-            f"{len(current)}."
-        )
+    # No data to show.
+    if len(columns[0]) == 0:
+        stream.write("No data to show.\n")
+        return
 
-    # Attempt to merge the statistics.
-    for i, (x, y) in enumerate(zip(target, current)):
-        # No need to update the header.
-        if i == 0:
-            continue
+    # Auxiliary variables.
+    first: int = max(len(f"{x}") for x in header)
 
-        # Time stamps must be the same.
-        if x[0] != y[0]:
-            raise ValueError(
-                f"There are time stamps that do not match; time stamp of "
-                f"current: {x[0]}, time stamp of current: {y[0]}."
-            )
+    with contextlib.ExitStack() as stack:
+        # The first line goes straight to the stream.
+        targets: list = [stream, *(
+            stack.enter_context(tempfile.SpooledTemporaryFile(
+                max_size=SPOOL, mode="w+", encoding="utf-8"
+            )) for _ in columns[1:]
+        )]
+
+        for target, name in zip(targets, header):
+            target.write(f"{name}".rjust(first))
+
+        for start in range(0, len(columns[0]), BLOCK):
+            # Auxiliary variables.
+            entries: list = [
+                list(map(str, x[start:start + BLOCK])) for x in columns
+            ]
+            widths: list = _get_widths(entries)
+
+            for target, line in zip(targets, entries):
+                target.write(f" | {' | '.join(map(str.rjust, line, widths))}")
 
-        # Update the entries for each time stamp.
-        target[i][1] += y[1]
+        # Copy the spooled lines.
+        stream.write("\n")
+
+        for target in targets[1:]:
+            target.write("\n")
+            target.seek(0)
+            shutil.copyfileobj(target, stream)
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -172,14 +281,95 @@ class Results:
         PARAMETERS:
         ___________
 
-        - self.attempts: The array with the statistics of the number of
-          attempts and successful attempts.
+        - self.attempts: The array with the sums, over the simulations, of the
+          number of successful attempts at every time stamp; their means, once
+          the statistics are processed.
+
+        - self.coverage: The array with the sums, over the simulations, of the
+          total number of particles at every time stamp; their means, once the
+          statistics are processed.
+
+        - self.errors: A dictionary with the arrays of the standard errors of
+          the means, at every time stamp, once the statistics are processed;
+          the keys are the names of the statistics tables.
+
+        - self.headers: A dictionary with the headers of the columns of every
+          statistics table, by the name of the table.
 
-        - self.coverage: The array with the total number of particles and the
-          inverse elapsed time, i.e., the number of attempts.
+        - self.points: The numbers of attempts of every time stamp, shared by
+          all the statistics tables; the elapsed times, once the statistics
+          are processed.
+
+        - self.seeds: The table with the seed of the random stream of each
+          repetition, in the order of the repetitions.
 
         - self.simulations: The number of simulations stored.
+
+        - self.squares: A dictionary with the lists of the sums of the
+          squares of the quantities, after each number of attempts, over the
+          simulations, as unbounded integers; the keys are the names of the
+          statistics tables. None, if the squares are not known, e.g., if the
+          sums of some simulations were added without them.
     """
+    # /////////////////////////////////////////////////////////////////////////
+    # Class Variables
+    # /////////////////////////////////////////////////////////////////////////
+
+    # Headers of the statistics tables, by the name of the table.
+    HEADERS: dict = {
+        "attempts": HEADER_ATTEMPTS,
+        "coverage": HEADER_COVERAGE,
+    }
+
+    # Titles of the sections of the statistics tables, by the name of the
+    # table.
+    TITLES: dict = {
+        "attempts": "Attempts",
+        "coverage": "Coverage",
+    }
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _add_squares(self, squares: dict) -> None:
+        """
+            Adds the sums of the squares of the quantities, over several
+            simulations, to the sums of the squares; they are no longer known
+            if the given sums of the squares are not known.
+
+            :param squares: A dictionary with the sequences of the sums of the
+             squares of each quantity, after each number of attempts; the keys
+             are the names of the statistics tables. None, if the squares are
+             not known.
+        """
+        # Nothing else to add.
+        if squares is None or self.squares is None:
+            self.squares = None
+            return
+
+        for name in Results.HEADERS:
+            _add_columns(self.squares[name], squares[name])
+
+    def _get_columns(self, name: str) -> list:
+        """
+            Gets the columns of the given statistics table, i.e., the time
+            stamps and the quantity; followed by the standard error and the
+            number of samples, once the statistics are processed.
+
+            :param name: The name of the statistics table.
+
+            :return: The list with the columns of the table.
+        """
+        # Auxiliary variables.
+        columns: list = [self.points, getattr(self, name)]
+
+        if name in self.errors:
+            columns.append(self.errors[name])
+            columns.append([self.simulations] * len(self.points))
+
+        return columns
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods
     # /////////////////////////////////////////////////////////////////////////
@@ -191,67 +381,304 @@ class Results:
         """
         return {
             "simulations": self.simulations,
+            "seeds": self.seeds,
+            "squares": self.squares,
+            "errors": self.errors,
+            "headers": self.headers,
+            "points": self.points,
             "attempts": self.attempts,
             "coverage": self.coverage,
         }
 
+    def get_partial(self) -> dict:
+        """
+            Gets the partial results, i.e., the raw sums of the quantities, and
+            of their squares, over the simulations, before they are processed,
+            together with the number of simulations and their seeds.
+
+            :return: The dictionary with the partial results, that can be
+             added to other results with the "partial_add" method.
+        """
+        # Auxiliary variables.
+        squares: dict = self.squares
+
+        return {
+            "simulations": self.simulations,
+            "seeds": [list(x) for x in self.seeds[1:]],
+            "sums": {x: getattr(self, x).tolist() for x in Results.HEADERS},
+            "squares": None if squares is None else {
+                x: list(y) for x, y in squares.items()
+            },
+        }
+
+    def partial_add(self, partial: dict) -> None:
+        """
+            Adds the partial results, from the "get_partial" method, of other
+            results before they are processed, e.g., those of another shard of
+            the simulation.
+
+            :param partial: The dictionary with the partial results.
+        """
+        # Nothing to add.
+        if partial["simulations"] == 0:
+            return
+
+        self.statistics_add_sums(
+            partial["sums"], partial["simulations"], partial["squares"]
+        )
+
+        for repetition, seed in partial["seeds"]:
+            self.seeds_add(repetition, seed)
+
+    def results_add(self, results: "Results") -> None:
+        """
+            Adds the statistics, and the seeds, of other results before they
+            are processed, e.g., those of the repetitions run by a worker
+            process. For this method to process, the statistics arrays must
+            contain the same time stamps.
+
+            :param results: A Results object that contains the statistics,
+             not processed, of one or more runs.
+        """
+        # Nothing to add.
+        if results.simulations == 0:
+            return
+
+        # Update the statistics.
+        for name in Results.HEADERS:
+            _add_columns(getattr(self, name), getattr(results, name))
+
+        # Keep the seeds in the order of the repetitions.
+        for repetition, seed in results.seeds[1:]:
+            self.seeds_add(repetition, seed)
+
+        # Sum the squares of the quantities.
+        self._add_squares(results.squares)
+
+        # Upgrade the number of simulation.
+        self.simulations += results.simulations
+
+    def seeds_add(self, repetition: int, seed: int) -> None:
+        """
+            Records the seed of the random stream of the given repetition, in
+            the order of the repetitions.
+
+            :param repetition: The index of the repetition.
+
+            :param seed: The seed of the random stream of the repetition.
+        """
+        bisect.insort(self.seeds, [repetition, seed], lo=1)
+
     def statistics_add(self, statistics: Statistics) -> None:
         """
             Adds more statistics to the results before they are processed. For
             this method to process, the statistics arrays must contain the same
-            time stamps.
+            time stamps; the rows the statistics already handed over, in
+            chunks, are not added again.
 
             :param statistics: A Statistics object that contains the
              statistiscs of a SINGLE run.
+
+            :raise ValueError: If the run has a different number of time
+             stamps than the results.
         """
-        # Extract the statistics.
-        if self.simulations == 0:
-            # Initialize the statistics.
-            self.attempts = [list(x) for x in statistics.attempts]
-            self.coverage = [list(x) for x in statistics.coverage]
+        # Auxiliary variables.
+        length: int = statistics.flushed + len(statistics.coverage)
+
+        # Validate the run has every time stamp.
+        if length != len(self.points):
+            raise ValueError(
+                f"The number of time stamps of the run is different from that "
+                f"of the results; time stamps of the results: "
+                f"{len(self.points)}, time stamps of the run: {length}."
+            )
 
-        else:
-            # Update the statistics.
-            _update_results(self.attempts, statistics.attempts)
-            _update_results(self.coverage, statistics.coverage)
+        # Add the rows kept by the statistics.
+        self.statistics_add_rows(statistics)
 
         # Upgrade the number of simulation.
         self.simulations += 1
 
+    def statistics_add_rows(self, statistics: Statistics) -> None:
+        """
+            Adds the rows kept by the statistics of a SINGLE run, that might
+            not be finished yet, to the results before they are processed; the
+            rows come after those the statistics already handed over, e.g., in
+            the chunks streamed during the run. The number of simulations is
+            not updated.
+
+            :param statistics: A Statistics object that contains the
+             statistiscs of a SINGLE run.
+        """
+        # Auxiliary variables.
+        offset: int = statistics.flushed
+
+        for name in Results.HEADERS:
+            # Auxiliary variables.
+            column: array = getattr(statistics, name)
+
+            _add_columns(getattr(self, name), column, offset)
+
+            # Sum the squares of the quantities.
+            if self.squares is not None:
+                _add_columns(self.squares[name], _get_squares(column), offset)
+
+    def statistics_add_sums(
+        self, sums: dict, simulations: int, squares: dict = None
+    ) -> None:
+        """
+            Adds more statistics, already summed over several simulations,
+            before they are processed. For this method to process, the sums
+            must contain the same time stamps as the statistics.
+
+            :param sums: A dictionary with the sequences of each quantity,
+             summed over the simulations, before the first attempt, and after
+             each number of attempts of the sampling schedule; the keys are the
+             names of the statistics tables.
+
+            :param simulations: The number of simulations in the sums.
+
+            :param squares: A dictionary with the sequences of the sums of the
+             squares of each quantity, after each number of attempts, with the
+             same keys as the sums. None, if the squares are not known.
+
+            :raise ValueError: If the sums have a different number of time
+             stamps than the results.
+        """
+        for name in Results.HEADERS:
+            # Validate the sums have every time stamp.
+            if len(sums[name]) != len(self.points):
+                raise ValueError(
+                    f"The number of time stamps of the sums is different "
+                    f"from that of the results; time stamps of the results: "
+                    f"{len(self.points)}, time stamps of the sums: "
+                    f"{len(sums[name])}."
+                )
+
+            _add_columns(getattr(self, name), sums[name])
+
+        # Sum the squares of the quantities.
+        self._add_squares(squares)
+
+        # Upgrade the number of simulation.
+        self.simulations += simulations
+
     def statistics_process(self) -> None:
         """
-            Processes the statistics to give the final results.
+            Processes the statistics to give the final results, i.e., after
+            each elapsed time, the mean of every quantity over the simulations,
+            its standard error, and the number of simulations.
         """
         # Auxiliary variables.
         header_0: str = "Time Elapsed"
         pore_length: int = self.parameters["dimensions"]["length"]
         pore_width: int = self.parameters["dimensions"]["width"]
 
-        length_stat: int = len(self.attempts)
         total_sites: int = pore_length * pore_width
-        denominator: int = self.simulations * total_sites
+        simulations: int = self.simulations
+
+        # The number of attempts of every time stamp, at least one.
+        attempts: list = list(map(max, self.points, repeat(1)))
 
         # For each quantity.
-        for i in range(length_stat):
-            # Fix the elapsed time.
-            if i == 0:
-                self.attempts[i][0] = header_0
-                self.coverage[i][0] = header_0
+        for name, header in Results.HEADERS.items():
+            # Auxiliary variables.
+            column: array = getattr(self, name)
+            squares: Sequence = (
+                None if self.squares is None else self.squares[name]
+            )
+            unit: str = (
+                " / Attempts" if name == "attempts" else " / (Length * Width)"
+            )
+
+            # The quantities are divided by the number of attempts, or by the
+            # number of sites.
+            numbers: list = (
+                attempts if name == "attempts"
+                else [total_sites] * len(column)
+            )
+
+            # Fix the header.
+            self.headers[name] = (
+                header_0, f"{header[1]}{unit}", HEADER_ERROR, HEADER_SAMPLES
+            )
+
+            # Average the simulations, and get the standard errors.
+            errors: Iterable = _get_standard_errors(
+                column, squares, simulations
+            )
+            self.errors[name] = array(
+                "d", map(operator.truediv, errors, numbers)
+            )
+            setattr(self, name, array("d", map(
+                operator.truediv, column,
+                map(operator.mul, numbers, repeat(simulations))
+            )))
+
+        # Turn attempts into elapsed time.
+        self.points = array(
+            "d", map(operator.truediv, self.points, repeat(total_sites))
+        )
+
+    def write(self, stream: TextIO) -> None:
+        """
+            Writes the results to the given text stream, one block of entries
+            at a time, without building the whole string.
+
+            :param stream: The text stream where the results are written.
+        """
+        # Parameters.
+        stream.write(_get_string_dictionary(self.parameters))
+
+        # Append the tables.
+        stream.write(f"{_get_header('Seeds')}\n")
+        _write_table(stream, HEADER_SEEDS, [
+            [x for x, _ in self.seeds[1:]], [y for _, y in self.seeds[1:]]
+        ])
 
-                self.attempts[i][1] += " / Attempts"
-                self.coverage[i][1] += " / (Length * Width)"
+        for name, title in Results.TITLES.items():
+            stream.write(f"\n{_get_header(title)}\n")
+            _write_table(stream, self.headers[name], self._get_columns(name))
 
-                continue
+    def write_binary(self, file: str, program: str) -> None:
+        """
+            Writes the processed results to a binary container in the given
+            file, with the parameters, the headers and the number of
+            simulations as its metadata, and the time stamps, the means and
+            the standard errors of every quantity, and the seeds, as columns.
+
+            :param file: The path to the file where the container is saved.
+
+            :param program: The name of the program that ran the simulations.
 
-            # Average the simulations.
-            number: int = self.attempts[i][0] * self.simulations
+            :raise ValueError: If the statistics have not been processed.
+        """
+        # The means and the errors are only known after processing.
+        if len(self.errors) == 0:
+            raise ValueError(
+                "The statistics must be processed before the results are "
+                "written to a binary container."
+            )
 
-            self.attempts[i][1] /= number if number != 0 else 1
-            self.coverage[i][1] /= denominator
+        # Auxiliary variables.
+        metadata: dict = {
+            "name": program,
+            "date": f"{datetime.now().strftime(DFORMAT)}",
+            "parameters": self.parameters,
+            "simulations": self.simulations,
+            "headers": self.headers,
+        }
+        columns: dict = {
+            "points": self.points,
+            "repetitions": array("q", [x for x, _ in self.seeds[1:]]),
+            "seeds": array("Q", [y for _, y in self.seeds[1:]]),
+        }
 
-            # Turn attempts into elapsed time.
-            self.attempts[i][0] /= total_sites
-            self.coverage[i][0] /= total_sites
+        for name in Results.HEADERS:
+            columns[name] = getattr(self, name)
+            columns[f"{name}_error"] = self.errors[name]
+
+        write_container(file, metadata, columns)
 
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Dunder
@@ -263,17 +690,12 @@ class Results:
 
             :return: The string with the class representation.
         """
-        # Parameters.
-        string: str = _get_string_dictionary(self.parameters)
-
-        # Append the strings.
-        string += f"{_get_header('Attempts')}\n"
-        string += _get_string_table(self.attempts)
+        # Auxiliary variables.
+        stream: io.StringIO = io.StringIO()
 
-        string += f"{_get_header('Coverage')}\n"
-        string += _get_string_table(self.coverage)
+        self.write(stream)
 
-        return f"{string.strip()}\n"
+        return stream.getvalue()
 
     # /////////////////////////////////////////////////////////////////////////
     # Constructor
@@ -289,7 +711,22 @@ class Results:
         # Simulation information.
         self.parameters: dict = parameters
 
+        # The time stamps are shared by all the tables.
+        self.points: Sequence = get_points(
+            parameters["attempts"], parameters["sampling"]
+        )
+
         # Initialize the parameters.
         self.simulations: int = 0
-        self.attempts: list = []
-        self.coverage: list = []
+        self.seeds: list = [list(HEADER_SEEDS)]
+        self.squares: dict = {
+            x: [0] * len(self.points) for x in Results.HEADERS
+        }
+
+        # The sums of the quantities, at every time stamp.
+        self.attempts: array = array(TYPECODE, [0]) * len(self.points)
+        self.coverage: array = array(TYPECODE, [0]) * len(self.points)
+
+        # The statistics are processed at the end.
+        self.errors: dict = {}
+        self.headers: dict = dict(Results.HEADERS)
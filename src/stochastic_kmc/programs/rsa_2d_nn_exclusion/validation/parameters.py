@@ -11,18 +11,40 @@
 # Standard library.
 import copy as cp
 import json
-import time
+import os
+import secrets
 
 from importlib.resources import files as ifiles
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any
 
 # User.
 from stochastic_kmc.programs.rsa_2d_nn_exclusion import configs
 from stochastic_kmc.utilities.general import format_dictionary
+from stochastic_kmc.utilities.schedule import SCALES
 from stochastic_kmc.utilities.validate import validate_dictionary_sub
 
 
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Backends that can store the lattice.
+BACKENDS: tuple = ("bits", "bytes")
+
+# Engines that can run the simulation.
+ENGINES: tuple = ("ensemble", "rejection_free", "standard")
+
+
+# Formats in which the results can be saved.
+FORMATS: tuple = ("binary", "both", "text")
+
+# Pools of workers that can run the repetitions.
+POOLS: tuple = ("process", "thread")
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions - Auxiliary
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -59,8 +81,21 @@ def _validate_parameters(parameters: dict) -> None:
         "history": _validate_parameters_history,
         "history_lattice": _validate_parameters_lattice,
         "simulation": _validate_parameters_simulation,
+        "shard": _validate_parameters_shard,
+        "stream": _validate_parameters_stream,
     }
 
+    # The shards must share an explicit seed, before a negative seed is
+    # replaced by a different seed in every shard.
+    seed: int = parameters["simulation"]["seed"]
+
+    if parameters["shard"]["count"] > 1 and seed < 0:
+        raise ValueError(
+            f"The shards of a simulation must use the same seed; set the "
+            f"\"simulation\".\"seed\" to a non-negative integer when the "
+            f"\"shard\".\"count\" is greater than one; current seed: {seed}."
+        )
+
     # Validate and updated the parameters.
     for name, function in functions.items():
         if name.startswith("history"):
@@ -68,8 +103,47 @@ def _validate_parameters(parameters: dict) -> None:
             parameters[name] = function(parameters[name], attempts)
             continue
 
+        if name == "shard":
+            repetitions: int = parameters["simulation"]["repetitions"]
+            parameters[name] = function(parameters[name], repetitions)
+            continue
+
         parameters[name] = function(parameters[name])
 
+    # The ensemble engine does not keep the lattice of every repetition.
+    engine: str = parameters["simulation"]["engine"]
+
+    if engine == "ensemble" and parameters["history_lattice"]["frequency"]:
+        raise ValueError(
+            "The lattice history cannot be saved with the ensemble engine; "
+            "set the \"history_lattice\".\"frequency\" to zero."
+        )
+
+    # The worker processes do not keep the lattice of every repetition.
+    workers: int = parameters["simulation"]["workers"]
+
+    if workers > 1 and parameters["history_lattice"]["frequency"]:
+        raise ValueError(
+            "The lattice history cannot be saved with more than one worker "
+            "process; set the \"history_lattice\".\"frequency\" to zero, or "
+            "the \"simulation\".\"workers\" to one."
+        )
+
+    # The ensemble engine draws all the repetitions from a single stream.
+    if engine == "ensemble" and parameters["shard"]["count"] > 1:
+        raise ValueError(
+            "The ensemble engine draws all the repetitions from a single "
+            "stream, and they cannot be split in shards; set the "
+            "\"shard\".\"count\" to one."
+        )
+
+    # The ensemble engine does not keep the statistics of every repetition.
+    if engine == "ensemble" and parameters["stream"]["chunk"] > 0:
+        raise ValueError(
+            "The statistics of every repetition cannot be streamed with the "
+            "ensemble engine; set the \"stream\".\"chunk\" to zero."
+        )
+
     return parameters
 
 
@@ -175,6 +249,8 @@ def _validate_parameters_output(parameters: dict) -> None:
         :raise ValueError: If the working directory does not exist. If the
          output file name has subdirectories. If the output file name is
          empty. If the output file name has a different extension than ".txt".
+         If the format does not exist. If the binary file name has
+         subdirectories, is empty, or has a different extension than ".bin".
     """
     # Set the proper working directory.
     if parameters["working"].strip() == "":
@@ -206,6 +282,103 @@ def _validate_parameters_output(parameters: dict) -> None:
             f"current extension: \"{file.suffix}\"."
         )
 
+    # The format must exist.
+    if parameters["format"] not in FORMATS:
+        raise ValueError(
+            f"The format must be one of {FORMATS}; requested format is "
+            f"\"{parameters['format']}\"."
+        )
+
+    # Check the binary file path.
+    binary: Path = Path(parameters["binary"])
+
+    if len(binary.parts) != 1:
+        raise ValueError(
+            f"The name of the binary file must not have any addtional path, "
+            f"i.e., it must only be the name of the file; current path: "
+            f"{binary}."
+        )
+
+    if f"{binary.with_suffix('')}".strip() == "":
+        raise ValueError("The name of the binary file cannot be empty.")
+
+    if binary.suffix != ".bin":
+        raise ValueError(
+            f"The name of the binary file must have a \".bin\" extension; "
+            f"current extension: \"{binary.suffix}\"."
+        )
+
+    return parameters
+
+
+def _validate_parameters_shard(parameters: dict, repetitions: int) -> None:
+    """
+        Validates the parameters specific to the shard, i.e., the part of the
+        repetitions run by the simulation.
+
+        :param parameters: The dictionary of parameters related to the "shard"
+         entry.
+
+        :param repetitions: The total number of repetitions of the simulation.
+
+        :return: A dictionary with the shard parameters.
+
+        :raise ValueError: If the index of the shard is not set in the given
+         environment variable. If the number of shards, or the index of the
+         shard, is out of range. If the shard file name has subdirectories. If
+         the shard file name is empty. If the shard file name has a different
+         extension than ".json".
+    """
+    # Take the index from the environment variable, if requested.
+    variable: str = parameters["variable"].strip()
+
+    if variable != "":
+        value: str = os.environ.get(variable, "").strip()
+
+        if not value.isdigit():
+            raise ValueError(
+                f"The environment variable \"{variable}\" must be set to the "
+                f"index of the shard, a non-negative integer; current value: "
+                f"\"{value}\"."
+            )
+
+        parameters["index"] = int(value)
+
+    # The shards split the repetitions.
+    if not 1 <= parameters["count"] <= repetitions:
+        raise ValueError(
+            f"The number of shards must be greater than zero, and less than "
+            f"or equal to the number of repetitions; requested number of "
+            f"shards: {parameters['count']}, number of repetitions: "
+            f"{repetitions}."
+        )
+
+    if not 0 <= parameters["index"] < parameters["count"]:
+        raise ValueError(
+            f"The index of the shard must be greater than or equal to zero, "
+            f"and less than the number of shards; requested index: "
+            f"{parameters['index']}, number of shards: {parameters['count']}."
+        )
+
+    # Check the shard file path.
+    file: Path = Path(parameters["file"])
+
+    if len(file.parts) != 1:
+        raise ValueError(
+            f"The name of the shard file must not have any addtional path, "
+            f"i.e., it must only be the name of the file; current path: "
+            f"{file}."
+        )
+
+    if f"{file.with_suffix('')}".strip() == "":
+        raise ValueError("The name of the shard file cannot be empty.")
+
+    if file.suffix != ".json":
+        raise ValueError(
+            f"The name of the shard file must have a \".json\" extension; "
+            f"current extension: \"{file.suffix}\"."
+        )
+
     return parameters
 
 
@@ -218,13 +391,17 @@ def _validate_parameters_simulation(parameters: dict) -> None:
 
         :return: A dictionary with the simulation parameters.
     """
-    # Set the seed.
+    # Set the seed; drawn from the operating system, so that simulations
+    # started at the same time get different seeds.
     if parameters["seed"] < 0:
-        parameters["seed"] = int(time.time())
+        parameters["seed"] = secrets.randbits(63)
 
     # Check the other values.
     message: str = ""
-    skip: tuple = ("dimensions", "periodic",)
+    skip: tuple = (
+        "backend", "debug", "dimensions", "engine", "periodic", "pool",
+        "sampling",
+    )
 
     for key, value in parameters.items():
         # No neeed to check these parameters.
@@ -239,6 +416,78 @@ def _validate_parameters_simulation(parameters: dict) -> None:
                 f"or equal to zero. "
             )
 
+    # The engine must exist.
+    if parameters["engine"] not in ENGINES:
+        message += (
+            f"The engine must be one of {ENGINES}; requested engine is "
+            f"\"{parameters['engine']}\". "
+        )
+
+    # The backend must exist.
+    if parameters["backend"] not in BACKENDS:
+        message += (
+            f"The backend must be one of {BACKENDS}; requested backend is "
+            f"\"{parameters['backend']}\". "
+        )
+
+    # The bits backend does not keep the available sites.
+    if parameters["backend"] == "bits" and parameters["engine"] != "standard":
+        message += (
+            f"The \"bits\" backend can only be used with the \"standard\" "
+            f"engine; requested engine is \"{parameters['engine']}\". "
+        )
+
+    # The ensemble engine requires NumPy.
+    if parameters["engine"] == "ensemble" and find_spec("numpy") is None:
+        message += (
+            "The ensemble engine requires NumPy, that is not installed. "
+        )
+
+    # The pool must exist.
+    if parameters["pool"] not in POOLS:
+        message += (
+            f"The pool must be one of {POOLS}; requested pool is "
+            f"\"{parameters['pool']}\". "
+        )
+
+    # The sampling schedule must be within the attempts.
+    sampling: dict = parameters["sampling"]
+
+    if sampling["scale"] not in SCALES:
+        message += (
+            f"The sampling scale must be one of {SCALES}; requested scale is "
+            f"\"{sampling['scale']}\". "
+        )
+
+    if sampling["number"] < 1 or sampling["step"] < 1:
+        message += (
+            f"The sampling number of points, and step, must be greater than "
+            f"zero; requested number: {sampling['number']}, requested step: "
+            f"{sampling['step']}. "
+        )
+
+    if not all(
+        isinstance(x, int) and 1 <= x <= parameters["attempts"]
+        for x in sampling["points"]
+    ):
+        message += (
+            f"The sampling points must be numbers of attempts from 1 to "
+            f"{parameters['attempts']}; requested points: "
+            f"{sampling['points']}. "
+        )
+
+    if sampling["scale"] == "explicit" and len(sampling["points"]) == 0:
+        message += (
+            "The explicit sampling scale requires at least one point. "
+        )
+
+    # The ensemble engine runs all the repetitions in a single process.
+    if parameters["engine"] == "ensemble" and parameters["workers"] > 1:
+        message += (
+            "The ensemble engine runs all the repetitions in a single "
+            "process; set the number of worker processes to one. "
+        )
+
     # Lattice must be at least 4 sites long and wide.
     dimension: Any = parameters["dimensions"]["length"]
 
@@ -265,6 +514,48 @@ def _validate_parameters_simulation(parameters: dict) -> None:
     return parameters
 
 
+def _validate_parameters_stream(parameters: dict) -> None:
+    """
+        Validates the parameters specific to the stream, i.e., how the
+        statistics of every repetition are written, in chunks of rows, to the
+        working directory.
+
+        :param parameters: The dictionary of parameters related to the
+         "stream" entry.
+
+        :return: A dictionary with the stream parameters.
+
+        :raise ValueError: If the size of the chunks is negative. If the name
+         of the directory is empty. If the name of the directory has
+         subdirectories.
+    """
+    # The size of the chunks cannot be negative.
+    if parameters["chunk"] < 0:
+        raise ValueError(
+            f"The size of the chunks must be greater than or equal to zero; "
+            f"requested size: {parameters['chunk']}."
+        )
+
+    # No need to check the other parameters.
+    if parameters["chunk"] == 0:
+        return parameters
+
+    # Check the directory path.
+    if parameters["directory"].strip() == "":
+        raise ValueError("The name of the stream directory cannot be empty.")
+
+    directory: Path = Path(parameters["directory"])
+
+    if len(directory.parts) != 1:
+        raise ValueError(
+            f"The name of the stream directory must not have any addtional "
+            f"path, i.e., it must only be the name of the directory; current "
+            f"path: {directory}."
+        )
+
+    return parameters
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions - Main
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
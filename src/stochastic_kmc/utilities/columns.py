@@ -0,0 +1,103 @@
+"""
+    Contains the functions to write, and read, tables of integers saved as
+    binary columns, in chunks of rows.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import sys
+
+from array import array
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Type code of the entries of the columns, i.e., 64-bit signed integers, that
+# are saved in little-endian byte order.
+TYPECODE: str = "q"
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def read_columns(file: str, columns: int) -> list:
+    """
+        Reads the columns of the table saved, in chunks of rows, in the given
+        file.
+
+        :param file: The path to the file where the table is saved.
+
+        :param columns: The number of columns of the table.
+
+        :return: The list with the arrays of the entries of every column.
+
+        :raise ValueError: If the file ends in the middle of a chunk.
+    """
+    # Auxiliary variables.
+    data: array = array(TYPECODE)
+    table: list = [array(TYPECODE) for _ in range(columns)]
+
+    with open(file, mode="rb") as stream:
+        data.frombytes(stream.read())
+
+    if sys.byteorder == "big":
+        data.byteswap()
+
+    # Every chunk starts with its number of rows.
+    position: int = 0
+
+    while position < len(data):
+        rows: int = data[position]
+        position += 1
+
+        if position + rows * columns > len(data):
+            raise ValueError(
+                f"The file ends in the middle of a chunk; file: {file}, rows "
+                f"of the chunk: {rows}, entries left: {len(data) - position}."
+            )
+
+        for column in table:
+            column.extend(data[position:position + rows])
+            position += rows
+
+    return table
+
+
+def write_columns(file: str, columns: list, position: int) -> None:
+    """
+        Writes a chunk of rows of a table to the given file, as its number of
+        rows followed by every column; the entries after the chunk are removed,
+        e.g., those written after the last save of an interrupted simulation.
+
+        :param file: The path to the file where the table is saved.
+
+        :param columns: The list with the sequences of the entries of every
+         column of the chunk; all the columns must have the same length.
+
+        :param position: The number of entries in the file before the chunk.
+         If the value is zero, the file is created again.
+    """
+    # Auxiliary variables.
+    data: array = array(TYPECODE, [len(columns[0])])
+
+    for column in columns:
+        data.extend(column)
+
+    if sys.byteorder == "big":
+        data.byteswap()
+
+    # Write the chunk at its place.
+    with open(file, mode="wb" if position == 0 else "r+b") as stream:
+        stream.seek(position * data.itemsize)
+        data.tofile(stream)
+        stream.truncate()
@@ -0,0 +1,213 @@
+"""
+    Contains the functions to write, and read, columns of numbers saved in a
+    binary container, with a JSON header of metadata; the container is read
+    through a memory map, so only the parts of the columns that are used are
+    loaded from the disk.
+
+    The container is laid out as follows, with every number in little-endian
+    byte order:
+
+    - 8 bytes: The magic bytes "SKMCCOLS".
+    - 8 bytes: The size, in bytes, of the header, as an unsigned integer.
+    - The header: A JSON object, encoded in UTF-8, and padded with spaces to a
+      multiple of 8 bytes, with the "metadata" and the "columns" entries. Every
+      column is described by its "name", the "typecode" of its entries, as
+      defined by the standard "array" module, e.g., "d" for double precision
+      numbers, its number of entries, or "length", and the "offset", in bytes,
+      from the start of the file to its first entry.
+    - The columns: The entries of every column, one column after the other,
+      each one starting at a multiple of 8 bytes.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import json
+import mmap
+import struct
+import sys
+
+from array import array
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The alignment, in bytes, of the header and the columns.
+ALIGNMENT: int = 8
+
+# The magic bytes at the start of the container.
+MAGIC: bytes = b"SKMCCOLS"
+
+# The format of the size of the header, i.e., an unsigned 64-bit little-endian
+# integer.
+SIZE: struct.Struct = struct.Struct("<Q")
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _get_padding(size: int) -> int:
+    """
+        Gets the number of bytes needed to pad the given size to the alignment.
+
+        :param size: The size, in bytes, to pad.
+
+        :return: The number of bytes of the padding.
+    """
+    return -size % ALIGNMENT
+
+
+def _get_view(buffer: mmap.mmap, column: dict) -> memoryview:
+    """
+        Gets the view of the entries of the given column in the buffer; on big
+        endian machines, the entries are copied, and swapped.
+
+        :param buffer: The memory map of the container.
+
+        :param column: The dictionary that describes the column, as saved in
+         the header.
+
+        :return: The view of the entries of the column, with the native byte
+         order.
+
+        :raise ValueError: If the column is not inside the container.
+    """
+    # Auxiliary variables.
+    size: int = array(column["typecode"]).itemsize * column["length"]
+    stop: int = column["offset"] + size
+
+    if stop > len(buffer):
+        raise ValueError(
+            f"The column \"{column['name']}\" is not inside the container; "
+            f"end of the column: {stop}, size of the container: "
+            f"{len(buffer)}."
+        )
+
+    # The entries are already in the native byte order.
+    view: memoryview = memoryview(buffer)[column["offset"]:stop]
+
+    if sys.byteorder == "little":
+        return view.cast(column["typecode"])
+
+    # Swap the entries.
+    data: array = array(column["typecode"], view.tobytes())
+    data.byteswap()
+
+    return memoryview(data)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def read_container(file: str) -> tuple:
+    """
+        Reads the container saved in the given file through a memory map; the
+        entries of the columns are not read until they are used. The views
+        keep the file mapped until they are released.
+
+        :param file: The path to the file where the container is saved.
+
+        :return: A tuple with the dictionary of the metadata, and the
+         dictionary with the view of the entries of every column, by the name
+         of the column. The views can be used as sequences, or wrapped without
+         copies, e.g., with the "numpy.asarray" function.
+
+        :raise ValueError: If the file is not a container.
+    """
+    with open(file, mode="rb") as stream:
+        buffer: mmap.mmap = mmap.mmap(
+            stream.fileno(), 0, access=mmap.ACCESS_READ
+        )
+
+    if buffer[:len(MAGIC)] != MAGIC:
+        raise ValueError(
+            f"The file is not a container of columns; file: {file}."
+        )
+
+    # The header is after the magic bytes, and its size.
+    start: int = len(MAGIC) + SIZE.size
+    stop: int = start + SIZE.unpack_from(buffer, len(MAGIC))[0]
+    header: dict = json.loads(buffer[start:stop].decode("utf-8"))
+
+    columns: dict = {
+        x["name"]: _get_view(buffer, x) for x in header["columns"]
+    }
+
+    return header["metadata"], columns
+
+
+def write_container(file: str, metadata: dict, columns: dict) -> None:
+    """
+        Writes the given columns, and the metadata, to a container in the given
+        file.
+
+        :param file: The path to the file where the container is saved.
+
+        :param metadata: The dictionary with the metadata of the container; it
+         must be serializable to JSON.
+
+        :param columns: The dictionary with the array of the entries of every
+         column, by the name of the column.
+
+        :raise ValueError: If a column is not an array of fixed size numbers,
+         e.g., a list of unbounded integers, like the sums of the squares.
+    """
+    # Only arrays of fixed size numbers can be saved.
+    for name, column in columns.items():
+        if not isinstance(column, array):
+            raise ValueError(
+                f"The columns of a container must be arrays of fixed size "
+                f"numbers; column: \"{name}\", type: {type(column).__name__}."
+            )
+
+    # Auxiliary variables.
+    descriptions: list = [
+        {"name": x, "typecode": y.typecode, "length": len(y), "offset": 0}
+        for x, y in columns.items()
+    ]
+
+    # The offsets depend on the size of the header, that depends on the
+    # offsets; the size is recomputed until the header fits.
+    size: int = 0
+
+    while True:
+        offset: int = len(MAGIC) + SIZE.size + size
+
+        for description, column in zip(descriptions, columns.values()):
+            description["offset"] = offset
+            offset += column.itemsize * len(column)
+            offset += _get_padding(column.itemsize * len(column))
+
+        header: bytes = json.dumps(
+            {"metadata": metadata, "columns": descriptions}
+        ).encode("utf-8")
+
+        if len(header) <= size:
+            break
+
+        size = len(header) + _get_padding(len(header))
+
+    with open(file, mode="wb") as stream:
+        stream.write(MAGIC)
+        stream.write(SIZE.pack(size))
+        stream.write(header.ljust(size))
+
+        for column in columns.values():
+            # The entries are saved in little-endian byte order.
+            if sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+
+            column.tofile(stream)
+            stream.write(bytes(_get_padding(column.itemsize * len(column))))
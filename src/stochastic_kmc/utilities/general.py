@@ -10,6 +10,7 @@
 
 # Standard library.
 import copy as cp
+import sys
 
 from typing import Any
 
@@ -122,3 +123,19 @@ def format_dictionary(main: dict, parameters: dict) -> dict:
     recursive_(results, parameters)
 
     return results
+
+
+def is_gil_enabled() -> bool:
+    """
+        Determines if the global interpreter lock (GIL) is enabled, i.e., if
+        the threads of the program cannot run Python code at the same time.
+
+        :return: True, if the GIL is enabled, as in the builds of Python
+         before 3.13, and in the default builds; False, if the program runs in
+         a free-threaded build with the GIL disabled.
+    """
+    # The function only exists from Python 3.13.
+    if not hasattr(sys, "_is_gil_enabled"):
+        return True
+
+    return sys._is_gil_enabled()
@@ -0,0 +1,485 @@
+"""
+    Contains the functions and classes to sample random quantities.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import hashlib
+import math
+import random
+import sys
+
+from array import array
+from typing import Any
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def get_geometric(generator: random.Random, probability: float) -> int:
+    """
+        Gets the number of independent attempts needed to get the first
+        success, when each attempt succeeds with the given probability, i.e.,
+        a number drawn from the geometric distribution with support on the
+        positive integers.
+
+        :param generator: The random number generator.
+
+        :param probability: The probability that a single attempt is
+         successful, must be in the interval (0, 1].
+
+        :return: The number of attempts, including the successful one.
+
+        :raise ValueError: If the probability is not in the interval (0, 1].
+    """
+    # Validate the probability.
+    if not 0.0 < probability <= 1.0:
+        raise ValueError(
+            f"The probability of a successful attempt must be in the interval "
+            f"(0, 1]; current probability: {probability}."
+        )
+
+    # Every attempt is successful.
+    if probability == 1.0:
+        return 1
+
+    # Inverse transform sampling; the uniform number must be in (0, 1].
+    uniform: float = 1.0 - generator.random()
+
+    return 1 + int(math.log(uniform) / math.log1p(-probability))
+
+
+def get_seed(seed: int, index: int) -> int:
+    """
+        Derives the seed of an independent random stream, e.g., the stream of
+        a single repetition, from the root seed and the index of the stream.
+        The root seed and the index are hashed together, so the seeds of
+        consecutive indexes are unrelated, and any stream can be recreated on
+        its own.
+
+        :param seed: The root seed, must be a non-negative integer.
+
+        :param index: The index of the stream, must be a non-negative integer.
+
+        :return: The 64-bit seed of the stream.
+
+        :raise ValueError: If the root seed, or the index, is negative.
+    """
+    # Validate the seed and the index.
+    if seed < 0 or index < 0:
+        raise ValueError(
+            f"The root seed and the index of the stream must be non-negative "
+            f"integers; current seed: {seed}, current index: {index}."
+        )
+
+    # Hash the root seed and the index.
+    digest: bytes = hashlib.blake2b(
+        f"{seed}:{index}".encode("utf-8"), digest_size=8
+    ).digest()
+
+    return int.from_bytes(digest, "little")
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class IndexedSet:
+    """
+        Set of non-negative integers, smaller than a given size, that can be
+        updated and sampled uniformly in constant time. The items are stored in
+        an array and removed by swapping them with the last item.
+
+        PARAMETERS:
+        ___________
+
+        - self.index: The array with the position of each possible item in
+          the items array; -1 if the item is not in the set.
+
+        - self.items: The array with the items in the set, in no particular
+          order.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def add(self, item: int) -> None:
+        """
+            Adds the item to the set, if it is not already in the set.
+
+            :param item: The item to be added.
+        """
+        # Only add new items.
+        if self.index[item] < 0:
+            self.index[item] = len(self.items)
+            self.items.append(item)
+
+    def choice(self, generator: random.Random) -> int:
+        """
+            Chooses an item of the set uniformly at random.
+
+            :param generator: The random number generator.
+
+            :return: The chosen item.
+
+            :raise ValueError: If the set is empty.
+        """
+        # Cannot choose from an empty set.
+        if len(self.items) == 0:
+            raise ValueError("Cannot choose an item from an empty set.")
+
+        return self.items[generator.randint(0, len(self.items) - 1)]
+
+    def clear(self) -> None:
+        """
+            Removes all the items from the set.
+        """
+        # Only the stored items need to be reset.
+        for item in self.items:
+            self.index[item] = -1
+
+        self.items.clear()
+
+    def discard(self, item: int) -> None:
+        """
+            Removes the item from the set, if it is in the set.
+
+            :param item: The item to be removed.
+        """
+        # Auxiliary variables.
+        position: int = self.index[item]
+
+        # Only remove existing items.
+        if position >= 0:
+            last: int = self.items.pop()
+
+            if last != item:
+                self.items[position] = last
+                self.index[last] = position
+
+            self.index[item] = -1
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Dunder
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __contains__(self, item: int) -> bool:
+        """
+            Determines if the item is in the set.
+
+            :param item: The item to be checked.
+
+            :return: True, if the item is in the set; False, otherwise.
+        """
+        return 0 <= item < len(self.index) and self.index[item] >= 0
+
+    def __len__(self) -> int:
+        """
+            The number of items in the set.
+
+            :return: The number of items in the set.
+        """
+        return len(self.items)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, size: int) -> None:
+        """
+            Constructor for the object.
+
+            :param size: The number of possible items, i.e., the items must be
+             in the range [0, size).
+        """
+        # Initialize the parameters.
+        self.index: list = [-1 for _ in range(size)]
+        self.items: list = []
+
+
+class UniformSampler:
+    """
+        Sampler of integers uniformly distributed in the range [0, size), that
+        draws the numbers in blocks, and hands them out one by one from a
+        buffer, which is much cheaper than drawing every number separately.
+        With a standard library generator, a block is made from the 64-bit
+        words of a single "getrandbits" call, where the words at or above the
+        largest multiple of the size are rejected so that the remainders are
+        unbiased; a NumPy generator draws the block directly. The sampler, and
+        its buffer, can be pickled with the generator, so that a simulation
+        resumes with the same numbers.
+
+        PARAMETERS:
+        ___________
+
+        - self.block: The number of words, or numbers, drawn at once.
+
+        - self.buffer: The list with the numbers that have not been handed out
+          yet; handed out from the end.
+
+        - self.generator: The random number generator; a standard library
+          generator, or a NumPy generator.
+
+        - self.limit: The largest multiple of the size that fits in 64 bits;
+          the words at or above the limit are rejected.
+
+        - self.size: The number of possible numbers, i.e., the numbers are in
+          the range [0, size).
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Class Variables
+    # /////////////////////////////////////////////////////////////////////////
+
+    # Number of bits of each word.
+    BITS: int = 64
+
+    # Default number of words drawn at once.
+    BLOCK: int = 4096
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _fill(self) -> None:
+        """
+            Fills the buffer with a new block of numbers.
+        """
+        # NumPy generators draw the numbers directly.
+        if not hasattr(self.generator, "getrandbits"):
+            self.buffer = self.generator.integers(
+                0, self.size, size=self.block
+            ).tolist()
+            return
+
+        # Auxiliary variables.
+        nbytes: int = UniformSampler.BITS // 8
+        bits: int = self.generator.getrandbits(
+            UniformSampler.BITS * self.block
+        )
+
+        # The words are stored in little endian order.
+        words: array = array("Q", bits.to_bytes(nbytes * self.block, "little"))
+
+        if sys.byteorder == "big":
+            words.byteswap()
+
+        self.buffer = [x % self.size for x in words if x < self.limit]
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def clear(self) -> None:
+        """
+            Discards the numbers that have not been handed out yet, e.g., when
+            the generator is seeded again.
+        """
+        self.buffer.clear()
+
+    def draw(self) -> int:
+        """
+            Hands out the next number of the buffer, drawing a new block if the
+            buffer is empty.
+
+            :return: The number, in the range [0, size).
+        """
+        # Refill the buffer, if needed.
+        while len(self.buffer) == 0:
+            self._fill()
+
+        return self.buffer.pop()
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(
+        self, generator: Any, size: int, block: int = BLOCK
+    ) -> None:
+        """
+            Constructor for the object.
+
+            :param generator: The random number generator; a standard library
+             generator, or a NumPy generator.
+
+            :param size: The number of possible numbers, i.e., the numbers must
+             be in the range [0, size).
+
+            :param block: The number of words, or numbers, drawn at once.
+
+            :raise ValueError: If the size is not in the range [1, 2^64], or
+             the block is not a positive integer.
+        """
+        # Validate the size and the block.
+        if not 0 < size <= 1 << UniformSampler.BITS:
+            raise ValueError(
+                f"The number of possible numbers must be in the range "
+                f"[1, 2^{UniformSampler.BITS}]; current size: {size}."
+            )
+
+        if block <= 0:
+            raise ValueError(
+                f"The number of words drawn at once must be a positive "
+                f"integer; current block: {block}."
+            )
+
+        # Initialize the parameters.
+        self.block: int = block
+        self.buffer: list = []
+        self.generator: Any = generator
+        self.size: int = size
+
+        self.limit: int = 1 << UniformSampler.BITS
+        self.limit -= self.limit % size
+
+
+class WeightedMultiset:
+    """
+        Multiset of items with positive integer weights, from which an item can
+        be drawn, and removed, with a probability proportional to its weight,
+        in constant expected time. The items are grouped by the number of bits
+        of their weights; the group is chosen with a probability proportional
+        to its total weight, and the item inside the group by rejection, where
+        every try is accepted with a probability of at least one half.
+
+        PARAMETERS:
+        ___________
+
+        - self.items: The list with the items of each group; the items in
+          group "i" have weights in the interval [2^i, 2^(i + 1)).
+
+        - self.total: The total weight of the items in the multiset.
+
+        - self.totals: The list with the total weight of each group.
+
+        - self.weights: The list with the weights of the items of each group,
+          in the same order as the items.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def add(self, item: object, weight: int) -> None:
+        """
+            Adds the item, with the given weight, to the multiset.
+
+            :param item: The item to be added.
+
+            :param weight: The weight of the item, must be a positive integer.
+
+            :raise ValueError: If the weight is not a positive integer.
+        """
+        # Validate the weight.
+        if weight <= 0:
+            raise ValueError(
+                f"The weight of an item must be a positive integer; current "
+                f"weight: {weight}."
+            )
+
+        # Auxiliary variables.
+        group: int = weight.bit_length() - 1
+
+        # Create the missing groups.
+        while len(self.items) <= group:
+            self.items.append([])
+            self.weights.append([])
+            self.totals.append(0)
+
+        # Add the item.
+        self.items[group].append(item)
+        self.weights[group].append(weight)
+
+        self.totals[group] += weight
+        self.total += weight
+
+    def clear(self) -> None:
+        """
+            Removes all the items from the multiset.
+        """
+        self.items.clear()
+        self.totals.clear()
+        self.weights.clear()
+
+        self.total = 0
+
+    def pop(self, generator: random.Random) -> object:
+        """
+            Chooses an item with a probability proportional to its weight, and
+            removes it from the multiset.
+
+            :param generator: The random number generator.
+
+            :return: The chosen item.
+
+            :raise ValueError: If the multiset is empty.
+        """
+        # Cannot choose from an empty multiset.
+        if self.total == 0:
+            raise ValueError("Cannot choose an item from an empty multiset.")
+
+        # Choose the group.
+        group: int = 0
+        value: int = generator.randrange(self.total)
+
+        while value >= self.totals[group]:
+            value -= self.totals[group]
+            group += 1
+
+        # Choose the item inside the group.
+        bound: int = 2 << group
+        items: list = self.items[group]
+        weights: list = self.weights[group]
+
+        index: int = generator.randrange(len(items))
+
+        while generator.randrange(bound) >= weights[index]:
+            index = generator.randrange(len(items))
+
+        # Remove the item, swapping it with the last one.
+        item: object = items[index]
+        weight: int = weights[index]
+
+        items[index] = items[-1]
+        weights[index] = weights[-1]
+
+        items.pop()
+        weights.pop()
+
+        self.totals[group] -= weight
+        self.total -= weight
+
+        return item
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Dunder
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __len__(self) -> int:
+        """
+            The number of items in the multiset.
+
+            :return: The number of items in the multiset.
+        """
+        return sum(len(items) for items in self.items)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self) -> None:
+        """
+            Constructor for the object.
+        """
+        # Initialize the parameters.
+        self.items: list = []
+        self.total: int = 0
+        self.totals: list = []
+        self.weights: list = []
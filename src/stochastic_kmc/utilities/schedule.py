@@ -0,0 +1,103 @@
+"""
+    Contains the functions to get the numbers of attempts where the statistics
+    of a simulation are recorded.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import math
+
+from typing import Sequence
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Scales in which the numbers of attempts can be spaced.
+SCALES: tuple = ("explicit", "linear", "log")
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def get_points(attempts: int, sampling: dict) -> Sequence:
+    """
+        Gets the numbers of attempts of every row of the statistics, i.e.,
+        zero, before the first attempt, followed by the schedule; the time
+        stamps shared by all the statistics tables.
+
+        :param attempts: The number of attempts of the simulation, must be a
+         positive integer.
+
+        :param sampling: The dictionary with the sampling options; with the
+         pre condition that it has already been checked.
+
+        :return: The numbers of attempts of every row. A range for the linear
+         scale; a list, otherwise.
+    """
+    # Auxiliary variables.
+    schedule: Sequence = get_schedule(attempts, sampling)
+
+    # The schedule of the linear scale is already evenly spaced from zero.
+    if isinstance(schedule, range):
+        return range(0, schedule.stop, schedule.step)
+
+    return [0, *schedule]
+
+
+def get_schedule(attempts: int, sampling: dict) -> Sequence:
+    """
+        Gets the numbers of attempts after which the statistics are recorded,
+        in increasing order; the statistics before the first attempt are
+        always recorded, so zero is not part of the schedule.
+
+        :param attempts: The number of attempts of the simulation, must be a
+         positive integer.
+
+        :param sampling: The dictionary with the sampling options; with the
+         pre condition that it has already been checked. The "scale" is
+         "linear", for every "step" attempts; "log", for "number" attempts
+         evenly spaced in logarithmic scale, from the first to the last
+         attempt; or "explicit", for the given "points".
+
+        :return: The numbers of attempts after which the statistics are
+         recorded. A range for the linear scale, so that recording after every
+         attempt does not take any memory; a list, otherwise.
+
+        :raise ValueError: If the scale is not one of the known scales.
+    """
+    # Every given number of attempts.
+    if sampling["scale"] == "linear":
+        return range(sampling["step"], attempts + 1, sampling["step"])
+
+    # The given numbers of attempts.
+    if sampling["scale"] == "explicit":
+        return sorted(set(sampling["points"]))
+
+    # The scale must exist.
+    if sampling["scale"] != "log":
+        raise ValueError(
+            f"The scale must be one of {SCALES}; requested scale is "
+            f"\"{sampling['scale']}\"."
+        )
+
+    # Auxiliary variables.
+    number: int = sampling["number"]
+    exponent: float = math.log(attempts) / max(number - 1, 1)
+
+    # Repeated numbers of attempts are only recorded once.
+    points: set = {
+        min(max(round(math.exp(exponent * i)), 1), attempts)
+        for i in range(number - 1)
+    }
+
+    return sorted(points | {attempts})
@@ -0,0 +1,134 @@
+"""
+    Contains the unit tests for the RSA 1D Dimers Ensemble class.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import unittest
+
+from importlib.util import find_spec
+
+# User.
+from stochastic_kmc.programs.rsa_1d_dimers.classes.ensemble import Ensemble
+from stochastic_kmc.programs.rsa_1d_dimers.classes.lattice import Lattice
+from stochastic_kmc.programs.rsa_1d_dimers.classes.statistics import (
+    _get_continuous_empty,
+    _get_coverage
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+@unittest.skipIf(find_spec("numpy") is None, "NumPy is not installed.")
+class TestRSA1DDimersEnsemble(unittest.TestCase):
+    """
+        Contains the tests for the ensemble of lattices.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_counters(self) -> None:
+        """
+            Tests that the running counters of every lattice are the same as
+            the quantities obtained by scanning the lattice, and that the sums,
+            and the sums of the squares, are those of the counters.
+        """
+        for periodic in (False, True):
+            # Auxiliary variables.
+            ensemble: Ensemble = Ensemble({
+                "attempts": 100, "debug": False, "length": 17,
+                "periodic": periodic, "repetitions": 9, "sampling": {
+                    "number": 100, "points": [], "scale": "linear", "step": 1
+                },
+                "seed": 1
+            })
+            msg: str = f"The counters must match the lattice; {periodic=}."
+
+            for attempt in range(100):
+                ensemble.run_attempt(attempt)
+
+            for i, row in enumerate(ensemble.lattices.tolist()):
+                # Quantities from scanning the lattice.
+                expected: dict = {
+                    "occupied": _get_coverage(row),
+                    "empty_single": _get_continuous_empty(row, 1, periodic),
+                    "empty_double": _get_continuous_empty(row, 2, periodic),
+                    "empty_triple": _get_continuous_empty(row, 3, periodic),
+                }
+                counters: dict = {
+                    x: int(y[i]) for x, y in ensemble.counters.items()
+                }
+
+                self.assertEqual(expected, counters, msg)
+
+            # The last sums must be those of the counters.
+            self.assertEqual(
+                int(ensemble.counters["occupied"].sum()),
+                int(ensemble.sums["coverage"][-1]),
+                msg
+            )
+            self.assertEqual(
+                sum(x * x for x in ensemble.counters["occupied"].tolist()),
+                int(ensemble.squares["coverage"][-1]),
+                msg
+            )
+            self.assertEqual(
+                ensemble.successful, int(ensemble.successes.sum()), msg
+            )
+
+            # Every dimer takes two sites.
+            self.assertEqual(
+                2 * ensemble.successful,
+                int(ensemble.counters["occupied"].sum()),
+                msg
+            )
+            self.assertTrue(set(ensemble.lattices.ravel().tolist()) <= {
+                Lattice.EMPTY, Lattice.OCCUPIED
+            })
+
+    def test_set_sums(self) -> None:
+        """
+            Tests that the sums of the squares are exact, both when they fit
+            in 64-bit integers, and when they go past 2 ** 63.
+        """
+        # Auxiliary variables.
+        ensemble: Ensemble = Ensemble({
+            "attempts": 100, "debug": False, "length": 17,
+            "periodic": False, "repetitions": 9, "sampling": {
+                "number": 100, "points": [], "scale": "linear", "step": 1
+            },
+            "seed": 1
+        })
+
+        for value in (5, 3 * 10 ** 9):
+            # Auxiliary variables.
+            msg: str = f"The sums of the squares must be exact; {value=}."
+
+            ensemble.counters["occupied"][:] = value
+            ensemble._set_sums(0, 1)
+
+            self.assertEqual(
+                9 * value, int(ensemble.sums["coverage"][0]), msg
+            )
+            self.assertEqual(
+                9 * value * value, ensemble.squares["coverage"][0], msg
+            )
+            self.assertIsInstance(ensemble.squares["coverage"][0], int, msg)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,8 +9,16 @@
 
 
 # Standard library.
+import random
 import unittest
 
+# User.
+from stochastic_kmc.programs.rsa_1d_dimers.classes.lattice import Lattice
+from stochastic_kmc.programs.rsa_1d_dimers.classes.statistics import (
+    _get_continuous_empty,
+    _get_coverage
+)
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Classes
@@ -21,6 +29,37 @@ class TestRSA1DDimersLattice(unittest.TestCase):
     """
         Contains the tests for the utilities.
     """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_available_sites(self, lattice: Lattice) -> set:
+        """
+            Gets the sites where a dimer can still be adsorbed, by scanning
+            the whole lattice.
+
+            :param lattice: The lattice with the particles.
+
+            :return: The set with the sites that are empty, and whose
+             neighbor to the right is inside the lattice and empty.
+        """
+        # Auxiliary variables.
+        length: int = lattice.length
+        rows: bytearray = lattice.lattice
+        sites: set = set()
+
+        for site in range(length):
+            # The neighbor to the right of the site.
+            sitef: int = (site + 1) % length if lattice.periodic else site + 1
+
+            if sitef >= length:
+                continue
+
+            if rows[site] == rows[sitef] == Lattice.EMPTY:
+                sites.add(site)
+
+        return sites
+
     # /////////////////////////////////////////////////////////////////////////
     # Tests
     # /////////////////////////////////////////////////////////////////////////
@@ -31,6 +70,153 @@ class TestRSA1DDimersLattice(unittest.TestCase):
         """
         self.assertEqual(1, 1)
 
+    def test_available(self) -> None:
+        """
+            Tests that the set of available sites of the rejection free engine
+            is the same as the sites obtained by scanning the whole lattice,
+            after every adsorption at a site chosen from the set, until the
+            lattice is jammed.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+
+        for periodic in (False, True):
+            # Auxiliary variables.
+            lattice: Lattice = Lattice({
+                "engine": "rejection_free", "length": 17, "periodic": periodic
+            })
+            msg: str = f"The available sites must match; {periodic=}."
+
+            self.assertEqual(
+                self._get_available_sites(lattice),
+                set(lattice.available.items),
+                msg
+            )
+
+            while not lattice.is_jammed():
+                # Every site of the set must take a dimer.
+                site: int = lattice.available.choice(generator)
+
+                self.assertTrue(
+                    lattice.particle_adsorb(site), f"{msg} {site=}."
+                )
+
+                # The set must match the scan, and the counters.
+                self.assertEqual(
+                    self._get_available_sites(lattice),
+                    set(lattice.available.items),
+                    msg
+                )
+                self.assertEqual(
+                    lattice.counters["empty_double"],
+                    len(lattice.available),
+                    msg
+                )
+
+            # The jammed lattice has no available sites left.
+            self.assertEqual(0, len(lattice.available), msg)
+
+            # The set must be reset with the lattice.
+            lattice.reset()
+
+            self.assertEqual(
+                self._get_available_sites(lattice),
+                set(lattice.available.items),
+                msg
+            )
+
+    def test_counters(self) -> None:
+        """
+            Tests that the running counters are the same as the quantities
+            obtained by scanning the whole lattice.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+
+        for periodic in (False, True):
+            # Auxiliary variables.
+            lattice: Lattice = Lattice({
+                "engine": "standard", "length": 17, "periodic": periodic
+            })
+            msg: str = f"The counters must match the lattice; {periodic=}."
+
+            for _ in range(200):
+                lattice.particle_adsorb(generator.randint(0, 16))
+
+                # Quantities from scanning the lattice.
+                expected: dict = {
+                    "occupied": _get_coverage(lattice.lattice),
+                    "empty_single": _get_continuous_empty(
+                        lattice.lattice, 1, periodic
+                    ),
+                    "empty_double": _get_continuous_empty(
+                        lattice.lattice, 2, periodic
+                    ),
+                    "empty_triple": _get_continuous_empty(
+                        lattice.lattice, 3, periodic
+                    ),
+                }
+
+                self.assertEqual(expected, lattice.counters, msg)
+
+            # The counters must be reset with the lattice.
+            lattice.reset()
+
+            self.assertEqual(0, lattice.counters["occupied"], msg)
+            self.assertEqual(17, lattice.counters["empty_single"], msg)
+
+    def test_gaps(self) -> None:
+        """
+            Tests that the running counters of the gaps engine are the same as
+            the quantities obtained by scanning all the gaps, until the lattice
+            is jammed.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+
+        for periodic in (False, True):
+            # Auxiliary variables.
+            lattice: Lattice = Lattice({
+                "engine": "gaps", "length": 101, "periodic": periodic
+            })
+            msg: str = f"The counters must match the gaps; {periodic=}."
+
+            while not lattice.is_jammed():
+                lattice.particle_adsorb_random(generator)
+
+                self.assertEqual(lattice.get_gap_counters(), lattice.counters)
+                self.assertEqual(
+                    lattice.counters["empty_double"], lattice.gaps.total, msg
+                )
+
+            # Only isolated empty sites are left.
+            self.assertEqual(0, lattice.counters["empty_double"], msg)
+            self.assertTrue(set(lattice.histogram) <= {(0, 1)}, msg)
+
+            # The gaps engine does not keep the sites.
+            with self.assertRaises(ValueError, msg="There are no sites."):
+                lattice.particle_adsorb(0)
+
+    def test_is_jammed(self) -> None:
+        """
+            Tests that the lattice is jammed only when no more dimers can be
+            adsorbed.
+        """
+        # Auxiliary variables.
+        lattice: Lattice = Lattice({
+            "engine": "standard", "length": 5, "periodic": False
+        })
+
+        # Sites 3 and 4 can still take a dimer.
+        lattice.particle_adsorb(1)
+
+        self.assertFalse(lattice.is_jammed())
+
+        # Only the isolated site 0 is left.
+        lattice.particle_adsorb(3)
+
+        self.assertTrue(lattice.is_jammed())
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Main Program
@@ -9,8 +9,31 @@
 
 
 # Standard library.
+import json
+import math
+import random
+import statistics as stats
 import unittest
 
+from array import array
+
+# User.
+from stochastic_kmc.programs.rsa_1d_dimers.classes.lattice import Lattice
+from stochastic_kmc.programs.rsa_1d_dimers.classes.results import Results
+from stochastic_kmc.programs.rsa_1d_dimers.classes.statistics import (
+    Statistics
+)
+from stochastic_kmc.utilities.columns import TYPECODE
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The statistics are recorded after every attempt.
+SAMPLING: dict = {"number": 100, "points": [], "scale": "linear", "step": 1}
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Classes
@@ -31,6 +54,293 @@ class TestRSA1DDimersResults(unittest.TestCase):
         """
         self.assertEqual(1, 1)
 
+    def test_partial_add(self) -> None:
+        """
+            Tests that adding the partial results of several shards, after a
+            round trip through JSON, is the same as adding each simulation in
+            order, and that the sums of the squares are those of the
+            simulations.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(7)
+        parameters: dict = {
+            "attempts": 30, "debug": False, "engine": "standard", "length": 11,
+            "periodic": False, "sampling": SAMPLING
+        }
+
+        lattice: Lattice = Lattice(parameters)
+        statistics: Statistics = Statistics(parameters)
+
+        expected: Results = Results(parameters)
+        shards: list = [Results(parameters), Results(parameters)]
+        results: Results = Results(parameters)
+        squares: list = [0 for _ in range(31)]
+
+        for repetition in range(4):
+            lattice.reset()
+            statistics.reset()
+
+            for _ in range(30):
+                successful: bool = lattice.particle_adsorb(
+                    generator.randint(0, 10)
+                )
+                statistics.update_statistics(lattice, successful)
+
+            # Add the simulation in order, and to one of the shards.
+            expected.statistics_add(statistics)
+            expected.seeds_add(repetition, 100 + repetition)
+
+            shards[repetition // 2].statistics_add(statistics)
+            shards[repetition // 2].seeds_add(repetition, 100 + repetition)
+
+            for i, value in enumerate(statistics.coverage):
+                squares[i] += value ** 2
+
+        for shard in reversed(shards):
+            results.partial_add(json.loads(json.dumps(shard.get_partial())))
+
+        # The results must be the same.
+        self.assertEqual(squares, list(expected.squares["coverage"]))
+        self.assertEqual(expected.get_partial(), results.get_partial())
+
+    def test_results_add(self) -> None:
+        """
+            Tests that adding the results of several groups of simulations, in
+            any order, is the same as adding each simulation in order.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(5)
+        names: tuple = (
+            "attempts", "coverage", "empty_single", "empty_double",
+            "empty_triple"
+        )
+        parameters: dict = {
+            "attempts": 30, "debug": False, "engine": "standard", "length": 11,
+            "periodic": True, "sampling": SAMPLING
+        }
+
+        lattice: Lattice = Lattice(parameters)
+        statistics: Statistics = Statistics(parameters)
+
+        expected: Results = Results(parameters)
+        groups: list = [Results(parameters), Results(parameters)]
+        results: Results = Results(parameters)
+
+        for repetition in range(5):
+            lattice.reset()
+            statistics.reset()
+
+            for _ in range(30):
+                successful: bool = lattice.particle_adsorb(
+                    generator.randint(0, 10)
+                )
+                statistics.update_statistics(lattice, successful)
+
+            # Add the simulation in order, and to one of the groups.
+            expected.statistics_add(statistics)
+            expected.seeds_add(repetition, 100 + repetition)
+
+            groups[repetition % 2].statistics_add(statistics)
+            groups[repetition % 2].seeds_add(repetition, 100 + repetition)
+
+        for group in reversed(groups):
+            results.results_add(group)
+
+        # The results must be the same.
+        self.assertEqual(expected.simulations, results.simulations)
+        self.assertEqual(expected.seeds, results.seeds)
+
+        for name in names:
+            self.assertEqual(
+                getattr(expected, name), getattr(results, name), name
+            )
+
+    def test_statistics_process(self) -> None:
+        """
+            Tests that the processed statistics have the mean, the standard
+            error and the number of samples of every quantity.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(11)
+        parameters: dict = {
+            "attempts": 30, "debug": False, "engine": "standard", "length": 11,
+            "periodic": False, "sampling": SAMPLING
+        }
+
+        lattice: Lattice = Lattice(parameters)
+        statistics: Statistics = Statistics(parameters)
+
+        results: Results = Results(parameters)
+        values: list = []
+
+        for _ in range(6):
+            lattice.reset()
+            statistics.reset()
+
+            for _ in range(30):
+                successful: bool = lattice.particle_adsorb(
+                    generator.randint(0, 10)
+                )
+                statistics.update_statistics(lattice, successful)
+
+            results.statistics_add(statistics)
+            values.append(statistics.coverage[-1] / 11)
+
+        results.statistics_process()
+
+        # The last time stamp of the coverage.
+        error: float = results.errors["coverage"][-1]
+
+        self.assertEqual(30 / 11, results.points[-1])
+        self.assertAlmostEqual(stats.mean(values), results.coverage[-1])
+        self.assertAlmostEqual(stats.stdev(values) / math.sqrt(6), error)
+        self.assertEqual(6, results.simulations)
+
+        # There is no error before the first attempt.
+        self.assertEqual(0.0, results.points[0])
+        self.assertEqual(0.0, results.coverage[0])
+        self.assertEqual(0.0, results.errors["coverage"][0])
+
+    def test_statistics_add_rows(self) -> None:
+        """
+            Tests that adding the rows of the statistics in chunks, while the
+            simulations run, is the same as adding each simulation at the end,
+            and that only a chunk of rows is kept in memory.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(9)
+        parameters: dict = {
+            "attempts": 30, "debug": False, "engine": "standard", "length": 11,
+            "periodic": False, "sampling": SAMPLING
+        }
+
+        lattice: Lattice = Lattice(parameters)
+        statistics: Statistics = Statistics(parameters)
+        streamed: Statistics = Statistics(parameters)
+
+        expected: Results = Results(parameters)
+        results: Results = Results(parameters)
+
+        # Hand the rows to the results every four rows.
+        streamed.chunk = 4
+        streamed.sink = results.statistics_add_rows
+
+        for _ in range(3):
+            lattice.reset()
+            statistics.reset()
+            streamed.reset()
+
+            for _ in range(20):
+                successful: bool = lattice.particle_adsorb(
+                    generator.randint(0, 10)
+                )
+                statistics.update_statistics(lattice, successful)
+                streamed.update_statistics(lattice, successful)
+
+                self.assertLessEqual(len(streamed.coverage), 4)
+
+            # The last attempts do not change the lattice.
+            statistics.fill_statistics(lattice, 10)
+            streamed.fill_statistics(lattice, 10)
+            streamed.flush()
+
+            expected.statistics_add(statistics)
+            results.statistics_add(streamed)
+
+        # Every row, with the one before the first attempt, was handed over.
+        self.assertEqual(31, streamed.flushed)
+
+        # The results must be the same.
+        self.assertEqual(expected.get_partial(), results.get_partial())
+
+    def test_statistics_add_squares(self) -> None:
+        """
+            Tests that the sums of the squares of large quantities, e.g., those
+            of a lattice with billions of sites, go past the range of 64-bit
+            integers without overflowing, also after a round trip through
+            JSON.
+        """
+        # Auxiliary variables.
+        parameters: dict = {
+            "attempts": 30, "debug": False, "engine": "standard",
+            "length": 4 * 10 ** 9, "periodic": False, "sampling": SAMPLING
+        }
+        value: int = 3 * 10 ** 9
+
+        statistics: Statistics = Statistics(parameters)
+        results: Results = Results(parameters)
+        partial: Results = Results(parameters)
+
+        # Every quantity is the same large value at every time stamp.
+        for name in Results.HEADERS:
+            setattr(statistics, name, array(TYPECODE, [value]) * 31)
+
+        for repetition in range(4):
+            results.statistics_add(statistics)
+            results.seeds_add(repetition, 100 + repetition)
+
+        # The sums of the squares are past the range of 64-bit integers.
+        self.assertLess(2 ** 63, 4 * value ** 2)
+        self.assertEqual([4 * value ** 2] * 31, results.squares["coverage"])
+
+        partial.partial_add(json.loads(json.dumps(results.get_partial())))
+        self.assertEqual(results.get_partial(), partial.get_partial())
+
+        # Equal samples have no error.
+        results.statistics_process()
+
+        self.assertEqual(0.0, results.errors["coverage"][-1])
+
+    def test_statistics_add_sums(self) -> None:
+        """
+            Tests that adding the statistics already summed over several
+            simulations is the same as adding each simulation.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(3)
+        names: tuple = (
+            "attempts", "coverage", "empty_single", "empty_double",
+            "empty_triple"
+        )
+        parameters: dict = {
+            "attempts": 30, "debug": False, "engine": "standard", "length": 11,
+            "periodic": False, "sampling": SAMPLING
+        }
+
+        lattice: Lattice = Lattice(parameters)
+        statistics: Statistics = Statistics(parameters)
+
+        expected: Results = Results(parameters)
+        results: Results = Results(parameters)
+        sums: dict = {x: [0 for _ in range(31)] for x in names}
+
+        for _ in range(3):
+            lattice.reset()
+            statistics.reset()
+
+            for _ in range(30):
+                successful: bool = lattice.particle_adsorb(
+                    generator.randint(0, 10)
+                )
+                statistics.update_statistics(lattice, successful)
+
+            # Sum the simulations.
+            expected.statistics_add(statistics)
+
+            for name in names:
+                for i, value in enumerate(getattr(statistics, name)):
+                    sums[name][i] += value
+
+        results.statistics_add_sums(sums, 3)
+
+        # The results must be the same.
+        self.assertEqual(expected.simulations, results.simulations)
+
+        for name in names:
+            self.assertEqual(
+                getattr(expected, name), getattr(results, name), name
+            )
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Main Program
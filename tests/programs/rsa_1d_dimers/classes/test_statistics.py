@@ -9,8 +9,15 @@
 
 
 # Standard library.
+import random
 import unittest
 
+# User.
+from stochastic_kmc.programs.rsa_1d_dimers.classes.lattice import Lattice
+from stochastic_kmc.programs.rsa_1d_dimers.classes.statistics import (
+    Statistics
+)
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Classes
@@ -31,6 +38,53 @@ class TestRSA1DDimersStatistics(unittest.TestCase):
         """
         self.assertEqual(1, 1)
 
+    def test_sampling(self) -> None:
+        """
+            Tests that the statistics recorded at the numbers of attempts of
+            the schedule are those recorded after every attempt.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(11)
+        names: tuple = (
+            "attempts", "coverage", "empty_single", "empty_double",
+            "empty_triple"
+        )
+        parameters: dict = {
+            "attempts": 60, "debug": False, "engine": "standard", "length": 13,
+            "periodic": True, "sampling": {
+                "number": 10, "points": [], "scale": "linear", "step": 1
+            }
+        }
+
+        lattice: Lattice = Lattice(parameters)
+        statistics: Statistics = Statistics(parameters)
+
+        parameters["sampling"]["scale"] = "log"
+        sampled: Statistics = Statistics(parameters)
+
+        # Jammed stretches are filled at once.
+        while statistics.current < 60:
+            if statistics.current % 20 == 19:
+                statistics.fill_statistics(lattice, 5)
+                sampled.fill_statistics(lattice, 5)
+                continue
+
+            successful: bool = lattice.particle_adsorb(
+                generator.randint(0, 12)
+            )
+            statistics.update_statistics(lattice, successful)
+            sampled.update_statistics(lattice, successful)
+
+        # The rows must be those of the schedule.
+        self.assertEqual([0, *sampled.schedule], list(sampled.get_points()))
+
+        for name in names:
+            expected: list = [
+                y for x, y in zip(statistics.points, getattr(statistics, name))
+                if x in sampled.points
+            ]
+            self.assertEqual(expected, list(getattr(sampled, name)), name)
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Main Program
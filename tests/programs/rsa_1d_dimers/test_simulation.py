@@ -9,7 +9,37 @@
 
 
 # Standard library.
+import contextlib
+import io
+import math
+import tempfile
 import unittest
+import warnings
+
+from pathlib import Path
+
+# User.
+from stochastic_kmc.programs.rsa_1d_dimers.classes.results import Results
+from stochastic_kmc.programs.rsa_1d_dimers.simulation import Simulation
+from stochastic_kmc.programs.rsa_1d_dimers.utils.load import _load_simulation
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The parameters of the short simulations run in serial and in parallel.
+PARAMETERS: dict = {
+    "attempts": 30, "length": 11, "repetitions": 12, "seed": 1
+}
+
+# The number of repetitions of each engine.
+REPETITIONS: int = 400
+
+# The largest difference between the means of the engines, in units of the
+# standard error of the difference.
+TOLERANCE: float = 5.0
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -21,6 +51,58 @@ class TestRSA1DDimersSimulation(unittest.TestCase):
     """
         Contains the tests for the utilities.
     """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_results(self, engine: str, periodic: bool) -> Results:
+        """
+            Gets the processed results of the repetitions of a simulation on a
+            small lattice, run with the given engine.
+
+            :param engine: The engine of the simulation.
+
+            :param periodic: A boolean flag indicating whether the lattice is
+             periodic.
+
+            :return: The results of the repetitions, after the statistics are
+             processed.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Auxiliary variables; the counters are validated at every step.
+            simulation: Simulation = Simulation({
+                "output": {"working": directory},
+                "simulation": {
+                    "attempts": 60,
+                    "debug": True,
+                    "engine": engine,
+                    "length": 11,
+                    "periodic": periodic,
+                    "repetitions": REPETITIONS,
+                    "seed": 1,
+                },
+            })
+
+            results, _, _ = simulation._run_repetitions(range(REPETITIONS))
+
+        results.statistics_process()
+
+        return results
+
+    def _run(self, simulation: Simulation) -> dict:
+        """
+            Runs all the repetitions of the simulation, without printing the
+            location of the results.
+
+            :param simulation: The simulation to be run.
+
+            :return: The dictionary with the processed results.
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulation.run_simulations()
+
+        return simulation.results.get_dictionary()
+
     # /////////////////////////////////////////////////////////////////////////
     # Tests
     # /////////////////////////////////////////////////////////////////////////
@@ -31,6 +113,104 @@ class TestRSA1DDimersSimulation(unittest.TestCase):
         """
         self.assertEqual(1, 1)
 
+    def test_parallel(self) -> None:
+        """
+            Tests that the repetitions run by a pool of two worker processes,
+            or threads, give the same processed results as the serial run.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Auxiliary variables.
+            expected: dict = self._run(Simulation({
+                "output": {"working": directory}, "simulation": PARAMETERS
+            }))
+
+            for pool in ("process", "thread"):
+                # Auxiliary variables.
+                simulation: Simulation = Simulation({
+                    "output": {"working": directory},
+                    "simulation": {**PARAMETERS, "pool": pool, "workers": 2},
+                })
+
+                # The threads warn when the GIL is enabled.
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    results: dict = self._run(simulation)
+
+                self.assertEqual(
+                    expected, results, f"The results must match; {pool=}."
+                )
+
+    def test_rejection_free(self) -> None:
+        """
+            Tests that the rejection free and the gaps engines give the same
+            statistics as the standard engine, i.e., that the attempts in
+            between successful attempts follow the geometric distribution with
+            the probability "empty_double / length" of choosing an available
+            site, within the statistical errors.
+        """
+        for periodic in (False, True):
+            # Auxiliary variables.
+            expected: Results = self._get_results("standard", periodic)
+
+            for engine in ("gaps", "rejection_free"):
+                # Auxiliary variables.
+                results: Results = self._get_results(engine, periodic)
+
+                for name in Results.HEADERS:
+                    # The means must agree within the errors.
+                    for i, (x, y, u, v) in enumerate(zip(
+                        getattr(expected, name), getattr(results, name),
+                        expected.errors[name], results.errors[name]
+                    )):
+                        self.assertLessEqual(
+                            abs(x - y), TOLERANCE * math.hypot(u, v),
+                            f"The engines must agree; {periodic=}, "
+                            f"{engine=}, {name=}, {i=}."
+                        )
+
+                # The time stamps are the same.
+                self.assertEqual(
+                    list(expected.points), list(results.points)
+                )
+
+
+    def test_resume(self) -> None:
+        """
+            Tests that a simulation resumed from a checkpoint saved in the
+            middle of a parallel run, i.e., after the workers finished a chunk
+            of later repetitions before the current one, gives the same
+            processed results as the uninterrupted serial run.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Auxiliary variables.
+            expected: dict = self._run(Simulation({
+                "output": {"working": directory}, "simulation": PARAMETERS
+            }))
+            simulation: Simulation = Simulation({
+                "history": {"frequency": 10},
+                "output": {"working": directory},
+                "simulation": {**PARAMETERS, "workers": 2},
+            })
+            worker: Simulation = Simulation({
+                "output": {"working": directory}, "simulation": PARAMETERS
+            })
+
+            # The chunk of repetitions 4 and 5 finished first.
+            results, _, _ = worker._run_repetitions([4, 5])
+
+            simulation.results.results_add(results)
+            simulation.finished.extend([4, 5])
+            simulation._save_simulation(False, 0)
+
+            # Resume from the checkpoint.
+            working: Path = Path(simulation.parameters.output["working"])
+            loaded: Simulation = _load_simulation(
+                f"{working / simulation.parameters.history['file']}"
+            )["simulation"]
+
+            self.assertEqual([4, 5], loaded.finished)
+            self.assertEqual(expected, self._run(loaded))
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Main Program
@@ -0,0 +1,163 @@
+"""
+    Contains the unit tests for the RSA 1D Dimers merge script.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import contextlib
+import copy
+import io
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import mock
+
+# User.
+from stochastic_kmc.programs.rsa_1d_dimers.classes.results import Results
+from stochastic_kmc.programs.rsa_1d_dimers.simulation import Simulation
+from stochastic_kmc.programs.rsa_1d_dimers.utils.merge import (
+    _load_shard,
+    _validate_shards,
+    merge_shards
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The number of shards.
+COUNT: int = 3
+
+# The parameters of the short simulation split in shards.
+PARAMETERS: dict = {
+    "attempts": 20, "length": 11, "repetitions": 7, "seed": 1
+}
+
+# The environment variable with the index of the shard.
+VARIABLE: str = "STOCHASTIC_KMC_SHARD_INDEX"
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestRSA1DDimersMerge(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _run(self, parameters: dict) -> Simulation:
+        """
+            Runs all the repetitions of the simulation, without printing the
+            location of the results.
+
+            :param parameters: The parameters of the simulation.
+
+            :return: The simulation, after it is run.
+        """
+        # Auxiliary variables.
+        simulation: Simulation = Simulation(parameters)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulation.run_simulations()
+
+        return simulation
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_validate_shards(self) -> None:
+        """
+            Tests that the shards, whose index is taken from an environment
+            variable, merge into the results of a single run; and that shards
+            with mismatched parameters, duplicate shards, or missing shards,
+            cannot be merged.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Auxiliary variables.
+            expected: Simulation = self._run({
+                "output": {"working": directory}, "simulation": PARAMETERS
+            })
+            files: list = []
+
+            for index in range(COUNT):
+                # The index of the shard is taken from the environment.
+                with mock.patch.dict(os.environ, {VARIABLE: f"{index}"}):
+                    simulation: Simulation = self._run({
+                        "output": {"working": directory},
+                        "shard": {
+                            "count": COUNT,
+                            "file": f"shard_{index}.json",
+                            "variable": VARIABLE,
+                        },
+                        "simulation": PARAMETERS,
+                    })
+
+                working: Path = Path(simulation.parameters.output["working"])
+                files.append(f"{working / f'shard_{index}.json'}")
+
+                self.assertEqual(index, simulation.parameters.shard["index"])
+
+            # The shards, in any order, merge into the single run.
+            results: Results = merge_shards(files[::-1])
+            results.statistics_process()
+
+            self.assertEqual(
+                expected.results.get_dictionary(), results.get_dictionary()
+            )
+
+            # Auxiliary variables.
+            shards: list = [_load_shard(x) for x in files]
+
+            _validate_shards(shards, files)
+
+            # The parameters that do not change the results can differ.
+            mismatched: dict = copy.deepcopy(shards[1])
+            mismatched["parameters"]["workers"] = 2
+
+            _validate_shards([shards[0], mismatched, shards[2]], files)
+
+            # The other parameters must match.
+            mismatched["parameters"]["length"] = 13
+
+            with self.assertRaises(ValueError, msg="Mismatched parameters."):
+                _validate_shards([shards[0], mismatched, shards[2]], files)
+
+            # Every repetition must be in exactly one shard.
+            with self.assertRaises(ValueError, msg="Duplicate shards."):
+                _validate_shards(shards + shards[1:2], files + files[1:2])
+
+            with self.assertRaises(ValueError, msg="Missing shards."):
+                _validate_shards(shards[::2], files[::2])
+
+            # The environment variable must hold the index of the shard.
+            with mock.patch.dict(os.environ, {VARIABLE: "first"}):
+                with self.assertRaises(ValueError, msg="Invalid index."):
+                    Simulation({
+                        "output": {"working": directory},
+                        "shard": {"count": COUNT, "variable": VARIABLE},
+                        "simulation": PARAMETERS,
+                    })
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
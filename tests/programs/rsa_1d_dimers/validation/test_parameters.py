@@ -11,6 +11,11 @@
 # Standard library.
 import unittest
 
+# User.
+from stochastic_kmc.programs.rsa_1d_dimers.validation.parameters import (
+    validate
+)
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Classes
@@ -31,6 +36,26 @@ class TestRSA1DDimersParametersValidation(unittest.TestCase):
         """
         self.assertEqual(1, 1)
 
+    def test_seed(self) -> None:
+        """
+            Tests that the shards of a simulation must use an explicit seed,
+            while a single shard can draw its seed from the operating system.
+        """
+        # A single shard draws a non-negative seed.
+        parameters: dict = validate({"simulation": {"seed": -1}})
+
+        self.assertGreaterEqual(parameters["simulation"]["seed"], 0)
+
+        # The shards must share an explicit seed.
+        parameters = validate({
+            "shard": {"count": 2}, "simulation": {"seed": 7}
+        })
+
+        self.assertEqual(7, parameters["simulation"]["seed"])
+
+        with self.assertRaises(ValueError):
+            validate({"shard": {"count": 2}, "simulation": {"seed": -1}})
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Main Program
@@ -0,0 +1,119 @@
+"""
+    Contains the unit tests for the RSA 1D Nearest Neighbor Exclusion
+    Ensemble class.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import unittest
+
+from importlib.util import find_spec
+
+# User.
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.classes.ensemble import (
+    Ensemble
+)
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.classes.lattice import Lattice
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.classes.statistics import (
+    _get_available,
+    _get_continuous_empty,
+    _get_coverage
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+@unittest.skipIf(find_spec("numpy") is None, "NumPy is not installed.")
+class TestRSA1DNNExclusionEnsemble(unittest.TestCase):
+    """
+        Contains the tests for the ensemble of lattices.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_counters(self) -> None:
+        """
+            Tests that the running counters of every lattice, validated after
+            every attempt in debug mode, are the same as the quantities
+            obtained by scanning the lattice, and that the sums, and the sums
+            of the squares, are those of the counters.
+        """
+        for periodic in (False, True):
+            # Auxiliary variables.
+            ensemble: Ensemble = Ensemble({
+                "attempts": 100, "debug": True, "length": 17,
+                "periodic": periodic, "repetitions": 9, "sampling": {
+                    "number": 100, "points": [], "scale": "linear", "step": 1
+                },
+                "seed": 1
+            })
+            msg: str = f"The counters must match the lattice; {periodic=}."
+
+            for attempt in range(100):
+                ensemble.run_attempt(attempt)
+
+            scan: dict = ensemble._get_scan_counters()
+
+            for i, row in enumerate(ensemble.lattices.tolist()):
+                # Quantities from scanning the lattice.
+                expected: dict = {
+                    "occupied": _get_coverage(row),
+                    "empty_single": _get_continuous_empty(row, 1, periodic),
+                    "empty_double": _get_continuous_empty(row, 2, periodic),
+                    "empty_triple": _get_continuous_empty(row, 3, periodic),
+                    "available": _get_available(row, periodic),
+                }
+                counters: dict = {
+                    x: int(y[i]) for x, y in ensemble.counters.items()
+                }
+
+                self.assertEqual(expected, counters, msg)
+                self.assertEqual(
+                    expected, {x: int(y[i]) for x, y in scan.items()}, msg
+                )
+
+            # The last sums must be those of the counters.
+            self.assertEqual(
+                int(ensemble.counters["occupied"].sum()),
+                int(ensemble.sums["coverage"][-1]),
+                msg
+            )
+            self.assertEqual(
+                sum(x * x for x in ensemble.counters["occupied"].tolist()),
+                int(ensemble.squares["coverage"][-1]),
+                msg
+            )
+
+            # Every particle takes a single site.
+            self.assertEqual(
+                ensemble.successful,
+                int(ensemble.counters["occupied"].sum()),
+                msg
+            )
+            self.assertTrue(set(ensemble.lattices.ravel().tolist()) <= {
+                Lattice.EMPTY, Lattice.OCCUPIED
+            })
+
+            # The debug mode must catch a wrong counter.
+            ensemble.counters["available"][0] += 1
+
+            with self.assertRaises(ValueError, msg=msg):
+                ensemble.run_attempt(100)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,270 @@
+"""
+    Contains the unit tests for the RSA 1D Nearest Neighbor Exclusion Lattice
+    class.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import random
+import unittest
+
+# User.
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.classes.lattice import Lattice
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.classes.statistics import (
+    _get_available,
+    _get_continuous_empty,
+    _get_coverage
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestRSA1DNNExclusionLattice(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_available_sites(self, lattice: Lattice) -> set:
+        """
+            Gets the sites where a particle can still be adsorbed, by scanning
+            the whole lattice.
+
+            :param lattice: The lattice with the particles.
+
+            :return: The set with the sites that are empty, and whose nearest
+             neighbors inside the lattice are empty.
+        """
+        # Auxiliary variables.
+        length: int = lattice.length
+        rows: bytearray = lattice.lattice
+        sites: set = set()
+
+        for site in range(length):
+            # The site and its nearest neighbors.
+            neighbors: list = [site - 1, site, site + 1]
+
+            if lattice.periodic:
+                neighbors = [x % length for x in neighbors]
+
+            if all(
+                rows[x] == Lattice.EMPTY
+                for x in neighbors if 0 <= x < length
+            ):
+                sites.add(site)
+
+        return sites
+
+    def _get_gaps_lattice(self, lattice: Lattice) -> bytearray:
+        """
+            Gets a lattice with the same gaps as the lattice of the gaps
+            engine; the order of the gaps is lost, but not the quantities
+            obtained by scanning the lattice, since the particles of the
+            nearest neighbor exclusion are never next to each other.
+
+            :param lattice: The lattice of the gaps engine.
+
+            :return: The array of bytes with the gaps in between particles.
+        """
+        # Auxiliary variables.
+        empty: bytes = bytes((Lattice.EMPTY,))
+        occupied: bytes = bytes((Lattice.OCCUPIED,))
+        gaps: dict = {x: [] for x in Lattice.GAPS}
+
+        for (kind, length), number in sorted(lattice.histogram.items()):
+            gaps[Lattice.GAPS[kind]].extend([length] * number)
+
+        # The empty lattice is a single gap.
+        if gaps["open"] or gaps["ring"]:
+            return bytearray(empty * lattice.length)
+
+        # Every interior gap follows a particle; the walls of an open lattice
+        # are next to the edge gaps, that can be empty.
+        edges: list = gaps["edge"] + [0] * (2 - len(gaps["edge"]))
+        rows: bytearray = bytearray()
+
+        if not lattice.periodic:
+            rows += empty * edges[0] + occupied
+
+        for length in gaps["interior"]:
+            rows += empty * length + occupied
+
+        if not lattice.periodic:
+            rows += empty * edges[1]
+
+        return rows
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_available(self) -> None:
+        """
+            Tests that the set of available sites of the rejection free engine
+            is the same as the sites obtained by scanning the whole lattice,
+            after every adsorption at a site chosen from the set, until the
+            lattice is jammed.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+
+        for periodic in (False, True):
+            # Auxiliary variables.
+            lattice: Lattice = Lattice({
+                "engine": "rejection_free", "length": 17, "periodic": periodic
+            })
+            msg: str = f"The available sites must match; {periodic=}."
+
+            self.assertEqual(
+                self._get_available_sites(lattice),
+                set(lattice.available.items),
+                msg
+            )
+
+            while not lattice.is_jammed():
+                # Every site of the set must take a particle.
+                site: int = lattice.available.choice(generator)
+
+                self.assertTrue(
+                    lattice.particle_adsorb(site), f"{msg} {site=}."
+                )
+
+                # The set must match the scan, and the counters.
+                self.assertEqual(
+                    self._get_available_sites(lattice),
+                    set(lattice.available.items),
+                    msg
+                )
+                self.assertEqual(
+                    lattice.counters["available"], len(lattice.available), msg
+                )
+
+            # The jammed lattice has no available sites left.
+            self.assertEqual(0, len(lattice.available), msg)
+            self.assertEqual(0, _get_available(lattice.lattice, periodic), msg)
+
+            # The set must be reset with the lattice.
+            lattice.reset()
+
+            self.assertEqual(
+                self._get_available_sites(lattice),
+                set(lattice.available.items),
+                msg
+            )
+
+    def test_counters(self) -> None:
+        """
+            Tests that the running counters are the same as the quantities
+            obtained by scanning the whole lattice.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+
+        for periodic in (False, True):
+            # Auxiliary variables.
+            lattice: Lattice = Lattice({
+                "engine": "standard", "length": 17, "periodic": periodic
+            })
+            msg: str = f"The counters must match the lattice; {periodic=}."
+
+            for _ in range(200):
+                lattice.particle_adsorb(generator.randint(0, 16))
+
+                # Quantities from scanning the lattice.
+                expected: dict = {
+                    "occupied": _get_coverage(lattice.lattice),
+                    "empty_single": _get_continuous_empty(
+                        lattice.lattice, 1, periodic
+                    ),
+                    "empty_double": _get_continuous_empty(
+                        lattice.lattice, 2, periodic
+                    ),
+                    "empty_triple": _get_continuous_empty(
+                        lattice.lattice, 3, periodic
+                    ),
+                    "available": _get_available(lattice.lattice, periodic),
+                }
+
+                self.assertEqual(expected, lattice.counters, msg)
+
+            # The lattice is jammed once no site is available.
+            self.assertTrue(lattice.is_jammed(), msg)
+
+            # The counters must be reset with the lattice.
+            lattice.reset()
+
+            self.assertEqual(0, lattice.counters["occupied"], msg)
+            self.assertEqual(17, lattice.counters["empty_single"], msg)
+            self.assertEqual(17, lattice.counters["available"], msg)
+
+    def test_gaps(self) -> None:
+        """
+            Tests that the running counters of the gaps engine are the same as
+            the quantities obtained by scanning all the gaps, until the lattice
+            is jammed.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+        interior: int = Lattice.GAPS.index("interior")
+        edge: int = Lattice.GAPS.index("edge")
+
+        for periodic in (False, True):
+            # Auxiliary variables.
+            lattice: Lattice = Lattice({
+                "engine": "gaps", "length": 101, "periodic": periodic
+            })
+            msg: str = f"The counters must match the gaps; {periodic=}."
+
+            while not lattice.is_jammed():
+                lattice.particle_adsorb_random(generator)
+
+                # Quantities from scanning a lattice with the same gaps.
+                rows: bytearray = self._get_gaps_lattice(lattice)
+                expected: dict = {
+                    "occupied": _get_coverage(rows),
+                    "empty_single": _get_continuous_empty(rows, 1, periodic),
+                    "empty_double": _get_continuous_empty(rows, 2, periodic),
+                    "empty_triple": _get_continuous_empty(rows, 3, periodic),
+                    "available": _get_available(rows, periodic),
+                }
+
+                self.assertEqual(len(rows), lattice.length, msg)
+                self.assertEqual(expected, lattice.get_gap_counters(), msg)
+                self.assertEqual(
+                    lattice.get_gap_counters(), lattice.counters, msg
+                )
+                self.assertEqual(
+                    lattice.counters["available"], lattice.gaps.total, msg
+                )
+
+            # Only the gaps where no particle fits are left.
+            self.assertEqual(0, lattice.counters["available"], msg)
+            self.assertTrue(
+                set(lattice.histogram) <= {
+                    (interior, 1), (interior, 2), (edge, 1)
+                },
+                msg
+            )
+
+            # The gaps engine does not keep the sites.
+            with self.assertRaises(ValueError, msg="There are no sites."):
+                lattice.particle_adsorb(0)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+    Contains the unit tests for the RSA 1D Nearest Neighbor Exclusion
+    simulation class.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import math
+import tempfile
+import unittest
+
+# User.
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.classes.results import Results
+from stochastic_kmc.programs.rsa_1d_nn_exclusion.simulation import Simulation
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The number of repetitions of each engine.
+REPETITIONS: int = 400
+
+# The largest difference between the means of the engines, in units of the
+# standard error of the difference.
+TOLERANCE: float = 5.0
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestRSA1DNNExclusionSimulation(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_results(self, engine: str, periodic: bool) -> Results:
+        """
+            Gets the processed results of the repetitions of a simulation on a
+            small lattice, run with the given engine.
+
+            :param engine: The engine of the simulation.
+
+            :param periodic: A boolean flag indicating whether the lattice is
+             periodic.
+
+            :return: The results of the repetitions, after the statistics are
+             processed.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Auxiliary variables; the counters are validated at every step.
+            simulation: Simulation = Simulation({
+                "output": {"working": directory},
+                "simulation": {
+                    "attempts": 60,
+                    "debug": True,
+                    "engine": engine,
+                    "length": 11,
+                    "periodic": periodic,
+                    "repetitions": REPETITIONS,
+                    "seed": 1,
+                },
+            })
+
+            results, _, _ = simulation._run_repetitions(range(REPETITIONS))
+
+        results.statistics_process()
+
+        return results
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_rejection_free(self) -> None:
+        """
+            Tests that the rejection free and the gaps engines give the same
+            statistics as the standard engine, i.e., that the attempts in
+            between successful attempts follow the geometric distribution with
+            the probability "available / length" of choosing an available
+            site, within the statistical errors.
+        """
+        for periodic in (False, True):
+            # Auxiliary variables.
+            expected: Results = self._get_results("standard", periodic)
+
+            for engine in ("gaps", "rejection_free"):
+                # Auxiliary variables.
+                results: Results = self._get_results(engine, periodic)
+
+                for name in Results.HEADERS:
+                    # The means must agree within the errors.
+                    for i, (x, y, u, v) in enumerate(zip(
+                        getattr(expected, name), getattr(results, name),
+                        expected.errors[name], results.errors[name]
+                    )):
+                        self.assertLessEqual(
+                            abs(x - y), TOLERANCE * math.hypot(u, v),
+                            f"The engines must agree; {periodic=}, "
+                            f"{engine=}, {name=}, {i=}."
+                        )
+
+                # The time stamps are the same.
+                self.assertEqual(
+                    list(expected.points), list(results.points)
+                )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
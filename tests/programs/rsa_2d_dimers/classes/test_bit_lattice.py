@@ -0,0 +1,195 @@
+"""
+    Contains the unit tests for the RSA 2D Dimers BitLattice class.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import random
+import unittest
+
+# User.
+from stochastic_kmc.programs.rsa_2d_dimers.classes.bit_lattice import (
+    BitLattice
+)
+from stochastic_kmc.programs.rsa_2d_dimers.classes.lattice import Lattice
+from stochastic_kmc.programs.rsa_2d_dimers.classes.statistics import (
+    _get_available,
+    _get_coverage
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The dimensions of the lattices.
+DIMENSIONS: dict = {"length": 7, "width": 9}
+
+# The periodicity of the lattices, open and periodic along each dimension.
+PERIODIC: tuple = tuple(
+    {"length": x, "width": y} for x in (False, True) for y in (False, True)
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestRSA2DDimersBitLattice(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_engine(self) -> None:
+        """
+            Tests that the bit lattice can only be used with the standard
+            engine.
+        """
+        for engine in ("ensemble", "rejection_free"):
+            with self.assertRaises(ValueError, msg=f"{engine=}"):
+                BitLattice({
+                    "dimensions": DIMENSIONS,
+                    "engine": engine,
+                    "periodic": PERIODIC[0],
+                })
+
+    def test_is_jammed(self) -> None:
+        """
+            Tests that the lattice is jammed at the end of a run, i.e., when
+            no more dimers can be adsorbed.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+
+        for periodic in PERIODIC:
+            # Auxiliary variables.
+            lattice: BitLattice = BitLattice({
+                "dimensions": DIMENSIONS,
+                "engine": "standard",
+                "periodic": periodic,
+            })
+            msg: str = f"The lattice must be jammed; {periodic=}."
+
+            while not lattice.is_jammed():
+                lattice.particle_adsorb(
+                    generator.randint(0, DIMENSIONS["length"] - 1),
+                    generator.randint(0, DIMENSIONS["width"] - 1),
+                    generator.choice(Lattice.DIRECTIONS)
+                )
+
+            # No bond is left, neither in the masks nor in the lattice.
+            self.assertEqual(0, lattice.get_mask_counters()["available"], msg)
+            self.assertEqual(0, _get_available(lattice.lattice, periodic), msg)
+
+            # No dimer can be adsorbed anymore.
+            for i in range(DIMENSIONS["length"]):
+                for j in range(DIMENSIONS["width"]):
+                    for direction in Lattice.DIRECTIONS:
+                        self.assertFalse(
+                            lattice.particle_adsorb(i, j, direction), msg
+                        )
+
+    def test_mask_counters(self) -> None:
+        """
+            Tests that the counters obtained from the masks of the rows are
+            the same as the running counters, and as the quantities obtained
+            by scanning the whole lattice.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+
+        for periodic in PERIODIC:
+            # Auxiliary variables.
+            lattice: BitLattice = BitLattice({
+                "dimensions": DIMENSIONS,
+                "engine": "standard",
+                "periodic": periodic,
+            })
+            msg: str = f"The counters must match the masks; {periodic=}."
+
+            for _ in range(300):
+                lattice.particle_adsorb(
+                    generator.randint(0, DIMENSIONS["length"] - 1),
+                    generator.randint(0, DIMENSIONS["width"] - 1),
+                    generator.choice(Lattice.DIRECTIONS)
+                )
+
+                # Quantities from scanning the lattice.
+                expected: dict = {
+                    "available": _get_available(lattice.lattice, periodic),
+                    "occupied": _get_coverage(lattice.lattice),
+                }
+
+                self.assertEqual(lattice.counters, lattice.get_mask_counters())
+                self.assertEqual(expected, lattice.counters, msg)
+
+            # The counters must be reset with the lattice.
+            lattice.reset()
+
+            self.assertEqual(lattice.counters, lattice.get_mask_counters())
+            self.assertEqual(0, lattice.counters["occupied"], msg)
+
+    def test_particle_adsorb(self) -> None:
+        """
+            Tests that the bit lattice adsorbs the same dimers as the lattice
+            of bytes, and keeps the same counters, for open and periodic
+            lattices.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+
+        for periodic in PERIODIC:
+            # Auxiliary variables.
+            parameters: dict = {
+                "dimensions": DIMENSIONS,
+                "engine": "standard",
+                "periodic": periodic,
+            }
+            bits: BitLattice = BitLattice(parameters)
+            lattice: Lattice = Lattice(parameters)
+            msg: str = f"The lattices must be the same; {periodic=}."
+
+            for _ in range(300):
+                # Auxiliary variables.
+                site: tuple = (
+                    generator.randint(0, DIMENSIONS["length"] - 1),
+                    generator.randint(0, DIMENSIONS["width"] - 1),
+                    generator.choice(Lattice.DIRECTIONS),
+                )
+
+                self.assertEqual(
+                    lattice.particle_adsorb(*site),
+                    bits.particle_adsorb(*site),
+                    f"{msg} {site=}."
+                )
+                self.assertEqual(lattice.counters, bits.counters, msg)
+
+            self.assertEqual(
+                [list(x) for x in lattice.lattice], bits.lattice, msg
+            )
+
+            # The sites must be inside the lattice.
+            with self.assertRaises(ValueError, msg=msg):
+                bits.particle_adsorb(DIMENSIONS["length"], 0, "up")
+
+            with self.assertRaises(ValueError, msg=msg):
+                bits.particle_adsorb(0, -1, "up")
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+    Contains the unit tests for the RSA 2D Dimers Ensemble class.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import unittest
+
+from importlib.util import find_spec
+
+# User.
+from stochastic_kmc.programs.rsa_2d_dimers.classes.ensemble import Ensemble
+from stochastic_kmc.programs.rsa_2d_dimers.classes.lattice import Lattice
+from stochastic_kmc.programs.rsa_2d_dimers.classes.statistics import (
+    _get_available,
+    _get_coverage
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The dimensions of the lattices.
+DIMENSIONS: dict = {"length": 7, "width": 9}
+
+# The periodicity of the lattices, open and periodic along each dimension.
+PERIODIC: tuple = tuple(
+    {"length": x, "width": y} for x in (False, True) for y in (False, True)
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+@unittest.skipIf(find_spec("numpy") is None, "NumPy is not installed.")
+class TestRSA2DDimersEnsemble(unittest.TestCase):
+    """
+        Contains the tests for the ensemble of lattices.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_counters(self) -> None:
+        """
+            Tests that the running counters of every lattice, validated after
+            every attempt in debug mode, are the same as the quantities
+            obtained by scanning the lattice, and that the sums, and the sums
+            of the squares, are those of the counters.
+        """
+        for periodic in PERIODIC:
+            # Auxiliary variables.
+            ensemble: Ensemble = Ensemble({
+                "attempts": 100, "debug": True, "dimensions": DIMENSIONS,
+                "engine": "ensemble", "periodic": periodic, "repetitions": 9,
+                "sampling": {
+                    "number": 100, "points": [], "scale": "linear", "step": 1
+                },
+                "seed": 1
+            })
+            msg: str = f"The counters must match the lattice; {periodic=}."
+
+            for attempt in range(100):
+                ensemble.run_attempt(attempt)
+
+            scan: dict = ensemble._get_scan_counters()
+
+            for i, row in enumerate(ensemble.lattices.tolist()):
+                # Quantities from scanning the lattice.
+                expected: dict = {
+                    "available": _get_available(row, periodic),
+                    "occupied": _get_coverage(row),
+                }
+                counters: dict = {
+                    x: int(y[i]) for x, y in ensemble.counters.items()
+                }
+
+                self.assertEqual(expected, counters, msg)
+                self.assertEqual(
+                    expected, {x: int(y[i]) for x, y in scan.items()}, msg
+                )
+
+            # The last sums must be those of the counters.
+            self.assertEqual(
+                int(ensemble.counters["occupied"].sum()),
+                int(ensemble.sums["coverage"][-1]),
+                msg
+            )
+            self.assertEqual(
+                sum(x * x for x in ensemble.counters["occupied"].tolist()),
+                int(ensemble.squares["coverage"][-1]),
+                msg
+            )
+
+            # Every dimer takes two sites.
+            self.assertEqual(
+                2 * ensemble.successful,
+                int(ensemble.counters["occupied"].sum()),
+                msg
+            )
+            self.assertTrue(set(ensemble.lattices.ravel().tolist()) <= {
+                Lattice.EMPTY, Lattice.OCCUPIED
+            })
+
+            # The debug mode must catch a wrong counter.
+            ensemble.counters["available"][0] += 1
+
+            with self.assertRaises(ValueError, msg=msg):
+                ensemble.run_attempt(100)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
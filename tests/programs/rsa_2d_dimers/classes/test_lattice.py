@@ -0,0 +1,164 @@
+"""
+    Contains the unit tests for the RSA 2D Dimers Lattice class.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import random
+import unittest
+
+# User.
+from stochastic_kmc.programs.rsa_2d_dimers.classes.lattice import Lattice
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The dimensions of the lattices.
+DIMENSIONS: dict = {"length": 7, "width": 9}
+
+# The (row, column) offset of the other site of the bonds that start at each
+# site, in the order of the directions of the bonds.
+OFFSETS: tuple = (0, 1), (1, 0)
+
+# The periodicity of the lattices, open and periodic along each dimension.
+PERIODIC: tuple = tuple(
+    {"length": x, "width": y} for x in (False, True) for y in (False, True)
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestRSA2DDimersLattice(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_available_bonds(self, lattice: Lattice) -> set:
+        """
+            Gets the bonds where a dimer can still be adsorbed, by scanning
+            the whole lattice.
+
+            :param lattice: The lattice with the particles.
+
+            :return: The set with the numbers of the bonds whose two sites
+             are inside the lattice and empty.
+        """
+        # Auxiliary variables.
+        bonds: set = set()
+        length: int = lattice.dimensions["length"]
+        width: int = lattice.dimensions["width"]
+        rows: list = lattice.lattice
+
+        for i in range(length):
+            for j in range(width):
+                for k, (row, column) in enumerate(OFFSETS):
+                    # The other site of the bond.
+                    x: int = i + row
+                    y: int = j + column
+
+                    x = x % length if lattice.periodic["length"] else x
+                    y = y % width if lattice.periodic["width"] else y
+
+                    if x >= length or y >= width:
+                        continue
+
+                    if rows[i][j] == rows[x][y] == Lattice.EMPTY:
+                        bonds.add(2 * (i * width + j) + k)
+
+        return bonds
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_available(self) -> None:
+        """
+            Tests that the set of available bonds of the rejection free engine
+            is the same as the bonds obtained by scanning the whole lattice,
+            after every adsorption at a bond chosen from the set, until the
+            lattice is jammed.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+        width: int = DIMENSIONS["width"]
+
+        for periodic in PERIODIC:
+            # Auxiliary variables.
+            lattice: Lattice = Lattice({
+                "dimensions": DIMENSIONS,
+                "engine": "rejection_free",
+                "periodic": periodic,
+            })
+            msg: str = f"The available bonds must match; {periodic=}."
+
+            self.assertEqual(
+                self._get_available_bonds(lattice),
+                set(lattice.available.items),
+                msg
+            )
+
+            while not lattice.is_jammed():
+                # Every bond of the set must take a dimer.
+                bond: int = lattice.available.choice(generator)
+                site: int = bond // 2
+
+                self.assertTrue(
+                    lattice.particle_adsorb(
+                        site // width, site % width, Lattice.BONDS[bond % 2]
+                    ),
+                    f"{msg} {bond=}."
+                )
+
+                # The set must match the scan, and the counters.
+                self.assertEqual(
+                    self._get_available_bonds(lattice),
+                    set(lattice.available.items),
+                    msg
+                )
+                self.assertEqual(
+                    lattice.counters["available"], len(lattice.available), msg
+                )
+
+            # The jammed lattice has no available bonds left.
+            self.assertEqual(0, len(lattice.available), msg)
+
+            # The set must be reset with the lattice.
+            lattice.reset()
+
+            self.assertEqual(
+                self._get_available_bonds(lattice),
+                set(lattice.available.items),
+                msg
+            )
+
+        # The standard engine does not keep the available bonds.
+        lattice = Lattice({
+            "dimensions": DIMENSIONS,
+            "engine": "standard",
+            "periodic": PERIODIC[0],
+        })
+
+        self.assertIsNone(lattice.available)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+    Contains the unit tests for the RSA 2D Dimers parameter validation script.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import unittest
+
+# User.
+from stochastic_kmc.programs.rsa_2d_dimers.validation.parameters import (
+    validate
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestRSA2DDimersParametersValidation(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_backend(self) -> None:
+        """
+            Tests that the bits backend is only accepted with the standard
+            engine, and that unknown backends are rejected.
+        """
+        # The standard engine can use both backends.
+        for backend in ("bits", "bytes"):
+            parameters: dict = validate({"simulation": {"backend": backend}})
+
+            self.assertEqual(backend, parameters["simulation"]["backend"])
+
+        # The other engines need the bytes backend.
+        for engine in ("ensemble", "rejection_free"):
+            with self.assertRaises(ValueError, msg=f"{engine=}"):
+                validate({
+                    "simulation": {"backend": "bits", "engine": engine}
+                })
+
+        # The backend must exist.
+        with self.assertRaises(ValueError):
+            validate({"simulation": {"backend": "words"}})
+
+    def test_seed(self) -> None:
+        """
+            Tests that the shards of a simulation must use an explicit seed,
+            while a single shard can draw its seed from the operating system.
+        """
+        # A single shard draws a non-negative seed.
+        parameters: dict = validate({"simulation": {"seed": -1}})
+
+        self.assertGreaterEqual(parameters["simulation"]["seed"], 0)
+
+        # The shards must share an explicit seed.
+        parameters = validate({
+            "shard": {"count": 2}, "simulation": {"seed": 7}
+        })
+
+        self.assertEqual(7, parameters["simulation"]["seed"])
+
+        with self.assertRaises(ValueError):
+            validate({"shard": {"count": 2}, "simulation": {"seed": -1}})
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+    Contains the unit tests for the RSA 2D Nearest Neighbor Exclusion Lattice
+    class.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import random
+import unittest
+
+# User.
+from stochastic_kmc.programs.rsa_2d_nn_exclusion.classes.lattice import Lattice
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The dimensions of the lattices.
+DIMENSIONS: dict = {"length": 7, "width": 9}
+
+# The (row, column) offsets of the nearest neighbors of a site.
+OFFSETS: tuple = (-1, 0), (1, 0), (0, -1), (0, 1)
+
+# The periodicity of the lattices, open and periodic along each dimension.
+PERIODIC: tuple = tuple(
+    {"length": x, "width": y} for x in (False, True) for y in (False, True)
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestRSA2DNNExclusionLattice(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_available_sites(self, lattice: Lattice) -> set:
+        """
+            Gets the sites where a particle can still be adsorbed, by scanning
+            the whole lattice.
+
+            :param lattice: The lattice with the particles.
+
+            :return: The set with the numbers of the sites that are empty,
+             and whose nearest neighbors inside the lattice are empty.
+        """
+        # Auxiliary variables.
+        sites: set = set()
+        length: int = lattice.dimensions["length"]
+        width: int = lattice.dimensions["width"]
+        rows: list = lattice.lattice
+
+        for i in range(length):
+            for j in range(width):
+                # The site and its nearest neighbors.
+                neighborhood: list = [(i, j)] + [
+                    (i + x, j + y) for x, y in OFFSETS
+                ]
+
+                if lattice.periodic["length"]:
+                    neighborhood = [(x % length, y) for x, y in neighborhood]
+
+                if lattice.periodic["width"]:
+                    neighborhood = [(x, y % width) for x, y in neighborhood]
+
+                if all(
+                    rows[x][y] == Lattice.EMPTY for x, y in neighborhood
+                    if 0 <= x < length and 0 <= y < width
+                ):
+                    sites.add(i * width + j)
+
+        return sites
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_available(self) -> None:
+        """
+            Tests that the set of available sites of the rejection free engine
+            is the same as the sites obtained by scanning the whole lattice,
+            after every adsorption at a site chosen from the set, until the
+            lattice is jammed.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+        width: int = DIMENSIONS["width"]
+
+        for periodic in PERIODIC:
+            # Auxiliary variables.
+            lattice: Lattice = Lattice({
+                "dimensions": DIMENSIONS,
+                "engine": "rejection_free",
+                "periodic": periodic,
+            })
+            msg: str = f"The available sites must match; {periodic=}."
+
+            self.assertEqual(
+                self._get_available_sites(lattice),
+                set(lattice.available.items),
+                msg
+            )
+
+            while not lattice.is_jammed():
+                # Every site of the set must take a particle.
+                site: int = lattice.available.choice(generator)
+
+                self.assertTrue(
+                    lattice.particle_adsorb(site // width, site % width),
+                    f"{msg} {site=}."
+                )
+
+                # The set must match the scan, and the counters.
+                self.assertEqual(
+                    self._get_available_sites(lattice),
+                    set(lattice.available.items),
+                    msg
+                )
+                self.assertEqual(
+                    lattice.counters["available"], len(lattice.available), msg
+                )
+
+            # The jammed lattice has no available sites left.
+            self.assertEqual(0, len(lattice.available), msg)
+
+            # The set must be reset with the lattice.
+            lattice.reset()
+
+            self.assertEqual(
+                self._get_available_sites(lattice),
+                set(lattice.available.items),
+                msg
+            )
+
+        # The standard engine does not keep the available sites.
+        lattice = Lattice({
+            "dimensions": DIMENSIONS,
+            "engine": "standard",
+            "periodic": PERIODIC[0],
+        })
+
+        self.assertIsNone(lattice.available)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
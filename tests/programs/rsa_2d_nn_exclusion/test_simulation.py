@@ -0,0 +1,140 @@
+"""
+    Contains the unit tests for the RSA 2D Nearest Neighbor Exclusion
+    simulation.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import math
+import statistics
+import tempfile
+import unittest
+
+# User.
+from stochastic_kmc.programs.rsa_2d_nn_exclusion.simulation import Simulation
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# The number of attempts of every repetition.
+ATTEMPTS: int = 120
+
+# The periodicity of the lattices, open and periodic along both dimensions.
+PERIODIC: tuple = (
+    {"length": False, "width": False}, {"length": True, "width": True}
+)
+
+# The number of repetitions of each engine.
+REPETITIONS: int = 400
+
+# The largest difference between the means of the engines, in units of the
+# standard error of the difference.
+TOLERANCE: float = 5.0
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestRSA2DNNExclusionSimulation(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _get_coverage(self, engine: str, periodic: dict) -> list:
+        """
+            Gets the statistics of the number of occupied sites after every
+            attempt, over the repetitions of a simulation on a small lattice,
+            run with the given engine; the counters are validated at every
+            step.
+
+            :param engine: The engine of the simulation.
+
+            :param periodic: A dictionary with the periodicity of the "length"
+             and the "width" of the lattice.
+
+            :return: The list with the mean number of occupied sites after
+             every attempt, and the list with its standard error.
+        """
+        # Auxiliary variables.
+        coverage: list = []
+
+        with tempfile.TemporaryDirectory() as directory:
+            simulation: Simulation = Simulation({
+                "output": {"working": directory},
+                "simulation": {
+                    "attempts": ATTEMPTS,
+                    "debug": True,
+                    "dimensions": {"length": 4, "width": 5},
+                    "engine": engine,
+                    "periodic": periodic,
+                    "repetitions": REPETITIONS,
+                    "seed": 1,
+                },
+            })
+
+            for _ in range(REPETITIONS):
+                simulation._run_simulation()
+                coverage.append(list(simulation.statistics.coverage))
+
+                # The next repetition.
+                simulation.parameters.current_attempts = 0
+                simulation.parameters.current_repetition += 1
+                simulation._set_simulation()
+
+        # The columns of every attempt.
+        columns: list = list(zip(*coverage))
+
+        return (
+            list(map(statistics.fmean, columns)),
+            [statistics.stdev(x) / math.sqrt(len(x)) for x in columns],
+        )
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_rejection_free(self) -> None:
+        """
+            Tests that the rejection free engine gives the same statistics as
+            the standard engine, i.e., that the attempts in between successful
+            attempts follow the geometric distribution with the probability of
+            choosing an available site, within the statistical errors.
+        """
+        for periodic in PERIODIC:
+            # Auxiliary variables.
+            expected, errors = self._get_coverage("standard", periodic)
+            means, deviations = self._get_coverage("rejection_free", periodic)
+
+            # Before the first attempt, and after every attempt.
+            self.assertEqual(ATTEMPTS + 1, len(means))
+
+            # The means must agree within the errors.
+            for i, (x, y, u, v) in enumerate(
+                zip(expected, means, errors, deviations)
+            ):
+                self.assertLessEqual(
+                    abs(x - y), TOLERANCE * math.hypot(u, v),
+                    f"The engines must agree; {periodic=}, {i=}."
+                )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+    Contains the unit tests for the columns utilities.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import tempfile
+import unittest
+
+from pathlib import Path
+
+# User.
+from stochastic_kmc.utilities.columns import read_columns, write_columns
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestUtilitiesColumns(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+
+        Methods:
+        ________
+
+        - test_write_columns.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_write_columns(self) -> None:
+        """
+            Tests that the chunks written are read back as whole columns, that
+            writing at a previous position drops the chunks after it, and that
+            an incomplete chunk throws an error.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Auxiliary variables.
+            file: str = f"{Path(directory) / 'table.bin'}"
+
+            # Two chunks, of three and two rows, and a stale chunk.
+            write_columns(file, [[0, 1, 2], [5, -6, 7]], 0)
+            write_columns(file, [[3, 4], [2 ** 40, 9]], 7)
+            write_columns(file, [[5], [10]], 12)
+
+            self.assertEqual(
+                [[0, 1, 2, 3, 4, 5], [5, -6, 7, 2 ** 40, 9, 10]],
+                [list(x) for x in read_columns(file, 2)]
+            )
+
+            # Write the second chunk again.
+            write_columns(file, [[3, 4], [8, 9]], 7)
+
+            self.assertEqual(
+                [[0, 1, 2, 3, 4], [5, -6, 7, 8, 9]],
+                [list(x) for x in read_columns(file, 2)]
+            )
+
+            # The number of columns must match.
+            with self.assertRaises(ValueError, msg="Incomplete chunk."):
+                read_columns(file, 3)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+    Contains the unit tests for the container utilities.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import json
+import tempfile
+import unittest
+
+from array import array
+from pathlib import Path
+
+# User.
+from stochastic_kmc.utilities.container import (
+    ALIGNMENT, MAGIC, SIZE, read_container, write_container
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestUtilitiesContainer(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+
+        Methods:
+        ________
+
+        - test_write_container.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_write_container(self) -> None:
+        """
+            Tests that the columns, and the metadata, written to a container
+            are read back, that every column is aligned, and that a file that
+            is not a container, or a column that is not an array, throws an
+            error.
+        """
+        # Auxiliary variables.
+        columns: dict = {
+            "points": array("d", [0.0, 0.5, 1.0]),
+            "empty": array("d"),
+            "odd": array("i", [7, -8, 9]),
+            "seeds": array("Q", [2 ** 64 - 1, 0]),
+        }
+        metadata: dict = {"name": "Test", "parameters": {"length": 3}}
+
+        with tempfile.TemporaryDirectory() as directory:
+            # Auxiliary variables.
+            file: str = f"{Path(directory) / 'results.bin'}"
+
+            write_container(file, metadata, columns)
+            loaded, views = read_container(file)
+
+            self.assertEqual(metadata, loaded)
+            self.assertEqual(list(columns), list(views))
+
+            for name, column in columns.items():
+                self.assertEqual(column.tolist(), views[name].tolist(), name)
+
+            # Release the memory map.
+            del views
+
+            # The columns start at a multiple of the alignment.
+            data: bytes = Path(file).read_bytes()
+            start: int = len(MAGIC) + SIZE.size
+            stop: int = start + SIZE.unpack_from(data, len(MAGIC))[0]
+
+            for column in json.loads(data[start:stop])["columns"]:
+                self.assertEqual(0, column["offset"] % ALIGNMENT)
+
+            # A text file is not a container.
+            Path(file).write_text("RSA 1D Dimers\n", encoding="utf-8")
+
+            with self.assertRaises(ValueError):
+                read_container(file)
+
+            # The unbounded integers do not fit in a column.
+            with self.assertRaises(ValueError):
+                write_container(file, metadata, {"squares": [2 ** 64]})
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,10 +10,14 @@
 
 # Standard library.
 import copy as cp
+import sys
 import unittest
 
 # User.
-from stochastic_kmc.utilities.general import format_dictionary
+from stochastic_kmc.utilities.general import (
+    format_dictionary,
+    is_gil_enabled
+)
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -86,6 +90,18 @@ class TestUtilitiesGeneral(unittest.TestCase):
         with self.assertRaises(KeyError, msg="Key should not exist."):
             format_dictionary(expected, current)
 
+    def test_is_gil_enabled(self) -> None:
+        """
+            Tests that the GIL is reported as enabled, unless the interpreter
+            says otherwise.
+        """
+        # The builds before Python 3.13 always have the GIL.
+        if not hasattr(sys, "_is_gil_enabled"):
+            self.assertTrue(is_gil_enabled())
+            return
+
+        self.assertEqual(sys._is_gil_enabled(), is_gil_enabled())
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Main Program
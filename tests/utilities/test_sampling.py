@@ -0,0 +1,213 @@
+"""
+    Contains the unit tests for the sampling utilities.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import pickle
+import random
+import unittest
+
+# User.
+from stochastic_kmc.utilities.sampling import (
+    get_geometric,
+    get_seed,
+    IndexedSet,
+    UniformSampler,
+    WeightedMultiset
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestUtilitiesSampling(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+
+        Methods:
+        ________
+
+        - test_get_geometric.
+
+        - test_get_seed.
+
+        - test_indexed_set.
+
+        - test_uniform_sampler.
+
+        - test_weighted_multiset.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_get_geometric(self) -> None:
+        """
+            Tests that the number of attempts has the expected mean, and that
+            invalid probabilities throw an error.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+        samples: list = [get_geometric(generator, 0.25) for _ in range(20000)]
+
+        # The mean of the geometric distribution is 1 / probability.
+        msg: str = "The mean number of attempts must be close to 4."
+
+        self.assertTrue(min(samples) >= 1, "Attempts must be positive.")
+        self.assertAlmostEqual(4.0, sum(samples) / len(samples), 1, msg)
+
+        # Every attempt is successful.
+        self.assertEqual(1, get_geometric(generator, 1.0))
+
+        # Invalid probabilities.
+        for probability in (0.0, -0.5, 1.5):
+            with self.assertRaises(ValueError, msg="Invalid probability."):
+                get_geometric(generator, probability)
+
+    def test_get_seed(self) -> None:
+        """
+            Tests that the derived seeds are reproducible, different for each
+            stream, and that negative seeds, or indexes, throw an error.
+        """
+        # Auxiliary variables.
+        seeds: list = [get_seed(7, i) for i in range(1000)]
+
+        # Same root seed and index, same seed.
+        self.assertEqual(seeds, [get_seed(7, i) for i in range(1000)])
+
+        # Different streams, and root seeds, give different seeds.
+        self.assertEqual(1000, len(set(seeds)), "Seeds must be different.")
+        self.assertNotEqual(get_seed(7, 0), get_seed(8, 0))
+        self.assertTrue(all(0 <= x < 1 << 64 for x in seeds))
+
+        # Invalid seeds and indexes.
+        for seed, index in ((-1, 0), (0, -1)):
+            with self.assertRaises(ValueError, msg="Invalid seed or index."):
+                get_seed(seed, index)
+
+    def test_indexed_set(self) -> None:
+        """
+            Tests that the indexed set behaves like a set.
+        """
+        # Auxiliary variables.
+        generator: random.Random = random.Random(1)
+        expected: set = set()
+        current: IndexedSet = IndexedSet(50)
+
+        # Randomly add and remove items.
+        for _ in range(1000):
+            item: int = generator.randint(0, 49)
+
+            if generator.random() < 0.5:
+                expected.add(item)
+                current.add(item)
+
+            else:
+                expected.discard(item)
+                current.discard(item)
+
+            self.assertEqual(len(expected), len(current))
+            self.assertEqual(expected, set(current.items))
+
+        # Chosen items must be in the set.
+        for _ in range(100):
+            self.assertIn(current.choice(generator), expected)
+
+        # Empty the set.
+        current.clear()
+
+        self.assertEqual(0, len(current))
+        self.assertNotIn(0, current)
+
+        with self.assertRaises(ValueError, msg="The set must be empty."):
+            current.choice(generator)
+
+    def test_uniform_sampler(self) -> None:
+        """
+            Tests that the numbers are uniformly distributed in the range, that
+            a pickled sampler hands out the same numbers, and that invalid
+            sizes throw an error.
+        """
+        # Auxiliary variables.
+        counts: list = [0 for _ in range(6)]
+        current: UniformSampler = UniformSampler(random.Random(1), 6, 100)
+
+        # Draw across several blocks.
+        for _ in range(12000):
+            counts[current.draw()] += 1
+
+        for i, count in enumerate(counts):
+            msg: str = f"Frequency of number {i} is not uniform."
+            self.assertAlmostEqual(1 / 6, count / 12000, 1, msg)
+
+        # The pickled sampler resumes in the middle of a block.
+        current.draw()
+
+        loaded: UniformSampler = pickle.loads(pickle.dumps(current))
+
+        self.assertEqual(
+            [current.draw() for _ in range(250)],
+            [loaded.draw() for _ in range(250)],
+            "The pickled sampler must hand out the same numbers."
+        )
+
+        # Invalid sizes and blocks.
+        for size, block in ((0, 10), (1 << 65, 10), (6, 0)):
+            with self.assertRaises(ValueError, msg="Invalid size or block."):
+                UniformSampler(random.Random(1), size, block)
+
+    def test_weighted_multiset(self) -> None:
+        """
+            Tests that the items are drawn in proportion to their weights, and
+            that they are removed when drawn.
+        """
+        # Auxiliary variables.
+        counts: dict = {"a": 0, "b": 0, "c": 0}
+        generator: random.Random = random.Random(1)
+        weights: dict = {"a": 1, "b": 3, "c": 12}
+
+        # Draw a single item many times.
+        for _ in range(16000):
+            current: WeightedMultiset = WeightedMultiset()
+
+            for item, weight in weights.items():
+                current.add(item, weight)
+
+            counts[current.pop(generator)] += 1
+
+            self.assertEqual(2, len(current), "The item must be removed.")
+
+        # The frequencies must be proportional to the weights.
+        for item, weight in weights.items():
+            msg: str = f"Frequency of item \"{item}\" is not proportional."
+            self.assertAlmostEqual(weight / 16, counts[item] / 16000, 1, msg)
+
+        # Drawing all the items empties the multiset.
+        for _ in range(2):
+            current.pop(generator)
+
+        self.assertEqual(0, current.total)
+
+        with self.assertRaises(ValueError, msg="The multiset must be empty."):
+            current.pop(generator)
+
+        # Invalid weights.
+        with self.assertRaises(ValueError, msg="Invalid weight."):
+            current.add("d", 0)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()
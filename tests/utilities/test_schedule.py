@@ -0,0 +1,103 @@
+"""
+    Contains the unit tests for the schedule utilities.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard library.
+import unittest
+
+# User.
+from stochastic_kmc.utilities.schedule import get_points, get_schedule
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TestUtilitiesSchedule(unittest.TestCase):
+    """
+        Contains the tests for the utilities.
+
+        Methods:
+        ________
+
+        - test_get_points.
+        - test_get_schedule.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Tests
+    # /////////////////////////////////////////////////////////////////////////
+
+    def test_get_points(self) -> None:
+        """
+            Tests that the numbers of attempts of the rows are zero followed by
+            the schedule, for every scale.
+        """
+        # Auxiliary variables.
+        sampling: dict = {
+            "number": 4, "points": [5, 2], "scale": "linear", "step": 3
+        }
+
+        for scale in ("explicit", "linear", "log"):
+            sampling["scale"] = scale
+
+            self.assertEqual(
+                [0, *get_schedule(10, sampling)],
+                list(get_points(10, sampling)),
+                scale
+            )
+
+        # Fewer attempts than the step.
+        sampling["scale"] = "linear"
+        self.assertEqual([0], list(get_points(2, sampling)))
+
+    def test_get_schedule(self) -> None:
+        """
+            Tests the numbers of attempts of every scale, and that an unknown
+            scale throws an error.
+        """
+        # Auxiliary variables.
+        sampling: dict = {
+            "number": 7, "points": [9, 3, 3, 1], "scale": "linear", "step": 1
+        }
+
+        # Every attempt, and every third attempt.
+        self.assertEqual(list(range(1, 11)), list(get_schedule(10, sampling)))
+
+        sampling["step"] = 3
+        self.assertEqual([3, 6, 9], list(get_schedule(10, sampling)))
+
+        # The given attempts, once each.
+        sampling["scale"] = "explicit"
+        self.assertEqual([1, 3, 9], get_schedule(10, sampling))
+
+        # Evenly spaced in logarithmic scale, from the first to the last.
+        sampling["scale"] = "log"
+        self.assertEqual(
+            [1, 10, 100, 1000, 10000, 100000, 1000000],
+            get_schedule(1000000, sampling)
+        )
+
+        # Repeated numbers of attempts are only recorded once.
+        self.assertEqual([1, 2, 3, 4], get_schedule(4, sampling))
+
+        # Unknown scale.
+        sampling["scale"] = "cubic"
+
+        with self.assertRaises(ValueError, msg="Invalid scale."):
+            get_schedule(10, sampling)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    unittest.main()